@@ -1,9 +1,16 @@
+import secrets
 from typing import Optional
 from uuid import UUID
-from fastapi import Request
+from fastapi import Depends, Request
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
 from app.core.exceptions import JSONException
 from app.core.token import verify_access_token
+from app.db.session import get_async_session, get_session
+from app.models.user import User
+from app.services.identity import load_user, load_user_async
 
 
 def get_user(request: Request) -> UUID:
@@ -15,3 +22,50 @@ def get_user(request: Request) -> UUID:
     user_id = verify_access_token(token)
 
     return user_id
+
+
+def get_current_user(
+    request: Request,
+    session: Session = Depends(get_session),
+    user_id: UUID = Depends(get_user),
+) -> User:
+    """
+    Resolves the authenticated `User`, at most once per request.
+    """
+    user: Optional[User] = getattr(request.state, "user", None)
+    if user is None:
+        user = load_user(session, user_id)
+        if not user:
+            raise JSONException(message="Not authenticated!", status_code=401)
+        request.state.user = user
+    return user
+
+
+async def get_current_user_async(
+    request: Request,
+    session: AsyncSession = Depends(get_async_session),
+    user_id: UUID = Depends(get_user),
+) -> User:
+    """
+    The `get_current_user` counterpart for async endpoints.
+    """
+    user: Optional[User] = getattr(request.state, "user", None)
+    if user is None:
+        user = await load_user_async(session, user_id)
+        if not user:
+            raise JSONException(message="Not authenticated!", status_code=401)
+        request.state.user = user
+    return user
+
+
+def require_internal_token(request: Request) -> None:
+    """
+    Guards the internal endpoints: they are hidden unless INTERNAL_API_TOKEN is
+    configured, and require it in the `X-Internal-Token` header.
+    """
+    if not settings.INTERNAL_API_TOKEN:
+        raise JSONException(message="Not Found", status_code=404)
+
+    token = request.headers.get("X-Internal-Token", "")
+    if not secrets.compare_digest(token, settings.INTERNAL_API_TOKEN):
+        raise JSONException(message="Not authorized!", status_code=403)
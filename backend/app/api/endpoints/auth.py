@@ -1,29 +1,26 @@
 from uuid import uuid4
 
-from fastapi import BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi import BackgroundTasks, Depends, Request, Response
 from fastapi.responses import JSONResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.dependencies import get_user
+from app.api.dependencies import get_current_user
 from app.core.exceptions import JSONException
 from app.core.security import (
     delete_auth_cookies,
     set_auth_cookies,
     set_reset_password_token_cookie,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
 )
 from app.core.token import (
     generate_access_token,
     generate_refresh_token,
     verify_refresh_token,
 )
-from app.crud.auth import (
-    create_token,
-    create_user,
-    get_user_by_email_or_username,
-    get_user_by_id,
-)
-from app.db.session import get_session
+from app.crud.aio import auth as aio_auth_crud
+from app.db.session import get_async_session
 from app.models.auth import TokenPurpose
 from app.models.user import User
 from app.schemas.auth import (
@@ -43,14 +40,15 @@ from app.services.auth import (
     verify_email_verification_token,
     resend_verification_email,
 )
+from app.services.revocation import get_revocation_store
 
 
-def signup_user(
+async def signup_user(
     user_in: UserCreate,
     background_tasks: BackgroundTasks,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JSONResponse:
-    existing_user = get_user_by_email_or_username(
+    existing_user = await aio_auth_crud.get_user_by_email_or_username(
         session, user_in.email, user_in.username
     )
     if existing_user:
@@ -58,8 +56,11 @@ def signup_user(
             content={"success": False, "message": "Email or Username already taken!"}
         )
 
-    user = create_user(session, user_in)
-    token = create_token(session, user.id, uuid4().hex, TokenPurpose.EMAIL_VERIFICATION)
+    hashed_password = await hash_password_async(user_in.password)
+    user = await aio_auth_crud.create_user(session, user_in, hashed_password)
+    token = await aio_auth_crud.create_token(
+        session, user.id, uuid4().hex, TokenPurpose.EMAIL_VERIFICATION
+    )
     background_tasks.add_task(send_verification_email, user.email, token.code)
 
     return JSONResponse(
@@ -71,17 +72,28 @@ def signup_user(
     )
 
 
-def login_user(
-    user_in: UserCreate, response: Response, session: Session = Depends(get_session)
+async def login_user(
+    user_in: UserCreate,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ) -> JSONResponse:
-    user = get_user_by_email_or_username(session, user_in.email)
+    user = await aio_auth_crud.get_user_by_email_or_username(session, user_in.email)
 
-    if not user or not verify_password(user_in.password, user.hashed_password):
+    is_valid, new_hash = (
+        await verify_and_update_password_async(user_in.password, user.hashed_password)
+        if user
+        else (False, None)
+    )
+    if not user or not is_valid:
         return JSONResponse(
             content={"success": False, "message": "Invalid Credentials"},
             status_code=401,
         )
 
+    # The stored hash predates the current BCRYPT_ROUNDS, upgrade it transparently
+    if new_hash:
+        await aio_auth_crud.update_user_password_hash(session, user, new_hash)
+
     if not user.is_verified():
         return JSONResponse(
             content={
@@ -105,7 +117,7 @@ def login_user(
     return response
 
 
-def refresh_access_token(request: Request):
+async def refresh_access_token(request: Request, session: AsyncSession):
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
         return JSONResponse(
@@ -116,7 +128,8 @@ def refresh_access_token(request: Request):
     verification_result = verify_refresh_token(refresh_token)
 
     user_id = verification_result.get("sub")
-    if not user_id:
+    jti = verification_result.get("jti")
+    if not user_id or not jti:
         return JSONResponse(
             status_code=400,
             content={
@@ -125,7 +138,17 @@ def refresh_access_token(request: Request):
             },
         )
 
+    # Every refresh token is single-use: revoking it is what allows the
+    # rotation, and fails when a concurrent request already rotated it
+    revocation_store = get_revocation_store()
+    revoked = await revocation_store.is_revoked(session, jti)
+    if revoked or not await revocation_store.revoke(
+        session, jti, verification_result["exp"]
+    ):
+        raise JSONException(message="Refresh token has been revoked", status_code=400)
+
     new_access_token = generate_access_token(user_id)
+    new_refresh_token = generate_refresh_token(user_id)
 
     response = JSONResponse(
         status_code=200,
@@ -136,14 +159,12 @@ def refresh_access_token(request: Request):
         },
     )
 
-    set_auth_cookies(response, new_access_token, refresh_token)
+    set_auth_cookies(response, new_access_token, new_refresh_token)
 
     return response
 
 
-def get_profile(session: Session = Depends(get_session), user_id=Depends(get_user)):
-    user: User = get_user_by_id(session=session, user_id=user_id)
-
+def get_profile(user: User = Depends(get_current_user)):
     return JSONResponse(
         content={
             "success": True,
@@ -240,7 +261,16 @@ def resend_verification_email_endpoint(data: ResendVerificationEmail, background
         content={"success": True, "message": "Verification email sent successfully!"}
     )
 
-def logout_endpoint():
+async def logout_endpoint(request: Request, session: AsyncSession):
+    refresh_token = request.cookies.get("refresh_token")
+    if refresh_token:
+        try:
+            payload = verify_refresh_token(refresh_token)
+        except JSONException:
+            payload = {}
+        if payload.get("jti"):
+            await get_revocation_store().revoke(session, payload["jti"], payload["exp"])
+
     response = JSONResponse(content={
         "success": True,
         "message": "Logged out Successfully!"
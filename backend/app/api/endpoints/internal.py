@@ -0,0 +1,132 @@
+"""
+Internal operational endpoints, not meant to be exposed to end users
+"""
+
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.api.rate_limits import get_auth_rate_limits
+from app.core.email import get_mail_worker
+from app.core.instrumentation import get_request_metrics
+from app.core.token import get_access_token_cache
+from app.db.pool import get_pool_stats
+from app.db.session import get_async_engine, get_engine
+from app.db.slow_queries import get_slow_query_log
+from app.services.identity import get_user_cache
+from app.services.reaper import get_reaper
+from app.services.rebalancer import get_rank_rebalancer
+from app.services.revocation import get_revocation_store
+
+
+def pool_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Pool metrics retrieved successfully",
+            "data": {
+                "sync": get_pool_stats(get_engine().pool),
+                "async": get_pool_stats(get_async_engine().pool),
+            },
+        }
+    )
+
+
+def email_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Email delivery metrics retrieved successfully",
+            "data": get_mail_worker().metrics.snapshot(),
+        }
+    )
+
+
+def token_cache_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Access token cache metrics retrieved successfully",
+            "data": get_access_token_cache().snapshot(),
+        }
+    )
+
+
+def user_cache_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "User cache metrics retrieved successfully",
+            "data": get_user_cache().snapshot(),
+        }
+    )
+
+
+def reaper_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Reaper metrics retrieved successfully",
+            "data": get_reaper().metrics.snapshot(),
+        }
+    )
+
+
+def rebalancer_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Rank rebalancer metrics retrieved successfully",
+            "data": get_rank_rebalancer().snapshot(),
+        }
+    )
+
+
+def revocation_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Revocation store metrics retrieved successfully",
+            "data": get_revocation_store().snapshot(),
+        }
+    )
+
+
+def rate_limit_metrics_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Rate limit metrics retrieved successfully",
+            "data": [
+                {
+                    "path": rule.path,
+                    "limiter": type(rule.limiter).__name__,
+                    "key": rule.key.__name__,
+                    "limited": rule.limited,
+                }
+                for rule in get_auth_rate_limits()
+            ],
+        }
+    )
+
+
+def request_metrics_endpoint():
+    return PlainTextResponse(
+        content=get_request_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def slow_queries_endpoint():
+    return JSONResponse(
+        content={
+            "success": True,
+            "message": "Slow queries retrieved successfully",
+            "data": get_slow_query_log().snapshot(),
+        }
+    )
+
+
+def clear_slow_queries_endpoint():
+    get_slow_query_log().clear()
+    return JSONResponse(
+        content={"success": True, "message": "Slow queries cleared successfully", "data": {}}
+    )
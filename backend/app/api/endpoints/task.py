@@ -0,0 +1,206 @@
+from uuid import UUID
+
+from fastapi import Depends, Query, Request, Response
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.dependencies import get_user
+from app.core.helpers import AsyncPaginator
+from app.core.responses import APIResponse, etag_matches
+from app.db.session import get_async_session, get_session
+from app.models.task import Task, TaskStatus
+from app.schemas.task import (
+    TaskBatchRequest,
+    TaskCreateRequest,
+    TaskMoveRequest,
+    TaskResponse,
+    TaskUpdateRequest,
+)
+from app.services.task import (
+    add_task,
+    board_etag,
+    edit_task,
+    ensure_team_access_async,
+    get_board,
+    get_board_changes,
+    get_board_version,
+    get_tasks_query,
+    move_task,
+    remove_task,
+)
+from app.services.task_batch import apply_task_batch
+from app.services.task_stats import get_task_stats
+
+
+def create_task_endpoint(
+    team_id: UUID,
+    payload: TaskCreateRequest,
+    user_id: UUID = Depends(get_user),
+    session: Session = Depends(get_session),
+):
+    task = add_task(session=session, team_id=team_id, user_id=user_id, payload=payload)
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Task created successfully",
+            "data": TaskResponse.model_validate(task),
+        },
+        status_code=201,
+    )
+
+
+async def list_tasks_endpoint(
+    team_id: UUID,
+    user_id: UUID = Depends(get_user),
+    session: AsyncSession = Depends(get_async_session),
+    status: TaskStatus = Query(None),
+    assignee_id: UUID = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=100),
+):
+    await ensure_team_access_async(session=session, team_id=team_id, user_id=user_id)
+    paginator = AsyncPaginator(
+        session=session,
+        query=get_tasks_query(team_id=team_id, status=status, assignee_id=assignee_id),
+        order_by=(Task.created_at, Task.id),
+        page=page,
+        page_size=page_size,
+        schema=TaskResponse,
+    )
+    paginated = await paginator.paginate()
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Tasks retrieved successfully",
+            "data": paginated,
+        }
+    )
+
+
+async def read_board_endpoint(
+    team_id: UUID,
+    request: Request,
+    user_id: UUID = Depends(get_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    version = await get_board_version(session=session, team_id=team_id, user_id=user_id)
+    headers = {"ETag": board_etag(team_id, version), "Cache-Control": "private, no-cache"}
+    # An unchanged board is answered from the team row alone
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    board = await get_board(session=session, team_id=team_id, version=version)
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Board retrieved successfully",
+            "data": board,
+        },
+        headers=headers,
+    )
+
+
+async def board_changes_endpoint(
+    team_id: UUID,
+    since: int = Query(..., ge=0),
+    user_id: UUID = Depends(get_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    changes = await get_board_changes(
+        session=session, team_id=team_id, user_id=user_id, since=since
+    )
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Board changes retrieved successfully",
+            "data": changes,
+        }
+    )
+
+
+async def task_stats_endpoint(
+    team_id: UUID,
+    user_id: UUID = Depends(get_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    stats = await get_task_stats(session=session, team_id=team_id, user_id=user_id)
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Task statistics retrieved successfully",
+            "data": stats,
+        }
+    )
+
+
+def update_task_endpoint(
+    team_id: UUID,
+    task_id: UUID,
+    payload: TaskUpdateRequest,
+    user_id: UUID = Depends(get_user),
+    session: Session = Depends(get_session),
+):
+    task = edit_task(
+        session=session, team_id=team_id, task_id=task_id, user_id=user_id, payload=payload
+    )
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Task updated successfully",
+            "data": TaskResponse.model_validate(task),
+        }
+    )
+
+
+def move_task_endpoint(
+    team_id: UUID,
+    task_id: UUID,
+    payload: TaskMoveRequest,
+    user_id: UUID = Depends(get_user),
+    session: Session = Depends(get_session),
+):
+    task = move_task(
+        session=session, team_id=team_id, task_id=task_id, user_id=user_id, payload=payload
+    )
+    return APIResponse(
+        content={
+            "success": True,
+            "message": "Task moved successfully",
+            "data": TaskResponse.model_validate(task),
+        }
+    )
+
+
+def delete_task_endpoint(
+    team_id: UUID,
+    task_id: UUID,
+    user_id: UUID = Depends(get_user),
+    session: Session = Depends(get_session),
+):
+    remove_task(session=session, team_id=team_id, task_id=task_id, user_id=user_id)
+    return APIResponse(
+        content={"success": True, "message": "Task deleted successfully", "data": {}}
+    )
+
+
+def batch_tasks_endpoint(
+    team_id: UUID,
+    payload: TaskBatchRequest,
+    user_id: UUID = Depends(get_user),
+    session: Session = Depends(get_session),
+):
+    batch = apply_task_batch(
+        session=session, team_id=team_id, user_id=user_id, operations=payload.operations
+    )
+    applied = sum(result.success for result in batch.results)
+    success = applied == len(batch.results)
+    message = "Operations applied successfully"
+    if not applied:
+        message = "Operations couldn't be applied!"
+    elif not success:
+        message = "Some operations couldn't be applied!"
+
+    return APIResponse(
+        content={"success": success, "message": message, "data": batch},
+        status_code=200 if applied else 400,
+    )
@@ -1,14 +1,16 @@
 from uuid import UUID
 
 from fastapi import Depends, Query
-from fastapi.responses import JSONResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_user
-from app.core.helpers import Paginator
-from app.db.session import get_session
+from app.core.helpers import AsyncPaginator
+from app.core.responses import APIResponse
+from app.db.session import get_async_session, get_session
+from app.models.team import Team
 from app.schemas.team import TeamCreateRequest, TeamResponse
-from app.services.team import add_team, get_team, get_teams, drop_team
+from app.services.team import add_team, get_team_async, get_teams_query, drop_team
 
 
 def create_team_endpoint(
@@ -17,31 +19,36 @@ def create_team_endpoint(
     session: Session = Depends(get_session),
 ):
     team = add_team(session=session, owner_id=user_id, payload=payload)
-    return JSONResponse(
+    return APIResponse(
         content={
             "success": True,
             "message": "Team created successfully",
-            "data": TeamResponse.model_validate(team).model_dump(mode="json"),
+            "data": TeamResponse.model_validate(team),
         }
     )
 
 
-def list_teams_endpoint(
+async def list_teams_endpoint(
     user_id: UUID = Depends(get_user),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     team_type: str = Query("created"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     search: str = Query(None),
+    cursor: str = Query(None),
 ):
-    teams = get_teams(
-        session=session, owner_id=user_id, team_type=team_type, search=search
-    )
-    paginator = Paginator(
-        data=teams, page=page, page_size=page_size, schema=TeamResponse
+    query = get_teams_query(owner_id=user_id, team_type=team_type, search=search)
+    paginator = AsyncPaginator(
+        session=session,
+        query=query,
+        order_by=(Team.created_at, Team.id),
+        page=page,
+        page_size=page_size,
+        schema=TeamResponse,
+        cursor=cursor,
     )
-    paginated = paginator.paginate()
-    return JSONResponse(
+    paginated = await paginator.paginate()
+    return APIResponse(
         content={
             "success": True,
             "message": "Teams retrieved successfully",
@@ -50,13 +57,15 @@ def list_teams_endpoint(
     )
 
 
-def get_team_endpoint(team_id: UUID, session: Session = Depends(get_session)):
-    team = get_team(session=session, team_id=team_id)
-    return JSONResponse(
+async def get_team_endpoint(
+    team_id: UUID, session: AsyncSession = Depends(get_async_session)
+):
+    team = await get_team_async(session=session, team_id=team_id)
+    return APIResponse(
         content={
             "success": True,
             "message": "Team fetched successfully",
-            "data": TeamResponse.model_validate(team).model_dump(mode="json"),
+            "data": TeamResponse.model_validate(team),
         }
     )
 
@@ -67,6 +76,6 @@ def delete_team_endpoint(
     session: Session = Depends(get_session),
 ):
     drop_team(session=session, team_id=team_id, owner_id=user_id)
-    return JSONResponse(
+    return APIResponse(
         content={"success": True, "message": "Team deleted successfully", "data": {}}
     )
@@ -1,44 +1,55 @@
 from uuid import UUID
 
-from fastapi import BackgroundTasks, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import BackgroundTasks, Body, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_user
-from app.core.helpers import Paginator
-from app.db.session import get_session
-from app.models.team import TeamMateRole
+from app.core.helpers import AsyncPaginator
+from app.core.responses import APIResponse
+from app.db.session import get_async_session, get_session
+from app.models.team import Invitation, TeamMateRole
 from app.schemas.team_invitation import InvitationCreateRequest, InvitationResponse
+from app.schemas.team_member import TeamMateResponse
 from app.services.team_invitation import (
     get_available_filters,
-    get_invitations,
+    get_invitations_query_async,
     handle_invitations,
     handle_accept_invitation,
-    handle_delete_invitation
+    handle_delete_invitation,
+    stream_csv_invitations,
 )
 
 
-def list_invitations_endpoint(
+async def list_invitations_endpoint(
     team_id: UUID,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     search: str = Query(None),
     role: TeamMateRole = Query(None),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    cursor: str = Query(None),
 ):
-    invitations = get_invitations(
+    query = await get_invitations_query_async(
         session=session,
         team_id=team_id,
         search=search,
         role=role,
     )
 
-    paginator = Paginator(
-        data=invitations, page=page, page_size=per_page, schema=InvitationResponse
+    paginator = AsyncPaginator(
+        session=session,
+        query=query,
+        order_by=(Invitation.invited_at, Invitation.id),
+        page=page,
+        page_size=per_page,
+        schema=InvitationResponse,
+        cursor=cursor,
     )
-    paginated = paginator.paginate()
+    paginated = await paginator.paginate()
 
-    return JSONResponse(
+    return APIResponse(
         content={
             "success": True,
             "message": "Invitations fetched successfully",
@@ -80,6 +91,26 @@ def create_invitations_endpoint(
     )
 
 
+def upload_invitations_csv_endpoint(
+    team_id: UUID,
+    background_tasks: BackgroundTasks,
+    csv_data: bytes = Body(..., media_type="text/csv"),
+    user_id: UUID = Depends(get_user),
+    session: Session = Depends(get_session),
+):
+    results = stream_csv_invitations(
+        session=session,
+        team_id=team_id,
+        invited_by=user_id,
+        csv_data=csv_data,
+        background_tasks=background_tasks,
+    )
+
+    return StreamingResponse(
+        results, media_type="application/x-ndjson", background=background_tasks
+    )
+
+
 def accept_invitation_endpoint(
     invitation_token: str,
     session: Session = Depends(get_session),
@@ -88,11 +119,11 @@ def accept_invitation_endpoint(
     member = handle_accept_invitation(
         session=session, invitation_token=invitation_token, user_id=user_id
     )
-    return JSONResponse(
+    return APIResponse(
         content={
             "success": True,
             "message": "Invitation accepted successfully",
-            "data": member,
+            "data": TeamMateResponse.model_validate(member),
         }
     )
 
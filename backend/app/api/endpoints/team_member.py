@@ -1,36 +1,41 @@
 from uuid import UUID
 
 from fastapi import Depends, Query
-from fastapi.responses import JSONResponse
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.helpers import Paginator
-from app.db.session import get_session
-from app.models.team import TeamMateRole
+from app.core.helpers import AsyncPaginator
+from app.core.responses import APIResponse
+from app.db.session import get_async_session
+from app.models.team import TeamMate, TeamMateRole
 from app.schemas.team_member import TeamMateResponse
-from app.services.team_member import get_available_roles, get_team_members
+from app.services.team_member import get_available_roles, get_team_members_query
 
 
-def list_teammates_endpoint(
+async def list_teammates_endpoint(
     team_id: UUID,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     search: str = Query(None),
     role: TeamMateRole = Query(None),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
+    cursor: str = Query(None),
 ):
-    teammates = get_team_members(
-        session=session, team_id=team_id, search=search, role=role
+    query = get_team_members_query(team_id=team_id, search=search, role=role)
+    paginator = AsyncPaginator(
+        session=session,
+        query=query,
+        order_by=(TeamMate.joined_at, TeamMate.id),
+        page=page,
+        page_size=per_page,
+        schema=TeamMateResponse,
+        cursor=cursor,
     )
-    paginator = Paginator(
-        data=teammates, page=page, page_size=per_page, schema=TeamMateResponse
-    )
-    paginated = paginator.paginate()
+    paginated = await paginator.paginate()
 
     # Inject available filters
     filters = {"roles": get_available_roles()}
 
-    return JSONResponse(
+    return APIResponse(
         content={
             "success": True,
             "message": "Teammates fetched successfully",
@@ -0,0 +1,73 @@
+"""
+Rate limits of the authentication endpoints, configured by the *_RATE_LIMIT settings
+"""
+
+from functools import lru_cache
+from typing import List
+
+from app.core.config import settings
+from app.core.ratelimit import (
+    RateLimitRule,
+    SlidingWindow,
+    TokenBucket,
+    body_email,
+    client_ip,
+    parse_rate,
+)
+
+AUTH_PREFIX = "/api/v1/auth"
+
+
+def _token_bucket(rate: str) -> TokenBucket:
+    return TokenBucket(*parse_rate(rate), max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+def _sliding_window(rate: str) -> SlidingWindow:
+    return SlidingWindow(*parse_rate(rate), max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+def _per_recipient(path: str) -> RateLimitRule:
+    return RateLimitRule(
+        path,
+        _sliding_window(settings.EMAIL_RECIPIENT_RATE_LIMIT),
+        body_email,
+        reads_body=True,
+    )
+
+
+@lru_cache
+def get_auth_rate_limits() -> List[RateLimitRule]:
+    return [
+        # Login tolerates short bursts (typos) but throttles sustained guessing,
+        # both from one client and against one account
+        RateLimitRule(
+            f"{AUTH_PREFIX}/login", _token_bucket(settings.LOGIN_RATE_LIMIT), client_ip
+        ),
+        RateLimitRule(
+            f"{AUTH_PREFIX}/login",
+            _token_bucket(settings.LOGIN_ACCOUNT_RATE_LIMIT),
+            body_email,
+            reads_body=True,
+        ),
+        RateLimitRule(
+            f"{AUTH_PREFIX}/signup", _sliding_window(settings.SIGNUP_RATE_LIMIT), client_ip
+        ),
+        RateLimitRule(
+            f"{AUTH_PREFIX}/confirm-reset-password",
+            _sliding_window(settings.CONFIRM_RESET_RATE_LIMIT),
+            client_ip,
+        ),
+        # The endpoints sending emails are limited per client and per recipient
+        RateLimitRule(
+            f"{AUTH_PREFIX}/request-reset-password",
+            _sliding_window(settings.EMAIL_RATE_LIMIT),
+            client_ip,
+        ),
+        _per_recipient(f"{AUTH_PREFIX}/request-reset-password"),
+        RateLimitRule(
+            f"{AUTH_PREFIX}/resend-verification-email",
+            _sliding_window(settings.EMAIL_RATE_LIMIT),
+            client_ip,
+        ),
+        _per_recipient(f"{AUTH_PREFIX}/resend-verification-email"),
+    ]
@@ -3,6 +3,8 @@ from app.api.routes.auth import router as auth_router
 from app.api.routes.team import router as team_router
 from app.api.routes.team_member import router as team_member_router
 from app.api.routes.team_invitation import router as team_invitation_router
+from app.api.routes.task import router as task_router
+from app.api.routes.internal import router as internal_router
 
 # Import individual routers here (e.g. auth_router, team_router, etc.)
 # from app.api.endpoints import auth, team, tasks, ...
@@ -17,3 +19,5 @@ router.include_router(auth_router)
 router.include_router(team_router)
 router.include_router(team_member_router)
 router.include_router(team_invitation_router)
+router.include_router(task_router)
+router.include_router(internal_router)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, BackgroundTasks, Request, Response, Depends
-from app.api.dependencies import get_user
+from app.api.dependencies import get_current_user
 from app.api.endpoints.auth import (
     confirm_password_reset,
     get_profile,
@@ -21,37 +21,41 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserCreate, UserRead, UserLogin
 from sqlmodel import Session
-from app.db.session import get_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.session import get_async_session, get_session
+from app.models.user import User
 
 router = APIRouter(prefix="/auth", tags=["Authentication & Authorization"])
 
 
 @router.post("/signup", response_model=UserRead)
-def signup_route(
+async def signup_route(
     user_in: UserCreate,
     background_tasks: BackgroundTasks,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
-    return signup_user(user_in, background_tasks, session)
+    return await signup_user(user_in, background_tasks, session)
 
 
 @router.post("/login", response_model=UserRead)
-def login_route(
-    user_in: UserLogin, response: Response, session: Session = Depends(get_session)
+async def login_route(
+    user_in: UserLogin,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
 ):
-    return login_user(user_in, response, session)
+    return await login_user(user_in, response, session)
 
 
 @router.get("/refresh")
-def refresh_access_token_route(request: Request):
-    return refresh_access_token(request)
+async def refresh_access_token_route(
+    request: Request, session: AsyncSession = Depends(get_async_session)
+):
+    return await refresh_access_token(request, session)
 
 
 @router.get("/me")
-def get_profile_route(
-    session: Session = Depends(get_session), user_id: str = Depends(get_user)
-):
-    return get_profile(session=session, user_id=user_id)
+def get_profile_route(user: User = Depends(get_current_user)):
+    return get_profile(user=user)
 
 
 @router.post("/request-reset-password")
@@ -96,5 +100,7 @@ def resend_verification_email_route(
 
 
 @router.get("/logout")
-def logout_route():
-    return logout_endpoint()
+async def logout_route(
+    request: Request, session: AsyncSession = Depends(get_async_session)
+):
+    return await logout_endpoint(request, session)
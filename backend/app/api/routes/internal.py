@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import require_internal_token
+from app.api.endpoints.internal import (
+    clear_slow_queries_endpoint,
+    email_metrics_endpoint,
+    pool_metrics_endpoint,
+    rate_limit_metrics_endpoint,
+    reaper_metrics_endpoint,
+    rebalancer_metrics_endpoint,
+    request_metrics_endpoint,
+    revocation_metrics_endpoint,
+    slow_queries_endpoint,
+    token_cache_metrics_endpoint,
+    user_cache_metrics_endpoint,
+)
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    dependencies=[Depends(require_internal_token)],
+    include_in_schema=False,
+)
+
+router.add_api_route(
+    path="/metrics/pool", endpoint=pool_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/email", endpoint=email_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/token-cache", endpoint=token_cache_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/user-cache", endpoint=user_cache_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/reaper", endpoint=reaper_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/rebalancer", endpoint=rebalancer_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/revocations", endpoint=revocation_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/rate-limits", endpoint=rate_limit_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/metrics/requests", endpoint=request_metrics_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/slow-queries", endpoint=slow_queries_endpoint, methods=["GET"]
+)
+router.add_api_route(
+    path="/slow-queries", endpoint=clear_slow_queries_endpoint, methods=["DELETE"]
+)
@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+
+from app.api.endpoints.task import (
+    batch_tasks_endpoint,
+    board_changes_endpoint,
+    create_task_endpoint,
+    delete_task_endpoint,
+    list_tasks_endpoint,
+    move_task_endpoint,
+    read_board_endpoint,
+    task_stats_endpoint,
+    update_task_endpoint,
+)
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+router.add_api_route(path="/{team_id}", endpoint=create_task_endpoint, methods=["POST"])
+router.add_api_route(path="/{team_id}", endpoint=list_tasks_endpoint, methods=["GET"])
+router.add_api_route(path="/{team_id}/batch", endpoint=batch_tasks_endpoint, methods=["POST"])
+router.add_api_route(path="/{team_id}/board", endpoint=read_board_endpoint, methods=["GET"])
+router.add_api_route(
+    path="/{team_id}/changes", endpoint=board_changes_endpoint, methods=["GET"]
+)
+router.add_api_route(path="/{team_id}/stats", endpoint=task_stats_endpoint, methods=["GET"])
+router.add_api_route(
+    path="/{team_id}/{task_id}", endpoint=update_task_endpoint, methods=["PATCH"]
+)
+router.add_api_route(
+    path="/{team_id}/{task_id}/move", endpoint=move_task_endpoint, methods=["POST"]
+)
+router.add_api_route(
+    path="/{team_id}/{task_id}", endpoint=delete_task_endpoint, methods=["DELETE"]
+)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
 from app.api.endpoints.team_invitation import (
+    accept_invitation_endpoint,
     list_invitations_endpoint,
     create_invitations_endpoint,
+    upload_invitations_csv_endpoint,
     delete_invitation_endpoint,
 )
 
@@ -14,6 +16,12 @@ router.add_api_route(
 router.add_api_route(
     path="/{team_id}", endpoint=create_invitations_endpoint, methods=["POST"]
 )
+router.add_api_route(
+    path="/{team_id}/csv", endpoint=upload_invitations_csv_endpoint, methods=["POST"]
+)
+router.add_api_route(
+    path="/accept/{invitation_token}", endpoint=accept_invitation_endpoint, methods=["POST"]
+)
 router.add_api_route(
     path="/{invitation_id}", endpoint=delete_invitation_endpoint, methods=["DELETE"]
 )
@@ -0,0 +1,54 @@
+"""
+A compact, thread-safe Bloom filter for in-memory membership pre-checks
+"""
+
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    """
+    A Bloom filter sized for `capacity` items at the given false positive rate.
+
+    `might_contain` never returns False for an added item, so a negative
+    answer is authoritative and a positive one must be confirmed elsewhere.
+
+    Attributes:
+        capacity (int): The number of items the filter is sized for.
+        error_rate (float): The false positive rate at full capacity.
+        count (int): The number of items added so far.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str):
+        # Double hashing: the k positions are derived from two 64-bit halves
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        positions = self._positions(item)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    @property
+    def is_saturated(self) -> bool:
+        return self.count >= self.capacity
@@ -0,0 +1,84 @@
+"""
+Small in-process caches shared by the request paths
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded LRU cache whose entries expire.
+
+    Every entry carries its own expiry timestamp, given explicitly to `set`
+    or derived from the cache-wide `ttl`; expired entries are never served.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept; the least recently
+            used one is evicted first. 0 disables the cache.
+        ttl (float | None): Default lifetime of an entry, in seconds.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that found no live entry.
+        evictions (int): Entries dropped to honor `maxsize`.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, key: Any) -> Hashable:
+        return key
+
+    def get(self, key: Any) -> Any:
+        key = self._key(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Any, value: Any, expires_at: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        if expires_at is None:
+            expires_at = time.time() + self.ttl if self.ttl is not None else float("inf")
+
+        key = self._key(key)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(self._key(key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -1,21 +1,90 @@
-﻿from pydantic_settings import BaseSettings
+﻿from functools import lru_cache
+from typing import cast
+
+from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
     ACCESS_TOKEN_EXPIRATION_TIME: int
     REFRESH_TOKEN_EXPIRATION_TIME: int
     JWT_SECRET_KEY: str
     JWT_REFRESH_SECRET_KEY: str
     JWT_ALGORITHM: str
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_SYNC_SECONDS: float = 5
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASHER_WORKERS: int = 2
+    PASSWORD_HASHER_MAX_QUEUE: int = 32
     SMTP_HOST: str
     SMTP_PORT: int
     SMTP_USER: str
     SMTP_PASS: str
+    SMTP_TIMEOUT: float = 30
+    SMTP_POOL_SIZE: int = 4
+    SMTP_BATCH_SIZE: int = 50
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 500
+    EMAIL_QUEUE_MAX_SIZE: int = 10000
+    EMAIL_TEMPLATE_CACHE_DIR: str | None = None
     FRONTEND_DOMAIN: str
     RESET_PASSWORD_TOKEN_EXPIRY_MINUTES: int
     EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS: int
+    REAPER_INTERVAL_SECONDS: float = 300
+    REAPER_BATCH_SIZE: int = 500
+    REAPER_BATCH_PAUSE_SECONDS: float = 0.05
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+    LOGIN_RATE_LIMIT: str = "20/minute"
+    LOGIN_ACCOUNT_RATE_LIMIT: str = "10/minute"
+    SIGNUP_RATE_LIMIT: str = "10/hour"
+    CONFIRM_RESET_RATE_LIMIT: str = "10/hour"
+    EMAIL_RATE_LIMIT: str = "20/hour"
+    EMAIL_RECIPIENT_RATE_LIMIT: str = "3/hour"
+    INTERNAL_API_TOKEN: str | None = None
+    REQUEST_METRICS_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = False
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_SAMPLES: int = 3
+    SLOW_QUERY_MAX_FINGERPRINTS: int = 500
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    TASK_RANK_MAX_LENGTH: int = 32
+    TASK_BATCH_MAX_OPERATIONS: int = 500
+    TASK_CHANGE_RETENTION_DAYS: int = 30
+    TASK_REBALANCE_INTERVAL_SECONDS: float = 30
 
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Returns the process-wide settings, read and validated on first use.
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """
+    Proxies `Settings` without building it, so that importing a module does not
+    require the environment to be configured.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(get_settings(), name, value)
+
+
+settings = cast(Settings, _LazySettings())
\ No newline at end of file
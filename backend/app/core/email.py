@@ -1,47 +1,149 @@
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from jinja2 import Environment, FileSystemLoader
+import base64
 import os
+import re
+import tempfile
+from email.header import Header
+from functools import lru_cache
+from typing import Any, Sequence
 
-from app.core.config import settings
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
-# Configuration
-SMTP_HOST = settings.SMTP_HOST
-SMTP_PORT = settings.SMTP_PORT
-SENDER_EMAIL = settings.SMTP_USER
+from app.core.config import settings
+from app.core.mailer import EmailDeliveryWorker
 
 # Template setup
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 TEMPLATES_DIR = os.path.join(BASE_DIR, "templates", "email")
-env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+
+
+@lru_cache
+def get_template_env() -> Environment:
+    """
+    Returns the template environment, created on first use.
+
+    Templates are compiled once (and their bytecode cached on disk), never re-checked.
+    """
+    cache_dir = settings.EMAIL_TEMPLATE_CACHE_DIR or os.path.join(
+        tempfile.gettempdir(), "teamtact-jinja-cache"
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        auto_reload=False,
+    )
+
+
+@lru_cache
+def get_mail_worker() -> EmailDeliveryWorker:
+    """
+    Returns the shared delivery worker keeping a bounded pool of persistent SMTP connections.
+    """
+    return EmailDeliveryWorker(
+        host=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        sender=settings.SMTP_USER,
+        pool_size=settings.SMTP_POOL_SIZE,
+        batch_size=settings.SMTP_BATCH_SIZE,
+        max_messages_per_connection=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        queue_size=settings.EMAIL_QUEUE_MAX_SIZE,
+        timeout=settings.SMTP_TIMEOUT,
+    )
+
+
+def stop_mail_worker() -> None:
+    """
+    Flushes the queued emails and closes the pooled SMTP connections, if any.
+    """
+    if get_mail_worker.cache_info().currsize:
+        get_mail_worker().stop()
+
+
+# Boundary of the multipart container, never part of a base64 encoded body
+MIME_BOUNDARY = "===============teamtact-mime-boundary=="
+
+
+def load_templates() -> None:
+    """
+    Compiles every email template, so that no request pays for it.
+    """
+    env = get_template_env()
+    for template_name in env.list_templates():
+        env.get_template(template_name)
 
 
 def render_template(template_name: str, **context) -> str:
-    template = env.get_template(template_name)
+    template = get_template_env().get_template(template_name)
     return template.render(**context)
 
 
+class PartialTemplate:
+    """
+    A template rendered once with the context shared by a batch of recipients,
+    leaving placeholders for the per-recipient fields.
+
+    Example:
+        invite = PartialTemplate("invite.html", ["invite_link"], team_name="Core")
+        html_body = invite.render(invite_link="https://...")
+    """
+
+    def __init__(
+        self, template_name: str, recipient_fields: Sequence[str], **shared_context
+    ):
+        placeholders = {field: f"@@{field}@@" for field in recipient_fields}
+        rendered = render_template(template_name, **shared_context, **placeholders)
+
+        # Odd indexes hold the per-recipient field names, even ones the literal HTML
+        self._segments = (
+            re.split(f"@@({'|'.join(map(re.escape, recipient_fields))})@@", rendered)
+            if recipient_fields
+            else [rendered]
+        )
+
+    def render(self, **fields: Any) -> str:
+        return "".join(
+            str(fields[segment]) if index % 2 else segment
+            for index, segment in enumerate(self._segments)
+        )
+
+
+@lru_cache
+def get_partial_template(template_name: str, *recipient_fields: str) -> PartialTemplate:
+    """
+    Returns the process-wide partial template of a template without shared context.
+    """
+    return PartialTemplate(template_name, recipient_fields)
+
+
+@lru_cache
+def _message_headers(subject: str) -> str:
+    if not subject.isascii():
+        subject = Header(subject, "utf-8").encode()
+    return (
+        f'Content-Type: multipart/alternative; boundary="{MIME_BOUNDARY}"\n'
+        "MIME-Version: 1.0\n"
+        f"From: {settings.SMTP_USER}\n"
+        f"Subject: {subject}\n"
+    )
+
+
+def compose_message(subject: str, to_email: str, html_body: str) -> str:
+    """
+    Serializes the same message as a `MIMEMultipart("alternative")` holding one
+    HTML part, from cached headers instead of building the MIME tree per send.
+    """
+    body = base64.encodebytes(html_body.encode("utf-8")).decode("ascii")
+    return (
+        f"{_message_headers(subject)}"
+        f"To: {to_email}\n\n"
+        f"--{MIME_BOUNDARY}\n"
+        'Content-Type: text/html; charset="utf-8"\n'
+        "MIME-Version: 1.0\n"
+        "Content-Transfer-Encoding: base64\n\n"
+        f"{body}"
+        f"--{MIME_BOUNDARY}--\n"
+    )
+
+
 def send_email(subject: str, to_email: str, html_body: str):
-    message = MIMEMultipart("alternative")
-    message["From"] = SENDER_EMAIL
-    message["To"] = to_email
-    message["Subject"] = subject
-    message.attach(MIMEText(html_body, "html"))
-
-    try:
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.sendmail(SENDER_EMAIL, to_email, message.as_string())
-
-    except smtplib.SMTPRecipientsRefused:
-        print(f"Recipient refused: {to_email}")
-    except smtplib.SMTPSenderRefused:
-        print(f"Sender refused: {SENDER_EMAIL}")
-    except smtplib.SMTPDataError as e:
-        print(f"SMTP data error: {e}")
-    except smtplib.SMTPConnectError as e:
-        print(f"SMTP connection error: {e}")
-    except smtplib.SMTPServerDisconnected as e:
-        print(f"SMTP server disconnected: {e}")
-    except smtplib.SMTPException as e:
-        print(f"General SMTP error: {e}")
+    get_mail_worker().submit(to_email, compose_message(subject, to_email, html_body))
@@ -0,0 +1,36 @@
+"""
+Password hashing primitives executed inside the password hasher processes.
+
+This module is imported by the worker processes, so it must stay free of any
+application import (settings, database, ...).
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+
+@lru_cache
+def get_crypt_context(rounds: int) -> CryptContext:
+    """
+    Returns a bcrypt context that hashes with, and only accepts, the given cost:
+    hashes of any other cost are reported as needing an update.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def hash_password(password: str, rounds: int) -> str:
+    return get_crypt_context(rounds).hash(password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str, rounds: int
+) -> Tuple[bool, Optional[str]]:
+    return get_crypt_context(rounds).verify_and_update(plain_password, hashed_password)
@@ -1,6 +1,17 @@
-from typing import Any, Generic, Sequence, Type, TypeVar
+import base64
+import json
+from datetime import datetime
+from typing import Any, Generic, Optional, Sequence, Tuple, Type, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel
+from sqlalchemy import func, tuple_
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+from app.core.exceptions import JSONException
+from app.core.responses import validate_items
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -15,39 +26,160 @@ class PaginatedResponse(BaseModel):
     total_pages: int
     page_size: int
     items: Sequence
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encodes the keyset position of a row into an opaque, URL-safe cursor.
+    """
+    raw = json.dumps([created_at.isoformat(), str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decodes a cursor produced by `encode_cursor` back into its keyset position.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError) as exc:
+        raise JSONException(message="Invalid pagination cursor", status_code=400) from exc
 
 
 class Paginator(Generic[T]):
     """
-    A reusable paginator for list-based pagination using Pydantic-compatible models.
+    A reusable paginator that pushes pagination down into the database.
+
+    The query is never materialized as a whole: the page is fetched with
+    LIMIT/OFFSET (or a keyset condition on `(created_at, id)` when a cursor is
+    given) and the total is computed by a separate COUNT query.
+
+    A query may carry its own ORDER BY (e.g. a search rank), in which case the
+    `(created_at, id)` columns only break ties and cursors are not supported.
+
+    Args:
+        session (Session | AsyncSession): The database session to run the queries with.
+        query (Select): The unpaginated, unordered select statement.
+        order_by (Tuple): The `(created_at, id)` columns that define the stable
+            ordering of the rows and the keyset used by cursors.
+        page (int): The 1-based page number used in offset mode.
+        page_size (int): The number of rows per page.
+        schema (Type[BaseModel] | None): Optional schema to validate the rows with.
+        cursor (str | None): Opaque cursor returned as `next_cursor` by a previous page.
     """
 
-    def __init__(self, data: Sequence[Any], page: int = 1, page_size: int = 10, schema: Type[T] | None = None):
-        self.data = data
+    def __init__(
+        self,
+        session: Session | AsyncSession,
+        query: Select | SelectOfScalar,
+        order_by: Tuple[Any, Any],
+        page: int = 1,
+        page_size: int = 10,
+        schema: Type[T] | None = None,
+        cursor: str | None = None,
+    ):
+        self.session = session
+        self.query = query
+        self.order_by = order_by
         self.page = max(1, page)
         self.page_size = max(1, page_size)
-        self.total_rows = len(data)
         self.schema = schema
-        self.total_pages = (self.total_rows + self.page_size - 1) // self.page_size
+        self.cursor = cursor
 
-    def paginate(self):
-        """
-        Returns the paginated data.
-        """
-        start = (self.page - 1) * self.page_size
-        end = start + self.page_size
-        raw_items = self.data[start:end]
+    def _count_statement(self):
+        return select(func.count()).select_from(self.query.order_by(None).subquery())
+
+    def _page_statement(self):
+        statement = self.query.order_by(*self.order_by)
+
+        if self.cursor:
+            if self.query._order_by_clauses:
+                raise JSONException(
+                    message="Cursor pagination is not supported for ranked results",
+                    status_code=400,
+                )
+            created_at, row_id = decode_cursor(self.cursor)
+            statement = statement.where(tuple_(*self.order_by) > (created_at, row_id))
+        else:
+            statement = statement.offset((self.page - 1) * self.page_size)
+
+        # One extra row tells whether a next page exists
+        return statement.limit(self.page_size + 1)
+
+    def _build_response(self, rows: Sequence[Any], total_rows: int):
+        raw_items = rows[: self.page_size]
+        total_pages = (total_rows + self.page_size - 1) // self.page_size
+
+        next_cursor = None
+        if len(rows) > self.page_size and not self.query._order_by_clauses:
+            last = raw_items[-1]
+            created_at, row_id = (
+                getattr(last, column.key) for column in self.order_by
+            )
+            next_cursor = encode_cursor(created_at, row_id)
 
         if self.schema:
-            items = [self.schema.model_validate(raw_item) for raw_item in raw_items]
+            items = validate_items(self.schema, raw_items)
 
         else:
             items = raw_items
 
+        # Left as a model: `APIResponse` serializes it straight to JSON bytes
         return PaginatedResponse(
-            total_rows=self.total_rows,
+            total_rows=total_rows,
             current_page=self.page,
-            total_pages=self.total_pages,
+            total_pages=total_pages,
             page_size=self.page_size,
             items=items,
-        ).model_dump(mode="json")
+            next_cursor=next_cursor,
+        )
+
+    def count(self) -> int:
+        """
+        Returns the total number of rows matched by the query.
+        """
+        return self.session.exec(self._count_statement()).one()
+
+    def fetch(self) -> Sequence[Any]:
+        """
+        Returns at most `page_size + 1` rows of the current page.
+        """
+        return self.session.exec(self._page_statement()).all()
+
+    def paginate(self) -> PaginatedResponse:
+        """
+        Returns the paginated data.
+        """
+        rows = self.fetch()
+        return self._build_response(rows, self.count())
+
+
+class AsyncPaginator(Paginator[T]):
+    """
+    The `Paginator` counterpart for an `AsyncSession`, running both the page
+    and the COUNT query on the event loop.
+    """
+
+    session: AsyncSession
+
+    async def count(self) -> int:  # type: ignore[override]
+        """
+        Returns the total number of rows matched by the query.
+        """
+        return (await self.session.exec(self._count_statement())).one()
+
+    async def fetch(self) -> Sequence[Any]:  # type: ignore[override]
+        """
+        Returns at most `page_size + 1` rows of the current page.
+        """
+        return (await self.session.exec(self._page_statement())).all()
+
+    async def paginate(self) -> PaginatedResponse:  # type: ignore[override]
+        """
+        Returns the paginated data.
+        """
+        rows = await self.fetch()
+        return self._build_response(rows, await self.count())
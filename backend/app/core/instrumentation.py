@@ -0,0 +1,221 @@
+"""
+Per-route request instrumentation.
+
+`RequestMetricsMiddleware` times every HTTP request and, through the
+`before/after_cursor_execute` hooks of every SQLAlchemy engine, the queries it
+runs. The numbers of the request in flight are held in a context variable so
+that queries run from the thread pool or the async engine are attributed to it,
+and are aggregated per `(method, route template)` for the Prometheus export.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import Histogram, format_labels, histogram_samples
+
+# Query time buckets in seconds, finer than the request ones
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Requests that matched no route share one label so paths cannot grow the registry
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestStats:
+    """
+    The database work done by the request in flight.
+
+    Attributes:
+        db_time (float): Seconds spent executing queries.
+        queries (int): The number of queries executed.
+    """
+
+    db_time: float = 0.0
+    queries: int = 0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """
+    Returns the stats of the request in flight, if any.
+    """
+    return _current_request.get()
+
+
+# The start time is kept on the execution context rather than on the pooled
+# connection: `after_cursor_execute` does not fire for a failed statement
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current_request.get() is not None:
+        context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_request.get()
+    started = getattr(context, "_query_started_at", None)
+    if stats is None or started is None:
+        return
+    stats.db_time += time.perf_counter() - started
+    stats.queries += 1
+
+
+class RouteMetrics:
+    """
+    The aggregated metrics of one `(method, route)`.
+
+    Attributes:
+        latency (Histogram): Request durations, in seconds.
+        db_time (Histogram): Time spent in queries per request, in seconds.
+        queries (int): Queries executed overall.
+        responses (dict): Responses sent, per status code.
+    """
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.db_time = Histogram(DB_BUCKETS)
+        self.queries = 0
+        self.responses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, status: int, duration: float, stats: RequestStats) -> None:
+        self.latency.observe(duration)
+        self.db_time.observe(stats.db_time)
+        with self._lock:
+            self.queries += stats.queries
+            self.responses[status] = self.responses.get(status, 0) + 1
+
+    def totals(self) -> Tuple[Dict[int, int], int]:
+        """
+        Returns the responses per status code and the queries executed.
+        """
+        with self._lock:
+            return dict(self.responses), self.queries
+
+
+class RequestMetrics:
+    """
+    The registry of `RouteMetrics`, keyed by `(method, route template)`.
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def route(self, method: str, path: str) -> RouteMetrics:
+        key = (method, path)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self.routes.setdefault(key, RouteMetrics())
+        return metrics
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every route in the Prometheus text exposition format.
+        """
+        with self._lock:
+            routes = sorted(self.routes.items())
+
+        requests: List[str] = []
+        latency: List[str] = []
+        db_time: List[str] = []
+        queries: List[str] = []
+        for (method, path), metrics in routes:
+            labels = {"method": method, "route": path}
+            responses, query_count = metrics.totals()
+            requests.extend(
+                f"http_requests_total{format_labels({**labels, 'status': str(status)})} {count}"
+                for status, count in sorted(responses.items())
+            )
+            latency.extend(histogram_samples("http_request_duration_seconds", labels, metrics.latency))
+            db_time.extend(histogram_samples("http_request_db_seconds", labels, metrics.db_time))
+            queries.append(f"http_request_db_queries_total{format_labels(labels)} {query_count}")
+
+        lines = [
+            "# HELP http_requests_total Requests served, per route and status.",
+            "# TYPE http_requests_total counter",
+            *requests,
+            "# HELP http_request_duration_seconds Request latency, per route.",
+            "# TYPE http_request_duration_seconds histogram",
+            *latency,
+            "# HELP http_request_db_seconds Time spent in queries per request, per route.",
+            "# TYPE http_request_db_seconds histogram",
+            *db_time,
+            "# HELP http_request_db_queries_total Queries executed, per route.",
+            "# TYPE http_request_db_queries_total counter",
+            *queries,
+        ]
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache
+def get_request_metrics() -> RequestMetrics:
+    return RequestMetrics()
+
+
+def _route_path(scope: Scope) -> str:
+    # Set by the router on the matched route; the template keeps the label
+    # cardinality bounded whatever the path parameters are
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    Records the latency, query time and query count of every HTTP request, and
+    adds them as a `Server-Timing` header when `SERVER_TIMING_ENABLED` is set.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.REQUEST_METRICS_ENABLED:
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        started = time.perf_counter()
+        status = 500
+        server_timing = settings.SERVER_TIMING_ENABLED
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if server_timing:
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"server-timing", self._server_timing(stats, started)),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_request.reset(token)
+            get_request_metrics().route(scope["method"], _route_path(scope)).record(
+                status, time.perf_counter() - started, stats
+            )
+
+    @staticmethod
+    def _server_timing(stats: RequestStats, started: float) -> bytes:
+        total = (time.perf_counter() - started) * 1000
+        return (
+            f'app;dur={total:.1f}, db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"'
+        ).encode()
@@ -0,0 +1,267 @@
+"""
+Pooled, batching SMTP delivery.
+
+Messages submitted to the `EmailDeliveryWorker` are queued and sent by a
+fixed set of worker threads, each of which drains up to `SMTP_BATCH_SIZE`
+messages at a time and delivers them over one persistent connection taken
+from a bounded `SMTPConnectionPool`.
+"""
+
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from app.core.metrics import Histogram
+
+
+class DeliveryMetrics:
+    """
+    Counters describing the delivery worker's throughput and latency.
+
+    Attributes:
+        queued (int): Messages accepted by `submit`.
+        sent (int): Messages accepted by the SMTP server.
+        failed (int): Messages that could not be delivered.
+        connections_opened (int): SMTP sessions opened (TCP handshake + EHLO).
+        reconnects (int): Sessions re-opened after `SMTPServerDisconnected`.
+        send_latency (Histogram): Time spent sending each message, in seconds.
+    """
+
+    def __init__(self):
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.connections_opened = 0
+        self.reconnects = 0
+        self.send_latency = Histogram()
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def snapshot(self) -> Dict[str, object]:
+        uptime = time.monotonic() - self.started_at
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "connections_opened": self.connections_opened,
+            "reconnects": self.reconnects,
+            "throughput_per_second": self.sent / uptime if uptime else 0.0,
+            "send_latency": self.send_latency.snapshot(),
+        }
+
+
+class PooledSMTPConnection:
+    """
+    A persistent SMTP session that transparently reconnects once when the
+    server has dropped it.
+    """
+
+    def __init__(self, pool: "SMTPConnectionPool"):
+        self.pool = pool
+        self.messages_sent = 0
+        self.smtp = self._connect()
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.pool.host, self.pool.port, timeout=self.pool.timeout)
+        self.pool.metrics.increment("connections_opened")
+        return smtp
+
+    def send(self, sender: str, to_email: str, message: str) -> None:
+        try:
+            self.smtp.sendmail(sender, to_email, message)
+        except smtplib.SMTPServerDisconnected:
+            self.pool.metrics.increment("reconnects")
+            self.smtp = self._connect()
+            self.messages_sent = 0
+            self.smtp.sendmail(sender, to_email, message)
+        self.messages_sent += 1
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self.messages_sent >= self.pool.max_messages_per_connection
+
+    def close(self) -> None:
+        try:
+            self.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self.smtp.close()
+
+
+class SMTPConnectionPool:
+    """
+    A bounded pool of persistent SMTP connections.
+
+    At most `size` connections exist at once; a connection is closed and
+    replaced once it has sent `max_messages_per_connection` messages.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        size: int,
+        timeout: float,
+        max_messages_per_connection: int,
+        metrics: DeliveryMetrics,
+    ):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.metrics = metrics
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: "queue.LifoQueue[PooledSMTPConnection]" = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledSMTPConnection]:
+        with self._slots:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = PooledSMTPConnection(self)
+
+            try:
+                yield connection
+            except (smtplib.SMTPException, OSError):
+                # The session is in an unknown state, never hand it out again
+                connection.close()
+                raise
+
+            if connection.is_exhausted:
+                connection.close()
+            else:
+                self._idle.put(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class EmailDeliveryWorker:
+    """
+    Delivers queued messages from a fixed set of background threads.
+
+    The threads are started on the first `submit`, and `stop` flushes the
+    queue before closing the pooled connections.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        pool_size: int,
+        batch_size: int,
+        max_messages_per_connection: int,
+        queue_size: int,
+        timeout: float,
+    ):
+        self.sender = sender
+        self.batch_size = batch_size
+        self.metrics = DeliveryMetrics()
+        self.pool = SMTPConnectionPool(
+            host=host,
+            port=port,
+            size=pool_size,
+            timeout=timeout,
+            max_messages_per_connection=max_messages_per_connection,
+            metrics=self.metrics,
+        )
+        self._queue: "queue.Queue[Tuple[str, str] | None]" = queue.Queue(queue_size)
+        self._threads: List[threading.Thread] = []
+        self._pool_size = pool_size
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self._pool_size):
+                thread = threading.Thread(
+                    target=self._run, name=f"email-delivery-{index}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self) -> None:
+        with self._lock:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+            self._threads.clear()
+        self.pool.close()
+
+    def submit(self, to_email: str, message: str) -> None:
+        """
+        Queues a serialized message for delivery, blocking while the queue is full.
+        """
+        self.start()
+        self._queue.put((to_email, message))
+        self.metrics.increment("queued")
+
+    def _next_batch(self) -> Tuple[List[Tuple[str, str]], bool]:
+        first = self._queue.get()
+        if first is None:
+            return [], True
+
+        batch, stopping = [first], False
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        return batch, stopping
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._deliver(batch)
+
+    def _deliver(self, batch: List[Tuple[str, str]]) -> None:
+        handled = 0
+        try:
+            with self.pool.connection() as connection:
+                for to_email, message in batch:
+                    started = time.perf_counter()
+                    try:
+                        connection.send(self.sender, to_email, message)
+                        self.metrics.increment("sent")
+                    except smtplib.SMTPRecipientsRefused:
+                        print(f"Recipient refused: {to_email}")
+                        self.metrics.increment("failed")
+                    except smtplib.SMTPSenderRefused:
+                        print(f"Sender refused: {self.sender}")
+                        self.metrics.increment("failed")
+                    except smtplib.SMTPDataError as e:
+                        print(f"SMTP data error: {e}")
+                        self.metrics.increment("failed")
+                    finally:
+                        self.metrics.send_latency.observe(time.perf_counter() - started)
+                    handled += 1
+
+        except smtplib.SMTPConnectError as e:
+            print(f"SMTP connection error: {e}")
+        except smtplib.SMTPServerDisconnected as e:
+            print(f"SMTP server disconnected: {e}")
+        except (smtplib.SMTPException, OSError) as e:
+            print(f"General SMTP error: {e}")
+
+        # Whatever was left in the batch when the session failed is lost
+        self.metrics.increment("failed", len(batch) - handled)
@@ -0,0 +1,94 @@
+"""
+Lightweight in-process metric primitives shared by the instrumentation surfaces
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Sequence
+
+# Latency buckets in seconds, roughly following the Prometheus client defaults
+DEFAULT_BUCKETS: Sequence[float] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """
+    A thread-safe cumulative histogram with fixed bucket boundaries.
+
+    Attributes:
+        buckets (Sequence[float]): The sorted upper bounds of the buckets.
+        count (int): The number of observed values.
+        sum (float): The sum of the observed values.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Returns the cumulative bucket counts, keyed by their upper bound.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total, value_sum = self.count, self.sum
+
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            running += bucket_count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = total
+
+        return {"buckets": cumulative, "count": total, "sum": value_sum}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """
+    Formats labels as a Prometheus label set, e.g. `{method="GET"}`.
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def histogram_samples(name: str, labels: Dict[str, str], histogram: Histogram) -> List[str]:
+    """
+    Returns the `_bucket`, `_sum` and `_count` samples of a histogram in the
+    Prometheus text exposition format.
+    """
+    snapshot = histogram.snapshot()
+    samples = [
+        f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}"
+        for bound, count in snapshot["buckets"].items()  # type: ignore[union-attr]
+    ]
+    samples.append(f"{name}_sum{format_labels(labels)} {snapshot['sum']}")
+    samples.append(f"{name}_count{format_labels(labels)} {snapshot['count']}")
+    return samples
@@ -0,0 +1,161 @@
+"""
+Fractional ranks: strings ordering items of a list, where a rank can always be
+generated between any two others, so moving an item rewrites only its own rank.
+
+A rank is an integer part followed by an optional fraction. The head character
+of the integer part encodes its length, which keeps ranks short when items are
+repeatedly added at either end; the fraction only grows when items are
+repeatedly inserted between the same two neighbours.
+
+Ranks only use digits and lowercase letters, which every database collation
+orders like their code points, so `ORDER BY rank` and Python's `sorted` agree.
+"""
+
+from typing import List, Optional
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+_INDEX = {digit: index for index, digit in enumerate(DIGITS)}
+
+# Heads below the middle are negative integers, the lower the longer; heads
+# from the middle up are positive integers, the higher the longer
+_MIDDLE = BASE // 2
+FIRST_RANK = DIGITS[_MIDDLE] + DIGITS[0]
+SMALLEST_INTEGER = DIGITS[0] * (_MIDDLE + 1)
+
+
+def _integer_length(head: str) -> int:
+    index = _INDEX[head]
+    return index - _MIDDLE + 2 if index >= _MIDDLE else _MIDDLE - index + 1
+
+
+def _integer_part(rank: str) -> str:
+    length = _integer_length(rank[0])
+    if length > len(rank):
+        raise ValueError(f"Invalid rank: {rank!r}")
+    return rank[:length]
+
+
+def validate_rank(rank: str) -> None:
+    if not rank or any(digit not in _INDEX for digit in rank):
+        raise ValueError(f"Invalid rank: {rank!r}")
+    integer = _integer_part(rank)
+    if integer == SMALLEST_INTEGER or rank[len(integer) :].endswith(DIGITS[0]):
+        raise ValueError(f"Invalid rank: {rank!r}")
+
+
+def _midpoint(lower: str, upper: Optional[str]) -> str:
+    """
+    Returns a fraction strictly between `lower` and `upper` (None meaning 1),
+    neither of which may end with the zero digit.
+    """
+    if upper is not None:
+        # Keep the common prefix, padding `lower` with zeros
+        prefix = 0
+        while (lower[prefix] if prefix < len(lower) else DIGITS[0]) == upper[prefix]:
+            prefix += 1
+        if prefix:
+            return upper[:prefix] + _midpoint(lower[prefix:], upper[prefix:])
+
+    lower_digit = _INDEX[lower[0]] if lower else 0
+    upper_digit = _INDEX[upper[0]] if upper is not None else BASE
+    if upper_digit - lower_digit > 1:
+        return DIGITS[(lower_digit + upper_digit + 1) // 2]
+    # Consecutive first digits
+    if upper is not None and len(upper) > 1:
+        return upper[0]
+    return DIGITS[lower_digit] + _midpoint(lower[1:], None)
+
+
+def _increment_integer(integer: str) -> Optional[str]:
+    head, digits = integer[0], list(integer[1:])
+    for position in reversed(range(len(digits))):
+        if digits[position] != DIGITS[-1]:
+            digits[position] = DIGITS[_INDEX[digits[position]] + 1]
+            return head + "".join(digits)
+        digits[position] = DIGITS[0]
+
+    # Every digit carried over: move to the next head
+    if head == DIGITS[-1]:
+        return None
+    next_head = DIGITS[_INDEX[head] + 1]
+    if _INDEX[next_head] > _MIDDLE:
+        digits.append(DIGITS[0])
+    elif _INDEX[next_head] < _MIDDLE:
+        digits.pop()
+    return next_head + "".join(digits)
+
+
+def _decrement_integer(integer: str) -> Optional[str]:
+    head, digits = integer[0], list(integer[1:])
+    for position in reversed(range(len(digits))):
+        if digits[position] != DIGITS[0]:
+            digits[position] = DIGITS[_INDEX[digits[position]] - 1]
+            return head + "".join(digits)
+        digits[position] = DIGITS[-1]
+
+    # Every digit borrowed: move to the previous head
+    if head == DIGITS[0]:
+        return None
+    previous_head = DIGITS[_INDEX[head] - 1]
+    if _INDEX[previous_head] < _MIDDLE - 1:
+        digits.append(DIGITS[-1])
+    elif _INDEX[previous_head] >= _MIDDLE:
+        digits.pop()
+    return previous_head + "".join(digits)
+
+
+def rank_between(lower: Optional[str], upper: Optional[str]) -> str:
+    """
+    Returns a rank sorting strictly after `lower` and before `upper`, where a
+    missing bound stands for the start or the end of the list.
+
+    Raises:
+        ValueError: If a bound is not a valid rank or `lower >= upper`.
+    """
+    if lower is not None:
+        validate_rank(lower)
+    if upper is not None:
+        validate_rank(upper)
+    if lower is not None and upper is not None and lower >= upper:
+        raise ValueError(f"{lower!r} does not sort before {upper!r}")
+
+    if lower is None and upper is None:
+        return FIRST_RANK
+
+    if lower is None:
+        integer = _integer_part(upper)  # type: ignore[arg-type]
+        if integer == SMALLEST_INTEGER:
+            return integer + _midpoint("", upper[len(integer) :])  # type: ignore[index]
+        if integer < upper:  # type: ignore[operator]
+            return integer
+        decremented = _decrement_integer(integer)
+        if decremented is None:
+            raise ValueError("Cannot rank before the smallest rank")
+        return decremented
+
+    integer = _integer_part(lower)
+    fraction = lower[len(integer) :]
+    if upper is None:
+        incremented = _increment_integer(integer)
+        return incremented if incremented is not None else integer + _midpoint(fraction, None)
+
+    upper_integer = _integer_part(upper)
+    if integer == upper_integer:
+        return integer + _midpoint(fraction, upper[len(integer) :])
+    incremented = _increment_integer(integer)
+    if incremented is not None and incremented < upper:
+        return incremented
+    return integer + _midpoint(fraction, None)
+
+
+def spread_ranks(count: int) -> List[str]:
+    """
+    Returns `count` short, increasing ranks, used to rebalance a whole list.
+    """
+    ranks: List[str] = []
+    rank: Optional[str] = None
+    for _ in range(count):
+        rank = rank_between(rank, None)
+        ranks.append(rank)
+    return ranks
@@ -0,0 +1,283 @@
+"""
+In-process rate limiting.
+
+Each `RateLimitRule` applies one limiter to the requests of a route, keyed by a
+property of the request (client IP, submitted email, ...). Limiters keep O(1)
+state per key in a bounded LRU map, so an attacker rotating keys can only
+evict older state, never grow memory.
+"""
+
+import json
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# "<amount>/<unit>" as used by the *_RATE_LIMIT settings, e.g. "10/minute"
+RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)\s*$")
+RATE_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """
+    Parses a rate like "10/minute" into `(amount, period in seconds)`.
+    """
+    match = RATE_PATTERN.match(rate)
+    if not match:
+        raise ValueError(f"Invalid rate limit: {rate!r}")
+    return int(match.group(1)), RATE_UNITS[match.group(2)]
+
+
+class Limiter(ABC):
+    """
+    Base class of the limiters, holding the bounded per-key state.
+
+    Args:
+        max_keys (int): The number of keys tracked; the least recently seen
+            key is evicted first.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._state: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _get_state(self, key: Hashable, default: Callable[[], Any]) -> Any:
+        state = self._state.get(key)
+        if state is None:
+            state = self._state[key] = default()
+            if len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+        else:
+            self._state.move_to_end(key)
+        return state
+
+    @abstractmethod
+    def wait(self, key: Hashable, now: float) -> float:
+        """
+        Returns 0 when a request for the key would be allowed or the number of
+        seconds to wait before retrying otherwise, without recording it.
+        """
+
+    @abstractmethod
+    def hit(self, key: Hashable, now: float) -> float:
+        """
+        Records a request for the key, returning 0 when it is allowed or the
+        number of seconds to wait before retrying otherwise.
+        """
+
+
+class TokenBucket(Limiter):
+    """
+    Allows bursts of up to `amount` requests, refilled at `amount / period`
+    requests per second.
+    """
+
+    def __init__(self, amount: int, period: float, max_keys: int):
+        super().__init__(max_keys)
+        self.capacity = amount
+        self.refill_rate = amount / period
+
+    def _refill(self, key: Hashable, now: float) -> List[float]:
+        # [tokens, last update]
+        bucket = self._get_state(key, lambda: [float(self.capacity), now])
+        bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+        bucket[1] = now
+        return bucket
+
+    def wait(self, key: Hashable, now: float) -> float:
+        bucket = self._refill(key, now)
+        return 0.0 if bucket[0] >= 1 else (1 - bucket[0]) / self.refill_rate
+
+    def hit(self, key: Hashable, now: float) -> float:
+        wait = self.wait(key, now)
+        if not wait:
+            self._state[key][0] -= 1
+        return wait
+
+
+class SlidingWindow(Limiter):
+    """
+    Allows `amount` requests per rolling `period`, approximated from the
+    counts of the current and the previous fixed windows.
+    """
+
+    def __init__(self, amount: int, period: float, max_keys: int):
+        super().__init__(max_keys)
+        self.amount = amount
+        self.period = period
+
+    def _roll(self, key: Hashable, now: float) -> List[float]:
+        window_start = now - now % self.period
+        # [window start, count in the window, count in the previous window]
+        window = self._get_state(key, lambda: [window_start, 0, 0])
+        if window[0] != window_start:
+            elapsed_windows = (window_start - window[0]) / self.period
+            window[2] = window[1] if elapsed_windows == 1 else 0
+            window[0], window[1] = window_start, 0
+        return window
+
+    def wait(self, key: Hashable, now: float) -> float:
+        window = self._roll(key, now)
+        window_start = window[0]
+        elapsed = (now - window_start) / self.period
+        previous_weight = window[2] * (1 - elapsed)
+        if previous_weight + window[1] < self.amount:
+            return 0.0
+
+        if window[1] >= self.amount or not window[2]:
+            return window_start + self.period - now
+        # Wait until enough of the previous window has slid out
+        allowed_at = 1 - (self.amount - window[1]) / window[2]
+        return max((allowed_at - elapsed) * self.period, 0.001)
+
+    def hit(self, key: Hashable, now: float) -> float:
+        wait = self.wait(key, now)
+        if not wait:
+            self._state[key][1] += 1
+        return wait
+
+
+def client_ip(scope: Scope, body: Optional[dict]) -> Optional[str]:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def body_email(scope: Scope, body: Optional[dict]) -> Optional[str]:
+    email = (body or {}).get("email")
+    return email.strip().lower() if isinstance(email, str) else None
+
+
+@dataclass
+class RateLimitRule:
+    """
+    Applies a limiter to the requests of one route.
+
+    Attributes:
+        path (str): The exact request path the rule applies to.
+        limiter (Limiter): The limiter tracking the keys of this rule.
+        key (Callable): Extracts the limiting key from the request scope and
+            its JSON body; requests without a key are not limited by the rule.
+        methods (FrozenSet[str]): The HTTP methods the rule applies to.
+        reads_body (bool): Whether `key` needs the JSON body of the request.
+        limited (int): Requests rejected by this rule.
+    """
+
+    path: str
+    limiter: Limiter
+    key: Callable[[Scope, Optional[dict]], Optional[str]] = client_ip
+    methods: FrozenSet[str] = frozenset({"POST"})
+    reads_body: bool = False
+    limited: int = field(default=0, init=False)
+
+
+class RateLimitMiddleware:
+    """
+    Rejects requests exceeding any rule of their route with a 429 response
+    carrying a `Retry-After` header.
+
+    Args:
+        app (ASGIApp): The wrapped application.
+        get_rules (Callable): Returns the rules; called on the first request
+            so that building the middleware stack needs no configuration.
+    """
+
+    def __init__(self, app: ASGIApp, get_rules: Callable[[], List[RateLimitRule]]):
+        self.app = app
+        self.get_rules = get_rules
+        self._rules_by_path: Optional[Dict[str, List[RateLimitRule]]] = None
+
+    @property
+    def rules_by_path(self) -> Dict[str, List[RateLimitRule]]:
+        if self._rules_by_path is None:
+            rules_by_path: Dict[str, List[RateLimitRule]] = {}
+            for rule in self.get_rules():
+                rules_by_path.setdefault(rule.path, []).append(rule)
+            self._rules_by_path = rules_by_path
+        return self._rules_by_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        rules = (
+            self.rules_by_path.get(scope["path"], [])
+            if scope["type"] == "http" and settings.RATE_LIMIT_ENABLED
+            else []
+        )
+        rules = [rule for rule in rules if scope["method"] in rule.methods]
+        if not rules:
+            return await self.app(scope, receive, send)
+
+        body: Optional[dict] = None
+        if any(rule.reads_body for rule in rules):
+            messages, body = await self._read_body(receive)
+            receive = self._replay(messages, receive)
+
+        now = time.monotonic()
+        keyed = [(rule, key) for rule in rules if (key := rule.key(scope, body)) is not None]
+        # Every rule is checked before any is charged, so a rejected request
+        # does not use up the allowance of the rules that would have let it through
+        retry_after = 0.0
+        for rule, key in keyed:
+            wait = rule.limiter.wait(key, now)
+            if wait:
+                rule.limited += 1
+                retry_after = max(retry_after, wait)
+
+        if retry_after:
+            return await self._reject(send, retry_after)
+        for rule, key in keyed:
+            rule.limiter.hit(key, now)
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> Tuple[List[Message], Optional[dict]]:
+        messages, chunks = [], []
+        while True:
+            message = await receive()
+            messages.append(message)
+            chunks.append(message.get("body", b""))
+            if message["type"] != "http.request" or not message.get("more_body"):
+                break
+        try:
+            body = json.loads(b"".join(chunks) or b"null")
+        except ValueError:
+            body = None
+        return messages, body if isinstance(body, dict) else None
+
+    @staticmethod
+    def _replay(messages: List[Message], receive: Receive) -> Receive:
+        pending = list(messages)
+
+        async def replay() -> Message:
+            if pending:
+                return pending.pop(0)
+            return await receive()
+
+        return replay
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: float) -> None:
+        body = json.dumps(
+            {"success": False, "message": "Too many requests, please try again later"}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(retry_after)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
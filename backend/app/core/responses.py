@@ -0,0 +1,55 @@
+"""
+JSON responses serialized in a single pass.
+
+`JSONResponse` encodes its content with the stdlib `json` module, so schemas
+had to be dumped into dicts of JSON-compatible values first and those dicts
+were then walked a second time by the encoder. `APIResponse` hands its content
+to the pydantic-core serializer instead, which writes models, datetimes, UUIDs
+and enums straight to bytes.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Type, TypeVar
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class APIResponse(JSONResponse):
+    """
+    A `JSONResponse` whose content may hold pydantic models as-is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def get_list_adapter(schema: Type[T]) -> TypeAdapter[List[T]]:
+    """
+    Returns the adapter validating a list of `schema` items, built once per schema.
+    """
+    return TypeAdapter(List[schema])  # type: ignore[valid-type]
+
+
+def validate_items(schema: Type[T], rows: Sequence[Any]) -> List[T]:
+    """
+    Validates ORM rows into `schema` instances in a single call.
+    """
+    return get_list_adapter(schema).validate_python(rows, from_attributes=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an `If-None-Match` header matches `etag`, using the weak comparison
+    that conditional GETs call for.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
@@ -1,16 +1,113 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
 from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
-from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core import hashing
+from app.core.config import settings
+from app.core.exceptions import JSONException
+
+# bcrypt runs on a dedicated, size-limited process pool instead of the request
+# thread; at most PASSWORD_HASHER_MAX_QUEUE operations may wait for a worker
+_hasher_lock = threading.Lock()
+_hasher: Optional[ProcessPoolExecutor] = None
+_hasher_slots: Optional[threading.BoundedSemaphore] = None
+
+
+def _get_hasher() -> Tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+    global _hasher, _hasher_slots
+    with _hasher_lock:
+        if _hasher is None:
+            _hasher = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASHER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        if _hasher_slots is None:
+            _hasher_slots = threading.BoundedSemaphore(
+                settings.PASSWORD_HASHER_WORKERS + settings.PASSWORD_HASHER_MAX_QUEUE
+            )
+        return _hasher, _hasher_slots
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher
+    with _hasher_lock:
+        if _hasher is not None:
+            _hasher.shutdown()
+            _hasher = None
+
+
+def _submit(fn: Callable[..., Any], *args: Any) -> Future:
+    if settings.PASSWORD_HASHER_WORKERS <= 0:
+        # No pool configured, hash on the calling thread (see `_run` for the
+        # async callers, which must not block the event loop)
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    hasher, slots = _get_hasher()
+    if not slots.acquire(blocking=False):
+        raise JSONException(
+            message="The server is busy, please try again shortly", status_code=503
+        )
+
+    future = hasher.submit(fn, *args)
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+async def _run(fn: Callable[..., Any], *args: Any) -> Any:
+    if settings.PASSWORD_HASHER_WORKERS <= 0:
+        # No pool configured, hash on the threadpool like a sync endpoint would
+        return await run_in_threadpool(fn, *args)
+    return await asyncio.wrap_future(_submit(fn, *args))
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _submit(hashing.hash_password, password, settings.BCRYPT_ROUNDS).result()
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(hashing.hash_password, password, settings.BCRYPT_ROUNDS)
 
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_and_update_password(plain_password, hashed_password)[0]
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies the password and, when the stored hash does not use BCRYPT_ROUNDS,
+    also returns the password re-hashed with the current cost.
+    """
+    future = _submit(
+        hashing.verify_and_update_password,
+        plain_password,
+        hashed_password,
+        settings.BCRYPT_ROUNDS,
+    )
+    return future.result()
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return await _run(
+        hashing.verify_and_update_password,
+        plain_password,
+        hashed_password,
+        settings.BCRYPT_ROUNDS,
+    )
 
 
 def set_auth_cookies(response: Response, access_token: str, refresh_token: str):
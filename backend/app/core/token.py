@@ -1,51 +1,74 @@
+import hashlib
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from jose import ExpiredSignatureError, JWTError, jwt
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 from app.core.exceptions import JSONException
 
-# Secret keys
-ACCESS_TOKEN_SECRET = settings.JWT_SECRET_KEY
-REFRESH_TOKEN_SECRET = settings.JWT_REFRESH_SECRET_KEY
 
-# Expiration times
-ACCESS_TOKEN_EXP_MINUTES = settings.ACCESS_TOKEN_EXPIRATION_TIME
-REFRESH_TOKEN_EXP_DAYS = settings.REFRESH_TOKEN_EXPIRATION_TIME
+class VerifiedTokenCache(LRUCache):
+    """
+    A bounded LRU cache of access tokens that already passed `jwt.decode`.
+
+    Entries are keyed by the SHA-256 digest of the token, so the raw bearer
+    credentials are never held in memory, and are only served until the `exp`
+    claim of their token.
+    """
+
+    def _key(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+@lru_cache
+def get_access_token_cache() -> VerifiedTokenCache:
+    return VerifiedTokenCache(settings.ACCESS_TOKEN_CACHE_SIZE)
 
 
 def generate_access_token(user_id: UUID) -> str:
     payload = {
         "sub": str(user_id),
         "type": "access",
-        "exp": datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXP_MINUTES),
+        "exp": datetime.now(timezone.utc)
+        + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRATION_TIME),
         "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(payload, ACCESS_TOKEN_SECRET, algorithm="HS256")
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm="HS256")
 
 
 def generate_refresh_token(user_id: UUID) -> str:
     payload = {
         "sub": str(user_id),
         "type": "refresh",
-        "exp": datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXP_DAYS),
+        "jti": uuid4().hex,
+        "exp": datetime.now(timezone.utc)
+        + timedelta(days=settings.REFRESH_TOKEN_EXPIRATION_TIME),
         "iat": datetime.now(timezone.utc),
     }
-    return jwt.encode(payload, REFRESH_TOKEN_SECRET, algorithm="HS256")
+    return jwt.encode(payload, settings.JWT_REFRESH_SECRET_KEY, algorithm="HS256")
 
 
 def verify_access_token(token: str) -> UUID:
+    access_token_cache = get_access_token_cache()
+    user_id = access_token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = jwt.decode(
-            token, ACCESS_TOKEN_SECRET, algorithms=settings.JWT_ALGORITHM
+            token, settings.JWT_SECRET_KEY, algorithms=settings.JWT_ALGORITHM
         )
         if payload.get("type") != "access":
             raise JSONException(
                 message="Invalid token type: expected access token",
                 status_code=401,
             )
-        return UUID(payload.get("sub"))
+        user_id = UUID(payload.get("sub"))
+        access_token_cache.set(token, user_id, float(payload["exp"]))
+        return user_id
     except ExpiredSignatureError as exc:
         raise JSONException(
             message="Access token has expired",
@@ -61,7 +84,7 @@ def verify_access_token(token: str) -> UUID:
 def verify_refresh_token(token: str):
     try:
         payload = jwt.decode(
-            token, REFRESH_TOKEN_SECRET, algorithms=settings.JWT_ALGORITHM
+            token, settings.JWT_REFRESH_SECRET_KEY, algorithms=settings.JWT_ALGORITHM
         )
         if payload.get("type") != "refresh":
             raise JSONException(
@@ -0,0 +1,103 @@
+"""
+Async variants of the read paths in `app.crud.auth`
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.auth import token_expiry
+from app.models.auth import RevokedToken, Token, TokenPurpose
+from app.models.user import User
+from app.schemas.user import UserCreate
+
+
+async def get_user_by_email_or_username(
+    session: AsyncSession, email: str, username: Optional[str] = None
+):
+    """
+    Returns a User based on the provided username or email
+    """
+    if username:
+        statement = select(User).where(
+            or_(User.email == email, User.username == username)
+        )
+    else:
+        statement = select(User).where(User.email == email)
+    return (await session.exec(statement)).first()
+
+
+async def get_user_by_id(session: AsyncSession, user_id: str | UUID):
+    """
+    Returns the User based on the user_id provided
+    """
+    statement = select(User).where(User.id == user_id)
+    return (await session.exec(statement)).first()
+
+
+async def get_token_by_code(
+    session: AsyncSession, code: str, purpose: TokenPurpose
+) -> Token | None:
+    statement = select(Token).where(Token.code == code, Token.purpose == purpose)
+    return (await session.exec(statement)).first()
+
+
+async def create_user(
+    session: AsyncSession, user_in: UserCreate, hashed_password: str
+) -> User:
+    """
+    Creates a User from the credentials provided and their already hashed password
+    """
+    user = User(
+        fullname=user_in.fullname,
+        email=user_in.email,
+        username=user_in.username,
+        hashed_password=hashed_password,
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    return user
+
+
+async def update_user_password_hash(
+    session: AsyncSession, user: User, hashed_password: str
+) -> None:
+    user.hashed_password = hashed_password
+    session.add(user)
+    await session.commit()
+
+
+async def create_token(
+    session: AsyncSession, user_id: UUID, code: str, purpose: TokenPurpose
+) -> Token:
+    token = Token(
+        user_id=user_id, code=code, purpose=purpose, expires_at=token_expiry(purpose)
+    )
+    session.add(token)
+    await session.commit()
+    await session.refresh(token)
+    return token
+
+
+async def is_token_revoked(session: AsyncSession, jti: str) -> bool:
+    statement = select(RevokedToken.jti).where(RevokedToken.jti == jti)
+    return (await session.exec(statement)).first() is not None
+
+
+async def revoke_token(session: AsyncSession, jti: str, expires_at: datetime) -> bool:
+    """
+    Records the token as revoked. Returns False when it already was, which
+    makes revoking the compare-and-set step of a refresh token rotation.
+    """
+    session.add(RevokedToken(jti=jti, expires_at=expires_at))
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        return False
+    return True
@@ -0,0 +1,37 @@
+"""
+Async variants of the read paths in `app.crud.task`, sharing its query builders
+"""
+
+from typing import Any, Sequence, Tuple
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.task import (
+    select_board,
+    select_board_version,
+    select_changed_tasks,
+    select_oldest_change,
+)
+
+
+async def read_board_version(session: AsyncSession, team_id: UUID, user_id: UUID) -> int | None:
+    """
+    Returns the version of the team's board, None if the user has no access to the team.
+    """
+    query = select_board_version(team_id=team_id, user_id=user_id)
+    return (await session.exec(query)).first()
+
+
+async def read_board(session: AsyncSession, team_id: UUID) -> Sequence[Tuple[Any, ...]]:
+    return (await session.exec(select_board(team_id=team_id))).all()
+
+
+async def read_oldest_change(session: AsyncSession, team_id: UUID) -> int | None:
+    return (await session.exec(select_oldest_change(team_id=team_id))).one()
+
+
+async def read_changed_tasks(
+    session: AsyncSession, team_id: UUID, since: int
+) -> Sequence[Tuple[Any, ...]]:
+    return (await session.exec(select_changed_tasks(team_id=team_id, since=since))).all()
@@ -0,0 +1,14 @@
+"""
+Async variants of the read paths in `app.crud.task_counter`, sharing its query builders
+"""
+
+from typing import Any, Sequence, Tuple
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.task_counter import select_counters
+
+
+async def read_counters(session: AsyncSession, team_id: UUID) -> Sequence[Tuple[Any, ...]]:
+    return (await session.exec(select_counters(team_id=team_id))).all()
@@ -0,0 +1,30 @@
+"""
+Async variants of the read paths in `app.crud.team`, sharing its query builders
+"""
+
+from typing import Sequence
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.team import select_joined_teams, select_teams_by_owner
+from app.models.team import Team
+
+
+async def read_team_by_id(session: AsyncSession, team_id: UUID) -> Team | None:
+    return (await session.exec(select(Team).where(Team.id == team_id))).first()
+
+
+async def read_teams_by_owner(
+    session: AsyncSession, owner_id: UUID, search: str | None = None
+) -> Sequence[Team]:
+    query = select_teams_by_owner(owner_id=owner_id, search=search)
+    return (await session.exec(query)).all()
+
+
+async def read_joined_teams(
+    session: AsyncSession, user_id: UUID, search: str | None = None
+) -> Sequence[Team]:
+    query = select_joined_teams(user_id=user_id, search=search)
+    return (await session.exec(query)).all()
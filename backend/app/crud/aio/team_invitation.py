@@ -0,0 +1,39 @@
+"""
+Async variants of the read paths in `app.crud.team_invitation`, sharing its query builders
+"""
+
+from typing import Sequence
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.team_invitation import select_invitations_by_team_id
+from app.models.team import Invitation
+
+
+async def read_invitations_by_team_id(
+    session: AsyncSession,
+    team_id: UUID,
+    search: str | None = None,
+    role: str | None = None,
+) -> Sequence[Invitation]:
+    query = select_invitations_by_team_id(team_id=team_id, search=search, role=role)
+    return (await session.exec(query)).all()
+
+
+async def is_member_invited(session: AsyncSession, team_id: UUID, member_email: str):
+    query = select(Invitation).where(
+        Invitation.email == member_email, Invitation.team_id == team_id
+    )
+    return (await session.exec(query)).first()
+
+
+async def read_invitation_by_token(session: AsyncSession, invitation_token: str):
+    query = select(Invitation).where(Invitation.token == invitation_token)
+    return (await session.exec(query)).first()
+
+
+async def read_invitation_by_id(session: AsyncSession, invitation_id: UUID):
+    query = select(Invitation).where(Invitation.id == invitation_id)
+    return (await session.exec(query)).first()
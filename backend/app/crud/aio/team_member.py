@@ -0,0 +1,37 @@
+"""
+Async variants of the read paths in `app.crud.team_member`, sharing its query builders
+"""
+
+from typing import Sequence
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.team_member import select_team_access, select_team_members_by_team_id
+from app.models.team import TeamMate
+from app.models.user import User
+
+
+async def read_team_members_by_team_id(
+    session: AsyncSession,
+    team_id: UUID,
+    search: str | None = None,
+    role: str | None = None,
+) -> Sequence[TeamMate]:
+    stmt = select_team_members_by_team_id(team_id=team_id, search=search, role=role)
+    return (await session.exec(stmt)).all()
+
+
+async def read_member_by_email(session: AsyncSession, team_id: UUID, member_email: str):
+    query = select(TeamMate).join(User).where(
+        User.email == member_email,
+        TeamMate.team_id == team_id
+    )
+
+    return (await session.exec(query)).first()
+
+
+async def has_team_access(session: AsyncSession, team_id: UUID, user_id: UUID) -> bool:
+    query = select_team_access(team_id=team_id, user_id=user_id)
+    return (await session.exec(query)).first() is not None
@@ -2,17 +2,31 @@
 This module handles the CRUD related to Authentication
 """
 
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
 
-from sqlmodel import Session, or_, select
+from sqlmodel import Session, delete, or_, select
 
+from app.core.config import settings
 from app.core.security import hash_password
-from app.models.auth import Token, TokenPurpose
+from app.models.auth import RevokedToken, Token, TokenPurpose
 from app.models.user import User
 from app.schemas.user import UserCreate
 
 from uuid import UUID
 
+def get_token_lifetime(purpose: TokenPurpose) -> timedelta:
+    """
+    Returns how long a token of the given purpose stays valid after its creation.
+    """
+    if purpose == TokenPurpose.RESET_PASSWORD:
+        return timedelta(minutes=settings.RESET_PASSWORD_TOKEN_EXPIRY_MINUTES)
+    return timedelta(hours=settings.EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS)
+
+
+def token_expiry(purpose: TokenPurpose) -> datetime:
+    return datetime.utcnow() + get_token_lifetime(purpose)
+
 
 def get_user_by_email_or_username(
     session: Session, email: str, username: Optional[str] = None
@@ -56,7 +70,9 @@ def create_user(session: Session, user_in: UserCreate) -> User:
 def create_token(
     session: Session, user_id: UUID, code: str, purpose: TokenPurpose
 ) -> Token:
-    token = Token(user_id=user_id, code=code, purpose=purpose)
+    token = Token(
+        user_id=user_id, code=code, purpose=purpose, expires_at=token_expiry(purpose)
+    )
     session.add(token)
     session.commit()
     session.refresh(token)
@@ -83,3 +99,40 @@ def get_token_by_user_id(user_id: str | UUID, session: Session, purpose: TokenPu
 def delete_token(session: Session, token: Token):
     session.delete(token)
     session.commit()
+
+
+def delete_expired_tokens(session: Session, now: datetime, limit: int) -> int:
+    """
+    Deletes at most `limit` expired tokens in one short transaction and
+    returns how many were deleted.
+    """
+    expired = select(Token.id).where(Token.expires_at <= now).limit(limit)
+    result = session.exec(delete(Token).where(Token.id.in_(expired)))  # type: ignore
+    session.commit()
+    return result.rowcount
+
+
+def read_revoked_jtis(session: Session, since: datetime | None = None) -> Sequence[str]:
+    """
+    Returns the jti of every revoked token that has not expired yet, limited
+    to the ones revoked from `since` on when given.
+    """
+    statement = select(RevokedToken.jti).where(RevokedToken.expires_at > datetime.utcnow())
+    if since:
+        statement = statement.where(RevokedToken.revoked_at >= since)
+    return session.exec(statement).all()
+
+
+def delete_expired_revocations(session: Session, now: datetime, limit: int) -> int:
+    """
+    Deletes at most `limit` revocations of already expired tokens in one short
+    transaction and returns how many were deleted.
+    """
+    expired = (
+        select(RevokedToken.jti).where(RevokedToken.expires_at <= now).limit(limit)
+    )
+    result = session.exec(
+        delete(RevokedToken).where(RevokedToken.jti.in_(expired))  # type: ignore
+    )
+    session.commit()
+    return result.rowcount
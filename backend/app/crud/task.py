@@ -1 +1,314 @@
-﻿
+﻿from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, tuple_
+from sqlmodel import Session, delete, insert, select, update
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.core.config import settings
+from app.crud.task_counter import counter_deltas, update_counters
+from app.crud.team_member import select_team_access
+from app.models.task import Task, TaskChange, TaskStatus
+from app.models.team import Team
+from app.models.user import User
+
+
+def lock_board(session: Session, team_id: UUID) -> int | None:
+    """
+    Locks the team's board until the end of the transaction and returns its
+    version, None if there is no such team.
+
+    Writers of a board take this lock before reading the state their write
+    depends on (neighbour ranks, the previous status or assignee of a task),
+    so that no other write of the board can change it in between. The lock is
+    taken by a write leaving the row unchanged rather than by a locking read:
+    SQLite has no row locks and does not open a transaction on a SELECT, but a
+    write makes every other writer wait for the end of the transaction there too.
+    """
+    return session.exec(
+        update(Team)
+        .where(Team.id == team_id)
+        .values(board_version=Team.board_version)
+        .returning(Team.board_version)
+    ).scalar_one_or_none()
+
+
+def bump_board_version(session: Session, team_id: UUID, task_ids: Iterable[UUID]) -> int:
+    """
+    Bumps the version of the team's board in the current transaction, to be
+    called alongside every task write, and logs the tasks changed in the new
+    version. Returns the new version.
+
+    Every version of the board thus has entries in the change log, which lets
+    the change feed tell when a version has been pruned from it.
+    """
+    version = session.exec(
+        update(Team)
+        .where(Team.id == team_id)
+        .values(board_version=Team.board_version + 1)
+        .returning(Team.board_version)
+    ).scalar_one()
+    changed_at = datetime.utcnow()
+    session.exec(
+        insert(TaskChange),  # type: ignore[call-overload]
+        params=[
+            {"team_id": team_id, "seq": version, "task_id": task_id, "changed_at": changed_at}
+            for task_id in set(task_ids)
+        ],
+    )
+    return version
+
+
+def select_board_version(team_id: UUID, user_id: UUID) -> SelectOfScalar[int]:
+    """
+    Selects the version of the team's board if the user owns the team or is
+    one of its members.
+    """
+    return select_team_access(team_id=team_id, user_id=user_id).with_only_columns(
+        Team.board_version
+    )
+
+
+def select_board(team_id: UUID):
+    """
+    Selects every task of the board in board order, along with the name of its
+    assignee.
+    """
+    return (
+        select(Task, User.fullname, User.username)
+        .outerjoin(User, Task.assignee_id == User.id)  # type: ignore[arg-type]
+        .where(Task.team_id == team_id)
+        .order_by(Task.status, Task.rank)
+    )
+
+
+def select_oldest_change(team_id: UUID):
+    """
+    Selects the oldest version of the board still in its change log.
+    """
+    return select(func.min(TaskChange.seq)).where(TaskChange.team_id == team_id)
+
+
+def select_changed_tasks(team_id: UUID, since: int):
+    """
+    Selects the tasks of the board changed after version `since`, once each and
+    in their current state, along with the name of their assignee. The task
+    (and names) of a deleted task are None.
+    """
+    changed = (
+        select(TaskChange.task_id)
+        .where(TaskChange.team_id == team_id, TaskChange.seq > since)
+        .distinct()
+        .subquery()
+    )
+    return (
+        select(changed.c.task_id, Task, User.fullname, User.username)
+        .select_from(changed)
+        .outerjoin(Task, Task.id == changed.c.task_id)  # type: ignore[arg-type]
+        .outerjoin(User, Task.assignee_id == User.id)  # type: ignore[arg-type]
+    )
+
+
+def create_task(session: Session, task: Task) -> Task:
+    session.add(task)
+    bump_board_version(session, task.team_id, [task.id])
+    update_counters(session, task.team_id, counter_deltas(added=[(task.status, task.assignee_id)]))
+    session.commit()
+    session.refresh(task)
+    return task
+
+
+def read_task(session: Session, team_id: UUID, task_id: UUID) -> Task | None:
+    return session.exec(
+        select(Task).where(Task.id == task_id, Task.team_id == team_id)
+    ).first()
+
+
+def read_task_rank(
+    session: Session, team_id: UUID, status: TaskStatus, task_id: UUID
+) -> str | None:
+    """
+    Returns the rank of a task of the given column, None if it is not there.
+    """
+    return session.exec(
+        select(Task.rank).where(
+            Task.id == task_id, Task.team_id == team_id, Task.status == status
+        )
+    ).first()
+
+
+def read_next_rank(
+    session: Session, team_id: UUID, status: TaskStatus, rank: str | None = None
+) -> str | None:
+    """
+    Returns the smallest rank of the column sorting after `rank` (after the
+    start of the column when None), served by the `(team_id, status, rank)` index.
+    """
+    query = select(func.min(Task.rank)).where(Task.team_id == team_id, Task.status == status)
+    if rank is not None:
+        query = query.where(Task.rank > rank)
+    return session.exec(query).one()
+
+
+def read_previous_rank(
+    session: Session, team_id: UUID, status: TaskStatus, rank: str | None = None
+) -> str | None:
+    """
+    Returns the greatest rank of the column sorting before `rank` (before the
+    end of the column when None).
+    """
+    query = select(func.max(Task.rank)).where(Task.team_id == team_id, Task.status == status)
+    if rank is not None:
+        query = query.where(Task.rank < rank)
+    return session.exec(query).one()
+
+
+def select_tasks_by_team(
+    team_id: UUID,
+    status: TaskStatus | None = None,
+    assignee_id: UUID | None = None,
+) -> SelectOfScalar[Task]:
+    query = select(Task).where(Task.team_id == team_id)
+    if status:
+        query = query.where(Task.status == status)
+    if assignee_id:
+        query = query.where(Task.assignee_id == assignee_id)
+    return query.order_by(Task.status, Task.rank)
+
+
+def update_task(session: Session, task: Task, values: Dict[str, object]) -> Task:
+    """
+    Updates a task read with its board locked (see `lock_board`), so that the
+    counters are moved from its actual previous status and assignee.
+    """
+    before = (task.status, task.assignee_id)
+    for field, value in values.items():
+        setattr(task, field, value)
+    task.updated_at = datetime.utcnow()
+    session.add(task)
+    bump_board_version(session, task.team_id, [task.id])
+    update_counters(
+        session,
+        task.team_id,
+        counter_deltas(removed=[before], added=[(task.status, task.assignee_id)]),
+    )
+    session.commit()
+    session.refresh(task)
+    return task
+
+
+def delete_task(session: Session, task: Task) -> None:
+    """
+    Deletes a task read with its board locked (see `lock_board`).
+    """
+    session.delete(task)
+    bump_board_version(session, task.team_id, [task.id])
+    update_counters(session, task.team_id, counter_deltas(removed=[(task.status, task.assignee_id)]))
+    session.commit()
+
+
+def read_tasks_by_ids(session: Session, team_id: UUID, task_ids: Iterable[UUID]) -> Sequence[Task]:
+    return session.exec(
+        select(Task).where(Task.team_id == team_id, Task.id.in_(list(task_ids)))  # type: ignore[attr-defined]
+    ).all()
+
+
+def read_column_ranks(
+    session: Session, team_id: UUID, statuses: Iterable[TaskStatus]
+) -> Sequence[Tuple[TaskStatus, str]]:
+    """
+    Returns the `(status, rank)` pairs of the given columns, in board order.
+    """
+    return session.exec(
+        select(Task.status, Task.rank)
+        .where(Task.team_id == team_id, Task.status.in_(list(statuses)))  # type: ignore[attr-defined]
+        .order_by(Task.status, Task.rank)
+    ).all()
+
+
+def apply_task_changes(
+    session: Session,
+    team_id: UUID,
+    created: List[Dict[str, Any]],
+    updated: List[Dict[str, Any]],
+    deleted: List[UUID],
+    deltas: Dict[Any, int],
+) -> int:
+    """
+    Writes many task changes of one board in a single transaction, with one
+    statement per kind of change, and returns the new version of the board.
+
+    Args:
+        created: The values of the tasks to insert.
+        updated: The changed values of existing tasks, each with its `id`.
+        deleted: The ids of the tasks to delete.
+        deltas: The counter changes (see `app.crud.task_counter`) of all of the above.
+    """
+    version = bump_board_version(
+        session,
+        team_id,
+        [*(task["id"] for task in created), *(task["id"] for task in updated), *deleted],
+    )
+    if created:
+        session.exec(insert(Task), params=created)  # type: ignore[call-overload]
+    if updated:
+        session.exec(update(Task), params=updated)  # type: ignore[call-overload]
+    if deleted:
+        session.exec(delete(Task).where(Task.id.in_(deleted)))  # type: ignore[attr-defined]
+    update_counters(session, team_id, deltas)
+    session.commit()
+    return version
+
+
+def delete_expired_task_changes(session: Session, now: datetime, limit: int) -> int:
+    """
+    Deletes about `limit` change log entries older than the retention period
+    in one short transaction and returns how many were deleted.
+
+    The versions of the first `limit` expired entries, oldest first, are
+    deleted whole, so the oldest version left in the log of a board is always
+    complete and no newer version is pruned before it. Only the last of these
+    versions may take the batch past `limit` entries.
+    """
+    cutoff = now - timedelta(days=settings.TASK_CHANGE_RETENTION_DAYS)
+    # Versions are numbered per board, so the oldest versions of every board
+    # come first
+    oldest = (
+        select(TaskChange.team_id, TaskChange.seq)
+        .where(TaskChange.changed_at <= cutoff)
+        .order_by(TaskChange.seq, TaskChange.team_id)
+        .limit(limit)
+        .subquery()
+    )
+    expired = select(oldest.c.team_id, oldest.c.seq).distinct()
+    result = session.exec(
+        delete(TaskChange).where(tuple_(TaskChange.team_id, TaskChange.seq).in_(expired))  # type: ignore
+    )
+    session.commit()
+    return result.rowcount
+
+
+def read_column_for_update(
+    session: Session, team_id: UUID, status: TaskStatus
+) -> Sequence[Task]:
+    """
+    Returns the tasks of a column in board order, locking them until the end
+    of the transaction where the database supports it.
+    """
+    return session.exec(
+        select(Task)
+        .where(Task.team_id == team_id, Task.status == status)
+        .order_by(Task.rank, Task.id)
+        .with_for_update()
+    ).all()
+
+
+def update_ranks(session: Session, team_id: UUID, ranks: List[Dict[str, object]]) -> None:
+    """
+    Rewrites the ranks of many tasks of a team, given as `{"id": ..., "rank": ...}`,
+    in one executemany batch.
+    """
+    session.exec(update(Task), params=ranks)  # type: ignore[call-overload]
+    bump_board_version(session, team_id, [rank["id"] for rank in ranks])  # type: ignore[misc]
+    session.commit()
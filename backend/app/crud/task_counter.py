@@ -0,0 +1,132 @@
+"""
+The task counters of the boards, per column and assignee.
+
+Every task write turns into `(status, assignee_id)` deltas applied by one
+upsert in the transaction of the write. Writers lock the board's team row
+(`app.crud.task.lock_board`) before reading the tasks the deltas are computed
+from, so two writes of one task can never both move it out of the same key.
+The counter repair takes the same lock, so it never interleaves with a write
+either.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from app.models.task import UNASSIGNED, Task, TaskCounter, TaskStatus
+from app.models.team import Team
+from app.models.user import User
+
+CounterKey = Tuple[TaskStatus, UUID | None]
+
+# The INSERT ... ON CONFLICT constructs of the supported databases
+UPSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def counter_deltas(
+    removed: Iterable[CounterKey] = (), added: Iterable[CounterKey] = ()
+) -> Counter[CounterKey]:
+    """
+    Returns the counter changes of tasks leaving the `removed` keys and
+    entering the `added` ones; a task whose key did not change cancels out.
+    """
+    deltas: Counter[CounterKey] = Counter(added)
+    deltas.subtract(removed)
+    return deltas
+
+
+def update_counters(session: Session, team_id: UUID, deltas: Dict[CounterKey, int]) -> None:
+    """
+    Applies counter deltas to a board in the current transaction.
+    """
+    rows = sorted(
+        (
+            {
+                "team_id": team_id,
+                "status": status,
+                "assignee_id": assignee_id or UNASSIGNED,
+                "count": delta,
+            }
+            for (status, assignee_id), delta in deltas.items()
+            if delta
+        ),
+        # A consistent order keeps concurrent upserts from deadlocking
+        key=lambda row: (row["status"], row["assignee_id"]),
+    )
+    if not rows:
+        return
+
+    statement = UPSERTS[session.get_bind().dialect.name](TaskCounter).values(rows)
+    session.exec(
+        statement.on_conflict_do_update(  # type: ignore[call-overload]
+            index_elements=["team_id", "status", "assignee_id"],
+            set_={"count": TaskCounter.count + statement.excluded["count"]},
+        )
+    )
+
+
+def select_counters(team_id: UUID):
+    """
+    Selects the non-zero counters of a board, along with the name of their assignee.
+    """
+    return (
+        select(TaskCounter.status, TaskCounter.assignee_id, TaskCounter.count, User.fullname, User.username)
+        .outerjoin(User, TaskCounter.assignee_id == User.id)  # type: ignore[arg-type]
+        .where(TaskCounter.team_id == team_id, TaskCounter.count != 0)
+    )
+
+
+def read_stored_counts(
+    session: Session, team_id: UUID | None = None
+) -> Dict[Tuple[UUID, TaskStatus, UUID], int]:
+    query = select(TaskCounter).where(TaskCounter.count != 0)
+    if team_id:
+        query = query.where(TaskCounter.team_id == team_id)
+    return {
+        (counter.team_id, counter.status, counter.assignee_id): counter.count
+        for counter in session.exec(query)
+    }
+
+
+def read_actual_counts(
+    session: Session, team_id: UUID | None = None
+) -> Dict[Tuple[UUID, TaskStatus, UUID], int]:
+    """
+    Counts the tasks themselves, grouped like the counters.
+    """
+    assignee_id = func.coalesce(Task.assignee_id, UNASSIGNED)
+    query = select(Task.team_id, Task.status, assignee_id, func.count()).group_by(
+        Task.team_id, Task.status, assignee_id
+    )
+    if team_id:
+        query = query.where(Task.team_id == team_id)
+    return {(team, status, assignee): count for team, status, assignee, count in session.exec(query)}
+
+
+def replace_counters(session: Session, team_id: UUID) -> int:
+    """
+    Recomputes the counters of a board from its tasks, returning the number of
+    counters written.
+    """
+    # Blocks the board's writers until the counters are rewritten, with the
+    # same no-op write as `app.crud.task.lock_board`
+    session.exec(
+        update(Team).where(Team.id == team_id).values(board_version=Team.board_version)  # type: ignore[call-overload]
+    )
+    counts = read_actual_counts(session, team_id)
+    session.exec(delete(TaskCounter).where(TaskCounter.team_id == team_id))  # type: ignore[call-overload]
+    rows: List[Dict[str, object]] = [
+        {"team_id": team, "status": status, "assignee_id": assignee, "count": count}
+        for (team, status, assignee), count in counts.items()
+    ]
+    if rows:
+        session.exec(insert(TaskCounter), params=rows)  # type: ignore[call-overload]
+    session.commit()
+    return len(rows)
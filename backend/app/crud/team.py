@@ -2,7 +2,9 @@ from typing import Sequence
 from uuid import UUID
 
 from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
 
+from app.db.search import search_filter, search_rank
 from app.models.team import Team, TeamMate, TeamMateRole
 
 
@@ -18,18 +20,26 @@ def read_team_by_id(session: Session, team_id: UUID) -> Team | None:
     return session.exec(select(Team).where(Team.id == team_id)).first()
 
 
-def read_teams_by_owner(
-    session: Session, owner_id: UUID, search: str | None = None
-) -> Sequence[Team]:
+def select_teams_by_owner(
+    owner_id: UUID, search: str | None = None
+) -> SelectOfScalar[Team]:
     query = select(Team).where(Team.owner_id == owner_id)
     if search:
-        query = query.where(Team.name.ilike(f"%{search}%"))
-    return session.exec(query).all()
+        query = query.where(search_filter(Team.name, search)).order_by(
+            search_rank(Team.name, search).desc()
+        )
+    return query
 
 
-def read_joined_teams(
-    session: Session, user_id: UUID, search: str | None = None
+def read_teams_by_owner(
+    session: Session, owner_id: UUID, search: str | None = None
 ) -> Sequence[Team]:
+    return session.exec(select_teams_by_owner(owner_id=owner_id, search=search)).all()
+
+
+def select_joined_teams(
+    user_id: UUID, search: str | None = None
+) -> SelectOfScalar[Team]:
     query = (
         select(Team)
         .join(TeamMate)
@@ -37,9 +47,17 @@ def read_joined_teams(
     )
 
     if search:
-        query = query.where(Team.name.ilike(f"%{search}"))
+        query = query.where(search_filter(Team.name, search)).order_by(
+            search_rank(Team.name, search).desc()
+        )
+
+    return query
+
 
-    return session.exec(query).all()
+def read_joined_teams(
+    session: Session, user_id: UUID, search: str | None = None
+) -> Sequence[Team]:
+    return session.exec(select_joined_teams(user_id=user_id, search=search)).all()
 
 
 def delete_team(session: Session, team: Team) -> None:
@@ -1,27 +1,52 @@
-from typing import Sequence
+from datetime import datetime
+from typing import Iterable, List, Sequence, Set
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, delete, insert, select
+from sqlmodel.sql.expression import SelectOfScalar
 
+from app.db.search import search_filter, search_rank
 from app.models.team import Invitation, TeamMate
 from app.models.user import User
 from app.schemas.team_invitation import InvitationData
 
 
-def read_invitations_by_team_id(
-    session: Session,
+def select_invitations_by_team_id(
     team_id: UUID,
     search: str | None = None,
     role: str | None = None,
-) -> Sequence[Invitation]:
-    query = select(Invitation).where(Invitation.team_id == team_id)
+) -> SelectOfScalar[Invitation]:
+    # Batch-load the invitors of the whole page in one query, limited to the
+    # columns `UserRead` serializes
+    query = (
+        select(Invitation)
+        .where(Invitation.team_id == team_id)
+        .options(
+            selectinload(Invitation.invitor).load_only(  # type: ignore
+                User.id, User.fullname, User.email, User.username  # type: ignore
+            )
+        )
+    )
 
     if role:
         query = query.where(Invitation.role == role)
 
     if search:
-        query = query.where(Invitation.email.ilike(f"%{search}%"))
+        query = query.where(search_filter(Invitation.email, search)).order_by(
+            search_rank(Invitation.email, search).desc()
+        )
+
+    return query
+
 
+def read_invitations_by_team_id(
+    session: Session,
+    team_id: UUID,
+    search: str | None = None,
+    role: str | None = None,
+) -> Sequence[Invitation]:
+    query = select_invitations_by_team_id(team_id=team_id, search=search, role=role)
     return session.exec(query).all()
 
 
@@ -47,6 +72,41 @@ def create_invitation(
     return invitation
 
 
+def read_invited_emails(
+    session: Session, team_id: UUID, emails: Iterable[str]
+) -> Set[str]:
+    query = select(Invitation.email).where(
+        Invitation.team_id == team_id, Invitation.email.in_(list(emails))
+    )
+    return set(session.exec(query).all())
+
+
+def create_invitations(
+    session: Session,
+    team_id: UUID,
+    invited_by: UUID,
+    invitations_data: Sequence[InvitationData],
+) -> List[Invitation]:
+    """
+    Inserts all the invitations in a single multi-row INSERT and one commit
+    """
+    invitations = [
+        Invitation(
+            team_id=team_id,
+            email=invitation_data.email,
+            role=invitation_data.role,
+            invited_by=invited_by,
+        )
+        for invitation_data in invitations_data
+    ]
+    if invitations:
+        session.exec(
+            insert(Invitation), params=[invitation.model_dump() for invitation in invitations]
+        )
+        session.commit()
+    return invitations
+
+
 def read_invitation_by_token(session: Session, invitation_token: str):
     query = select(Invitation).where(Invitation.token == invitation_token)
     return session.exec(query).first()
@@ -73,3 +133,18 @@ def drop_invitation(session: Session, invitation_id: UUID):
 
     session.delete(invitation)
     session.commit()
+
+
+def delete_expired_invitations(session: Session, now: datetime, limit: int) -> int:
+    """
+    Deletes at most `limit` expired, never accepted invitations in one short
+    transaction and returns how many were deleted.
+    """
+    expired = (
+        select(Invitation.id)
+        .where(Invitation.expiration_date <= now, Invitation.is_accepted == False)  # noqa: E712
+        .limit(limit)
+    )
+    result = session.exec(delete(Invitation).where(Invitation.id.in_(expired)))  # type: ignore
+    session.commit()
+    return result.rowcount
@@ -1,28 +1,92 @@
-from typing import Sequence
+from typing import Iterable, Sequence, Set
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, or_, select, update
+from sqlmodel.sql.expression import SelectOfScalar
 
-from app.models.team import TeamMate, TeamMateRole
+from app.db.search import search_filter, search_rank
+from app.models.team import Team, TeamMate, TeamMateRole
 from app.models.user import User
 
 
-def read_team_members_by_team_id(
-    session: Session, team_id: UUID, search: str | None = None, role: str | None = None
-) -> Sequence[TeamMate]:
-    stmt = select(TeamMate).where(TeamMate.team_id == team_id)
+def select_team_members_by_team_id(
+    team_id: UUID, search: str | None = None, role: str | None = None
+) -> SelectOfScalar[TeamMate]:
+    # Batch-load the users of the whole page in one query, limited to the
+    # columns `UserRead` serializes
+    stmt = (
+        select(TeamMate)
+        .where(TeamMate.team_id == team_id)
+        .options(
+            selectinload(TeamMate.user).load_only(  # type: ignore
+                User.id, User.fullname, User.email, User.username  # type: ignore
+            )
+        )
+    )
 
     if role:
         stmt = stmt.where(TeamMate.role == role)
 
     if search:
-        stmt = stmt.join(User).where(
-            (User.email.ilike(f"%{search}%")) | (User.name.ilike(f"%{search}%"))
+        stmt = (
+            stmt.join(User)
+            .where(
+                search_filter(User.email, search)
+                | search_filter(User.fullname, search)
+            )
+            .order_by(
+                (
+                    search_rank(User.fullname, search)
+                    + search_rank(User.email, search)
+                ).desc()
+            )
         )
 
+    return stmt
+
+
+def read_team_members_by_team_id(
+    session: Session, team_id: UUID, search: str | None = None, role: str | None = None
+) -> Sequence[TeamMate]:
+    stmt = select_team_members_by_team_id(team_id=team_id, search=search, role=role)
     return session.exec(stmt).all()
 
 
+def select_team_access(team_id: UUID, user_id: UUID) -> SelectOfScalar[UUID]:
+    """
+    Selects the team if the user owns it or is one of its members.
+    """
+    is_member = (
+        select(TeamMate.id)
+        .where(TeamMate.team_id == team_id, TeamMate.user_id == user_id)
+        .exists()
+    )
+    return select(Team.id).where(
+        Team.id == team_id, or_(Team.owner_id == user_id, is_member)
+    )
+
+
+def has_team_access(session: Session, team_id: UUID, user_id: UUID) -> bool:
+    return session.exec(select_team_access(team_id=team_id, user_id=user_id)).first() is not None
+
+
+def read_team_user_ids(session: Session, team_id: UUID, user_ids: Iterable[UUID]) -> Set[UUID]:
+    """
+    Returns the users among `user_ids` who own the team or are one of its members.
+    """
+    user_ids = list(user_ids)
+    members = session.exec(
+        select(TeamMate.user_id).where(
+            TeamMate.team_id == team_id, TeamMate.user_id.in_(user_ids)  # type: ignore[union-attr]
+        )
+    ).all()
+    owners = session.exec(
+        select(Team.owner_id).where(Team.id == team_id, Team.owner_id.in_(user_ids))  # type: ignore[attr-defined]
+    ).all()
+    return {*members, *owners}  # type: ignore[misc]
+
+
 def read_member_by_email(session: Session, team_id: UUID, member_email: str):
     query = select(TeamMate).join(User).where(
         User.email == member_email,
@@ -32,6 +96,15 @@ def read_member_by_email(session: Session, team_id: UUID, member_email: str):
     return session.exec(query).first()
 
 
+def read_member_emails(
+    session: Session, team_id: UUID, emails: Iterable[str]
+) -> Set[str]:
+    query = select(User.email).join(TeamMate).where(
+        TeamMate.team_id == team_id, User.email.in_(list(emails))
+    )
+    return set(session.exec(query).all())
+
+
 def create_member(session: Session, team_id: UUID, user_id: UUID, role: TeamMateRole):
     member = TeamMate(
         team_id=team_id,
@@ -40,6 +113,11 @@ def create_member(session: Session, team_id: UUID, user_id: UUID, role: TeamMate
     )
 
     session.add(member)
+    session.exec(
+        update(Team)
+        .where(Team.id == team_id)
+        .values(members_count=Team.members_count + 1)
+    )
     session.commit()
     session.refresh(member)
     return member
@@ -1,4 +1,5 @@
 ﻿from app.models import user, team, task, message, auth  # import all models
+from app.db import search  # registers the search index DDL
 from sqlmodel import SQLModel
 
 SQLModelMeta = SQLModel
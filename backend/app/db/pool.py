@@ -0,0 +1,126 @@
+"""
+Connection pool configuration and instrumentation for the database engines
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+
+
+class PoolMetrics:
+    """
+    Counters collected for a single connection pool.
+
+    Attributes:
+        acquisitions (int): Number of connections handed out by the pool.
+        timeouts (int): Number of checkouts that gave up after `DB_POOL_TIMEOUT`.
+        connects (int): Number of new DBAPI connections opened.
+        wait_time (Histogram): Time spent waiting for a connection, in seconds.
+    """
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.wait_time = Histogram()
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times every checkout of the pool and keeps the metrics across `recreate()`
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)  # type: ignore[call-arg]
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+    def _create_connection(self):
+        self.metrics.increment("connects")
+        return super()._create_connection()  # type: ignore[misc]
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.metrics.increment("timeouts")
+            raise
+        finally:
+            self.metrics.wait_time.observe(time.perf_counter() - started)
+        self.metrics.increment("acquisitions")
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_options(database_url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Returns the `create_engine` pool arguments built from the `DB_POOL_*` settings.
+
+    In-memory SQLite databases keep SQLAlchemy's single-connection pool, since a
+    queue of independent connections would each see an empty database.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def get_pool_stats(pool: Pool) -> Dict[str, Any]:
+    """
+    Returns the live state of the pool along with its collected metrics.
+    """
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    stats: Dict[str, Any] = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics:
+        stats.update(
+            acquisitions=metrics.acquisitions,
+            timeouts=metrics.timeouts,
+            connects=metrics.connects,
+            wait_time=metrics.wait_time.snapshot(),
+        )
+    return stats
+
@@ -0,0 +1,140 @@
+"""
+Indexed substring search for the `search` filters of the list endpoints.
+
+On Postgres, `ILIKE '%term%'` is served by the pg_trgm GIN indexes declared on
+the models. SQLite has no trigram operator class, so every searchable column
+gets an FTS5 table with the `trigram` tokenizer, kept in sync by triggers,
+and the filter is rewritten into a rowid lookup on that table.
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, List, Tuple
+
+from sqlalchemy import DDL, case, column, event, func, literal_column, select, table
+from sqlalchemy.engine import Connection, make_url
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+
+# (table, column) pairs that can be searched by substring
+SEARCHABLE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("teams", "name"),
+    ("invitations", "email"),
+    ("users", "email"),
+    ("users", "fullname"),
+)
+
+
+@lru_cache
+def get_backend_name() -> str:
+    return make_url(settings.DATABASE_URL).get_backend_name()
+
+
+def _fts_table_name(table_name: str, column_name: str) -> str:
+    return f"{table_name}_{column_name}_search"
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_filter(col: Any, term: str):
+    """
+    Returns a `col contains term` (case-insensitive) clause that uses the
+    search index of the column on the current database.
+    """
+    expression = col.expression
+    table_name, column_name = expression.table.name, expression.name
+
+    # FTS5 only serves LIKE from the trigram index when there is no ESCAPE
+    # clause, so terms containing wildcards take the plain (scanning) path
+    if (
+        get_backend_name() == "sqlite"
+        and (table_name, column_name) in SEARCHABLE_COLUMNS
+        and _escape_like(term) == term
+    ):
+        fts = table(
+            _fts_table_name(table_name, column_name),
+            column("rowid"),
+            column(column_name),
+        )
+        matches = select(fts.c.rowid).where(fts.c[column_name].like(f"%{term}%"))
+        return literal_column(f"{table_name}.rowid").in_(matches)
+
+    return col.ilike(f"%{_escape_like(term)}%", escape="\\")
+
+
+def search_rank(col: Any, term: str):
+    """
+    Returns a relevance score of `col` for the term, higher is better.
+
+    Postgres uses trigram similarity; elsewhere exact matches rank above
+    prefix matches, which rank above any other substring match.
+    """
+    if get_backend_name() == "postgresql":
+        return func.similarity(col, term)
+
+    lowered, needle = func.lower(col), term.lower()
+    return case(
+        (lowered == needle, 3),
+        (lowered.like(f"{_escape_like(needle)}%", escape="\\"), 2),
+        else_=1,
+    )
+
+
+def _sqlite_search_ddl(table_name: str, column_name: str) -> List[str]:
+    fts = _fts_table_name(table_name, column_name)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_name}, content='{table_name}', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_name}) VALUES (new.rowid, new.{column_name}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_name}) "
+        f"VALUES ('delete', old.rowid, old.{column_name}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_name} ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_name}) "
+        f"VALUES ('delete', old.rowid, old.{column_name}); "
+        f"INSERT INTO {fts}(rowid, {column_name}) VALUES (new.rowid, new.{column_name}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def sqlite_search_ddl(
+    columns: Iterable[Tuple[str, str]] = SEARCHABLE_COLUMNS,
+) -> List[str]:
+    """
+    Returns the statements creating (and populating) the SQLite FTS5 search tables.
+    """
+    return [
+        statement
+        for table_name, column_name in columns
+        for statement in _sqlite_search_ddl(table_name, column_name)
+    ]
+
+
+def rebuild_search_indexes(connection: Connection) -> None:
+    """
+    Rebuilds the SQLite search tables from their content tables.
+
+    The FTS5 tables reference rows by their implicit rowid, which a `VACUUM`
+    may renumber, so this must run after vacuuming a SQLite database.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for table_name, column_name in SEARCHABLE_COLUMNS:
+        fts = _fts_table_name(table_name, column_name)
+        connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+# Databases built with `create_all` (local SQLite, tests) get the same search
+# structures as the ones created by the migrations
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for _statement in sqlite_search_ddl():
+    event.listen(
+        SQLModel.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
@@ -1,8 +1,70 @@
-﻿from sqlmodel import create_engine, Session
+﻿from functools import lru_cache
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
+from app.db.pool import get_pool_options
+from app.db.slow_queries import watch_slow_queries
+
+# Async drivers used when ASYNC_DATABASE_URL is not set explicitly
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """
+    Returns the async database URL, derived from DATABASE_URL unless overridden
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+# The engines are created on first use rather than at import time
+@lru_cache
+def get_engine() -> Engine:
+    engine = create_engine(
+        settings.DATABASE_URL, echo=False, **get_pool_options(settings.DATABASE_URL)
+    )
+    watch_slow_queries(engine)
+    return engine
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    engine = create_async_engine(
+        get_async_database_url(),
+        echo=False,
+        **get_pool_options(get_async_database_url(), is_async=True),
+    )
+    watch_slow_queries(engine.sync_engine)
+    return engine
+
+
+async def dispose_engines() -> None:
+    """
+    Closes the pooled connections of the engines created so far.
+    """
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
 
-engine = create_engine(settings.DATABASE_URL, echo=False)
 
 def get_session():
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
+        yield session
+
+
+async def get_async_session():
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
         yield session
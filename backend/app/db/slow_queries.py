@@ -0,0 +1,226 @@
+"""
+Opt-in log of the slow queries run by the engines.
+
+Statements slower than `SLOW_QUERY_THRESHOLD_MS` are normalized into
+fingerprints (literals, bind parameters and IN lists replaced by
+placeholders), so the many instances of one query shape aggregate into one
+entry. For the slowest instances of each fingerprint the plan is captured
+with an `EXPLAIN` run on the same connection, right after the statement.
+"""
+
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+# pyformat, format, numeric ($1), named (:name, but not ::casts) and qmark styles
+_PARAMETERS = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# How each dialect explains a statement, without and with execution
+EXPLAIN_PREFIXES = {
+    "postgresql": ("EXPLAIN", "EXPLAIN ANALYZE"),
+    "mysql": ("EXPLAIN", "EXPLAIN ANALYZE"),
+    "sqlite": ("EXPLAIN QUERY PLAN", "EXPLAIN QUERY PLAN"),
+}
+
+# A failed statement aborts the whole transaction on these, so the EXPLAIN
+# runs in a savepoint
+SAVEPOINT_DIALECTS = {"postgresql"}
+
+EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalizes a statement so that the instances of one query shape compare
+    equal, e.g. `SELECT * FROM t WHERE id IN (1, 2)` -> `SELECT * FROM t WHERE id IN (...)`.
+    """
+    statement = _COMMENTS.sub(" ", statement)
+    statement = _STRINGS.sub("?", statement)
+    statement = _PARAMETERS.sub("?", statement)
+    statement = _NUMBERS.sub("?", statement)
+    statement = _IN_LISTS.sub("IN (...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class SlowQuery:
+    """
+    The aggregated instances of one fingerprint.
+
+    Attributes:
+        fingerprint (str): The normalized statement.
+        count (int): Slow instances recorded.
+        total_time (float): Their total duration, in seconds.
+        max_time (float): The duration of the slowest one, in seconds.
+        samples (list): The slowest instances, slowest first, each with its
+            statement, duration and plan.
+    """
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples: List[Dict[str, Any]] = []
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.count if self.count else 0.0,
+            "max_time": self.max_time,
+            "samples": [dict(sample) for sample in self.samples],
+        }
+
+
+class SlowQueryLog:
+    """
+    Records the statements of the watched engines running over a threshold.
+
+    Args:
+        threshold (float): The duration, in seconds, from which a statement is slow.
+        samples (int): The number of slowest instances kept (and explained)
+            per fingerprint.
+        max_fingerprints (int): The number of fingerprints tracked; slow
+            statements of new shapes past it are only counted as dropped.
+        analyze (bool): Whether SELECT plans are captured with `EXPLAIN ANALYZE`,
+            which runs the statement a second time.
+    """
+
+    def __init__(self, threshold: float, samples: int, max_fingerprints: int, analyze: bool):
+        self.threshold = threshold
+        self.max_samples = samples
+        self.max_fingerprints = max_fingerprints
+        self.analyze = analyze
+        self.queries: Dict[str, SlowQuery] = {}
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def watch(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    # The start time is kept on the execution context, which a failed
+    # statement (with no `after_cursor_execute`) does not outlive
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started_at = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started_at", None)
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+        if duration < self.threshold:
+            return
+
+        query = self._query(fingerprint(statement))
+        if query is None:
+            return
+        with self._lock:
+            query.count += 1
+            query.total_time += duration
+            query.max_time = max(query.max_time, duration)
+            is_sample = self.max_samples > 0 and (
+                len(query.samples) < self.max_samples
+                or duration > query.samples[-1]["duration"]
+            )
+        if not is_sample:
+            return
+
+        plan = None if executemany else self._explain(conn, statement, parameters)
+        with self._lock:
+            query.samples.append(
+                {
+                    "statement": statement,
+                    "duration": duration,
+                    "recorded_at": time.time(),
+                    "plan": plan,
+                }
+            )
+            query.samples.sort(key=lambda sample: sample["duration"], reverse=True)
+            del query.samples[self.max_samples :]
+
+    def _query(self, key: str) -> Optional[SlowQuery]:
+        with self._lock:
+            query = self.queries.get(key)
+            if query is None:
+                if len(self.queries) >= self.max_fingerprints:
+                    self.dropped += 1
+                    return None
+                query = self.queries[key] = SlowQuery(key)
+            return query
+
+    def _explain(self, conn: Connection, statement: str, parameters: Any) -> Optional[str]:
+        prefixes = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        match = EXPLAINABLE.match(statement)
+        if prefixes is None or match is None:
+            return None
+        # ANALYZE executes the statement again, which only plain reads are safe
+        # to do (a WITH may hide a data-modifying CTE)
+        analyze = self.analyze and match.group(1).upper() == "SELECT"
+        explain = f"{prefixes[analyze]} {statement}"
+
+        savepoint = conn.dialect.name in SAVEPOINT_DIALECTS
+        cursor = conn.connection.cursor()
+        try:
+            if savepoint:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(explain, parameters)
+                rows = cursor.fetchall()
+            except Exception as e:
+                if savepoint:
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                return f"EXPLAIN failed: {e}"
+            if savepoint:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return "\n".join(" | ".join(str(column) for column in row) for row in rows)
+        finally:
+            cursor.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            queries = [query.snapshot() for query in self.queries.values()]
+            dropped = self.dropped
+        queries.sort(key=lambda query: query["total_time"], reverse=True)
+        return {
+            "threshold": self.threshold,
+            "dropped": dropped,
+            "queries": queries,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.queries.clear()
+            self.dropped = 0
+
+
+@lru_cache
+def get_slow_query_log() -> SlowQueryLog:
+    return SlowQueryLog(
+        threshold=settings.SLOW_QUERY_THRESHOLD_MS / 1000,
+        samples=settings.SLOW_QUERY_SAMPLES,
+        max_fingerprints=settings.SLOW_QUERY_MAX_FINGERPRINTS,
+        analyze=settings.SLOW_QUERY_EXPLAIN_ANALYZE,
+    )
+
+
+def watch_slow_queries(engine: Engine) -> None:
+    """
+    Records the slow queries of the engine when `SLOW_QUERY_LOG_ENABLED` is set.
+    """
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        get_slow_query_log().watch(engine)
@@ -15,3 +15,18 @@ class Token(SQLModel, table=True):
     code: str = Field(index=True, unique=True)
     purpose: TokenPurpose
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
+
+
+class RevokedToken(SQLModel, table=True):
+    """
+    A refresh token that may no longer be used, identified by its `jti` claim.
+
+    Rows are only needed until the token itself expires.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    jti: str = Field(primary_key=True)
+    expires_at: datetime = Field(index=True)
+    revoked_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -1 +1,123 @@
-﻿
+﻿"""
+This module defines the SQLModel classes for the tasks of a team's Kanban board.
+
+It includes:
+- `TaskStatus`: The columns of the board.
+- `Task`: A card of the board, ordered within its column by a fractional rank.
+- `TaskCounter`: The number of tasks of a board per column and assignee.
+- `TaskChange`: An entry of a board's change log, read by syncing clients.
+"""
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlmodel import Field, Index, SQLModel
+
+
+class TaskStatus(str, PyEnum):
+    """
+    Enum that includes the columns of the Kanban board, in board order.
+
+    Attributes:
+        TODO (str): Tasks not started yet
+        IN_PROGRESS (str): Tasks being worked on
+        UAT (str): Tasks in user acceptance testing
+        DONE (str): Completed tasks
+    """
+
+    TODO = "TODO"
+    IN_PROGRESS = "IN_PROGRESS"
+    UAT = "UAT"
+    DONE = "DONE"
+
+
+class Task(SQLModel, table=True):
+    """
+    Represents a task of a team's Kanban board.
+
+    Attributes:
+        id (UUID): Unique identifier for the task.
+        team_id (UUID): Foreign key to the `Team` table, indicating the board of the task.
+        title (str): The title of the task.
+        description (Optional[str]): The description of the task, if any.
+        status (TaskStatus): The column of the board the task is in.
+        rank (str):
+            The fractional rank (see `app.core.ranking`) ordering the task within
+            its column; moving the task only rewrites its own rank.
+        assignee_id (Optional[UUID]): Foreign key to the `User` table, if the task is assigned.
+        created_by (UUID): Foreign key to the `User` table, indicating who created the task.
+        created_at (datetime): The timestamp when the task was created.
+        updated_at (datetime): The timestamp when the task was last changed.
+    """
+
+    __tablename__ = "tasks"  # type: ignore
+    __table_args__ = (
+        # Serves the ordered column reads and the neighbour lookups of a move
+        Index("ix_tasks_team_id_status_rank", "team_id", "status", "rank"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    team_id: UUID = Field(foreign_key="teams.id", ondelete="CASCADE")
+    title: str
+    description: Optional[str] = None
+    status: TaskStatus = Field(default=TaskStatus.TODO)
+    rank: str
+    assignee_id: Optional[UUID] = Field(
+        default=None, foreign_key="users.id", ondelete="SET NULL", index=True
+    )
+    created_by: UUID = Field(foreign_key="users.id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# Stands for "no assignee" in `TaskCounter`, whose key columns cannot be null
+UNASSIGNED = UUID(int=0)
+
+
+class TaskCounter(SQLModel, table=True):
+    """
+    The number of tasks of a board in one column and assigned to one user,
+    maintained in the transaction of every task write (see `app.crud.task_counter`).
+
+    Attributes:
+        team_id (UUID): Foreign key to the `Team` table, indicating the board.
+        status (TaskStatus): The column of the board.
+        assignee_id (UUID): The assignee of the tasks, `UNASSIGNED` for the unassigned ones.
+        count (int): The number of tasks.
+    """
+
+    __tablename__ = "task_counters"  # type: ignore
+
+    team_id: UUID = Field(foreign_key="teams.id", ondelete="CASCADE", primary_key=True)
+    status: TaskStatus = Field(primary_key=True)
+    assignee_id: UUID = Field(primary_key=True)
+    count: int = Field(default=0)
+
+
+class TaskChange(SQLModel, table=True):
+    """
+    Records that a task of a board changed (or was deleted) in a version of
+    the board. Rows are only ever appended, and pruned once older than
+    `TASK_CHANGE_RETENTION_DAYS`.
+
+    Attributes:
+        id (int): Unique identifier for the entry.
+        team_id (UUID): Foreign key to the `Team` table, indicating the board.
+        seq (int): The board version (`Team.board_version`) the change was made in.
+        task_id (UUID): The task that changed; not a foreign key, as it outlives deletions.
+        changed_at (datetime): The timestamp of the change.
+    """
+
+    __tablename__ = "task_changes"  # type: ignore
+    __table_args__ = (
+        # Serves the "changes since" reads of a board
+        Index("ix_task_changes_team_id_seq", "team_id", "seq"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    team_id: UUID = Field(foreign_key="teams.id", ondelete="CASCADE")
+    seq: int
+    task_id: UUID
+    changed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -63,7 +63,7 @@ class Invitation(SQLModel, table=True):
     token: str = Field(default_factory=lambda: uuid4().hex, unique=True, index=True)
     invited_at: datetime = Field(default_factory=datetime.utcnow)
     expiration_date: datetime = Field(
-        default_factory=lambda: datetime.utcnow() + timedelta(days=3)
+        default_factory=lambda: datetime.utcnow() + timedelta(days=3), index=True
     )
     is_cancelled: bool = Field(default=False)
     is_accepted: bool = Field(default=False)
@@ -112,6 +112,10 @@ class Team(SQLModel, table=True):
         code (str): A unique code associated with the team.
         owner_id (UUID): Foreign key to the `User` table, indicating the owner of the team.
         created_at (datetime): The timestamp when the team was created.
+        members_count (int):
+            Number of members in the team, maintained alongside `TeamMate` writes.
+        board_version (int):
+            Version of the team's Kanban board, bumped alongside every `Task` write.
         members (List[TeamMate]): A list of TeamMate objects associated with this team.
         invitations (List[Invitation]): A list of Invitation objects associated with this team.
     """
@@ -123,17 +127,30 @@ class Team(SQLModel, table=True):
     code: str = Field(index=True)
     owner_id: UUID = Field(foreign_key="users.id", index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    members_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    board_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     members: List[TeamMate] = Relationship(back_populates="team")
     invitations: List[Invitation] = Relationship(back_populates="team")
 
-    @property
-    def members_count(self) -> int:
-        return len(self.members)
-
 Index(
     "uq_owner_team_name_insensitive",
     Team.__table__.c.owner_id, # type: ignore
     func.lower(Team.__table__.c.name), # type: ignore
     unique=True
-)
\ No newline at end of file
+)
+
+# Trigram indexes serving the `ILIKE '%...%'` search filters on Postgres
+Index(
+    "ix_teams_name_trgm",
+    Team.__table__.c.name, # type: ignore
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+Index(
+    "ix_invitations_email_trgm",
+    Invitation.__table__.c.email, # type: ignore
+    postgresql_using="gin",
+    postgresql_ops={"email": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
-from sqlmodel import Field, SQLModel, UniqueConstraint, Relationship
+from sqlmodel import Field, Index, SQLModel, UniqueConstraint, Relationship
 from uuid import UUID
 
 
@@ -18,6 +18,19 @@ class User(UserBase, table=True):
     __table_args__ = (
         UniqueConstraint("email"),
         UniqueConstraint("username"),
+        # Trigram indexes serving the `ILIKE '%...%'` search filters on Postgres
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_fullname_trgm",
+            "fullname",
+            postgresql_using="gin",
+            postgresql_ops={"fullname": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     id: UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
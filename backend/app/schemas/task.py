@@ -1 +1,152 @@
-﻿
+﻿from datetime import datetime
+from typing import Annotated, Dict, List, Literal, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.task import TaskStatus
+
+
+class TaskPosition(BaseModel):
+    """
+    Where a task goes in its column: right after `after_id`, right before
+    `before_id`, or at the bottom of the column when neither is given.
+    """
+
+    after_id: Optional[UUID] = None
+    before_id: Optional[UUID] = None
+
+
+class TaskCreateRequest(TaskPosition):
+    title: str = Field(min_length=1, max_length=200)
+    description: Optional[str] = None
+    status: TaskStatus = TaskStatus.TODO
+    assignee_id: Optional[UUID] = None
+
+
+class TaskUpdateRequest(BaseModel):
+    # Only the fields present in the request are changed; an explicit null
+    # assignee unassigns the task
+    title: Optional[str] = Field(default=None, min_length=1, max_length=200)
+    description: Optional[str] = None
+    assignee_id: Optional[UUID] = None
+
+
+class TaskMoveRequest(TaskPosition):
+    status: TaskStatus
+
+
+class TaskResponse(BaseModel):
+    id: UUID
+    team_id: UUID
+    title: str
+    description: Optional[str]
+    status: TaskStatus
+    rank: str
+    assignee_id: Optional[UUID]
+    created_by: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TaskAssignee(BaseModel):
+    id: UUID
+    fullname: str
+    username: str
+
+
+class BoardTaskResponse(TaskResponse):
+    assignee: Optional[TaskAssignee] = None
+
+
+class BoardColumn(BaseModel):
+    status: TaskStatus
+    tasks: List[BoardTaskResponse]
+
+
+class BoardResponse(BaseModel):
+    team_id: UUID
+    version: int
+    columns: List[BoardColumn]
+
+
+class TaskBatchCreate(TaskCreateRequest):
+    op: Literal["create"]
+
+
+class TaskBatchMove(TaskMoveRequest):
+    op: Literal["move"]
+    task_id: UUID
+
+
+class TaskBatchAssign(BaseModel):
+    op: Literal["assign"]
+    task_id: UUID
+    assignee_id: Optional[UUID]
+
+
+class TaskBatchDelete(BaseModel):
+    op: Literal["delete"]
+    task_id: UUID
+
+
+TaskBatchOperation = Annotated[
+    Union[TaskBatchCreate, TaskBatchMove, TaskBatchAssign, TaskBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class TaskBatchRequest(BaseModel):
+    operations: List[TaskBatchOperation] = Field(min_length=1)
+
+
+class TaskBatchResult(BaseModel):
+    index: int
+    op: str
+    success: bool
+    reason: str = ""
+    task_id: Optional[UUID] = None
+    task: Optional[TaskResponse] = None
+
+
+class TaskBatchResponse(BaseModel):
+    version: int
+    results: List[TaskBatchResult]
+
+
+class TaskChangeResponse(BaseModel):
+    task_id: UUID
+    deleted: bool
+    task: Optional[BoardTaskResponse] = None
+
+
+class TaskChangesResponse(BaseModel):
+    team_id: UUID
+    since: int
+    version: int
+    changes: List[TaskChangeResponse]
+
+
+class TaskCounts(BaseModel):
+    total: int = 0
+    by_status: Dict[TaskStatus, int] = Field(
+        default_factory=lambda: dict.fromkeys(TaskStatus, 0)
+    )
+
+    def add(self, status: TaskStatus, count: int) -> None:
+        self.total += count
+        self.by_status[status] += count
+
+
+class AssigneeTaskCounts(TaskCounts):
+    assignee: TaskAssignee
+
+
+class TaskStatsResponse(BaseModel):
+    team_id: UUID
+    tasks: TaskCounts
+    unassigned: TaskCounts
+    assignees: List[AssigneeTaskCounts]
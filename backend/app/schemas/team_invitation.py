@@ -10,7 +10,8 @@ from app.schemas.user import UserRead
 
 class InvitationResponse(BaseModel):
     id: UUID
-    email: EmailStr
+    # Already validated on the way in; EmailStr would re-check every row of a page
+    email: str
     role: TeamMateRole
     invitor: UserRead
     invited_at: datetime
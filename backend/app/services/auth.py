@@ -1,7 +1,7 @@
 import secrets
 from uuid import uuid4
-from datetime import timedelta, datetime
-from app.core.email import render_template, send_email
+from datetime import datetime
+from app.core.email import get_partial_template, send_email
 from app.core.exceptions import JSONException
 from app.crud.auth import (
     get_token_by_user_id,
@@ -17,14 +17,12 @@ from app.core.config import settings
 from app.core.security import hash_password
 
 
-RESET_TOKEN_EXPIRY_MINUTES = settings.RESET_PASSWORD_TOKEN_EXPIRY_MINUTES
-EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS = settings.EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS
-
-
 def send_verification_email(to_email: str, token_code: str):
     verify_link = f"{settings.FRONTEND_DOMAIN}verify-email?token={token_code}"
 
-    html_body = render_template("verify_email.html", verify_link=verify_link)
+    html_body = get_partial_template("verify_email.html", "verify_link").render(
+        verify_link=verify_link
+    )
 
     subject = "[TeamTact] Verify your email address"
     send_email(subject=subject, to_email=to_email, html_body=html_body)
@@ -33,7 +31,9 @@ def send_verification_email(to_email: str, token_code: str):
 def send_reset_password_email(to_email: str, token_code: str):
     reset_link = f"{settings.FRONTEND_DOMAIN}reset-password?token={token_code}"
 
-    html_body = render_template("password_reset.html", reset_link=reset_link)
+    html_body = get_partial_template("password_reset.html", "reset_link").render(
+        reset_link=reset_link
+    )
 
     subject = "[TeamTact] Reset your password"
     send_email(subject=subject, to_email=to_email, html_body=html_body)
@@ -56,9 +56,7 @@ def reset_password(session, code: str, new_password: str) -> bool:
         return False
 
     # Expiry check
-    if datetime.utcnow() - token.created_at > timedelta(
-        minutes=RESET_TOKEN_EXPIRY_MINUTES
-    ):
+    if token.expires_at <= datetime.utcnow():
         delete_token(session, token)
         return False
 
@@ -80,9 +78,7 @@ def validate_reset_password_token(code, session):
         return False
 
     # Expiry check
-    if datetime.utcnow() - token.created_at > timedelta(
-        minutes=RESET_TOKEN_EXPIRY_MINUTES
-    ):
+    if token.expires_at <= datetime.utcnow():
         delete_token(session, token)
         return False
 
@@ -102,9 +98,7 @@ def verify_email_verification_token(token: str, session):
         return False
 
     # Expiry Check
-    if datetime.utcnow() - verification_token.created_at > timedelta(
-        hours=EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS
-    ):
+    if verification_token.expires_at <= datetime.utcnow():
         delete_token(session, verification_token)
         return False
 
@@ -0,0 +1,91 @@
+"""
+Resolves the `User` behind an authenticated request.
+
+Users are served from a TTL cache shared by every request of the process, so
+authenticated paths do not need a round trip to load the current user. The
+cache holds plain column snapshots that are re-attached to the caller's session
+without a query, and an entry is dropped as soon as a transaction that updated
+or deleted the row commits.
+"""
+
+from functools import lru_cache
+from typing import Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as ORMSession, make_transient_to_detached
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.crud import auth as auth_crud
+from app.crud.aio import auth as aio_auth_crud
+from app.models.user import User
+
+
+@lru_cache
+def get_user_cache() -> LRUCache:
+    return LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def _cache_user(user: User) -> None:
+    get_user_cache().set(user.id, user.model_dump())
+
+
+def _attach(session: Session, snapshot: dict) -> User:
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return session.merge(user, load=False)
+
+
+def load_user(session: Session, user_id: UUID) -> Optional[User]:
+    """
+    Returns the user with the given id, from the cache when possible.
+    """
+    snapshot = get_user_cache().get(user_id)
+    if snapshot is not None:
+        return _attach(session, snapshot)
+
+    user = auth_crud.get_user_by_id(session, user_id)
+    if user:
+        _cache_user(user)
+    return user
+
+
+async def load_user_async(session: AsyncSession, user_id: UUID) -> Optional[User]:
+    """
+    The `load_user` counterpart for an `AsyncSession`.
+    """
+    snapshot = get_user_cache().get(user_id)
+    if snapshot is not None:
+        return _attach(session.sync_session, snapshot)
+
+    user = await aio_auth_crud.get_user_by_id(session, user_id)
+    if user:
+        _cache_user(user)
+    return user
+
+
+def _changed_user_ids(session: ORMSession) -> Set[UUID]:
+    return session.info.setdefault("changed_user_ids", set())
+
+
+@event.listens_for(ORMSession, "after_flush")
+def _collect_changed_users(session: ORMSession, _flush_context) -> None:
+    for instance in (*session.dirty, *session.deleted):
+        if isinstance(instance, User):
+            _changed_user_ids(session).add(instance.id)
+
+
+@event.listens_for(ORMSession, "after_commit")
+def _invalidate_changed_users(session: ORMSession) -> None:
+    # Invalidating only once the change is visible keeps a concurrent request
+    # from caching the row as it was before this transaction
+    for user_id in session.info.pop("changed_user_ids", ()):
+        get_user_cache().discard(user_id)
+
+
+@event.listens_for(ORMSession, "after_soft_rollback")
+def _forget_changed_users(session: ORMSession, _previous_transaction) -> None:
+    session.info.pop("changed_user_ids", None)
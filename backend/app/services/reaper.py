@@ -0,0 +1,153 @@
+"""
+Periodic clean-up of expired auth tokens, invitations, token revocations and
+task change log entries.
+
+Expired rows are deleted in batches of at most `REAPER_BATCH_SIZE` rows, each
+in its own short transaction, so the reaper never holds locks on a large part
+of a table and interleaves with the regular traffic.
+"""
+
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+from app.crud.auth import delete_expired_revocations, delete_expired_tokens
+from app.crud.task import delete_expired_task_changes
+from app.crud.team_invitation import delete_expired_invitations
+from app.db.session import get_engine
+
+
+# The expired rows of each table, and how to delete one batch of them
+REAPED_TABLES: Dict[str, Callable[[Session, datetime, int], int]] = {
+    "tokens": delete_expired_tokens,
+    "invitations": delete_expired_invitations,
+    "revoked_tokens": delete_expired_revocations,
+    "task_changes": delete_expired_task_changes,
+}
+
+
+class ReaperMetrics:
+    """
+    Counters describing the work done by the reaper.
+
+    Attributes:
+        runs (int): Completed reaping runs.
+        failures (int): Runs aborted by a database error.
+        deleted (dict): Expired rows deleted overall, per table.
+        last_run (dict): Rows reclaimed by the latest run, per table.
+        run_duration (Histogram): Duration of each run, in seconds.
+    """
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.deleted: Dict[str, int] = dict.fromkeys(REAPED_TABLES, 0)
+        self.last_run: Dict[str, int] = dict.fromkeys(REAPED_TABLES, 0)
+        self.run_duration = Histogram()
+        self._lock = threading.Lock()
+
+    def record_run(self, reclaimed: Dict[str, int], duration: float) -> None:
+        with self._lock:
+            self.runs += 1
+            for table_name, count in reclaimed.items():
+                self.deleted[table_name] += count
+            self.last_run = reclaimed
+        self.run_duration.observe(duration)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "failures": self.failures,
+                "deleted": dict(self.deleted),
+                "last_run": dict(self.last_run),
+                "run_duration": self.run_duration.snapshot(),
+            }
+
+
+class ExpiredRowReaper:
+    """
+    Deletes the expired rows of `REAPED_TABLES` every `interval` seconds from a
+    background thread.
+
+    Args:
+        interval (float): Seconds between two runs; 0 disables the reaper.
+        batch_size (int): The maximum number of rows deleted per transaction.
+        batch_pause (float): Seconds to wait between two batches of a run.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        batch_size: int,
+        batch_pause: float,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.metrics = ReaperMetrics()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="expired-row-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _reap(self, delete_batch: Callable[[Session, datetime, int], int], now: datetime) -> int:
+        reclaimed = 0
+        while not self._stopped.is_set():
+            with Session(get_engine()) as session:
+                deleted = delete_batch(session, now, self.batch_size)
+            reclaimed += deleted
+            if deleted < self.batch_size:
+                break
+            self._stopped.wait(self.batch_pause)
+        return reclaimed
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Reaps every expired row once and returns the rows reclaimed per table.
+        """
+        started, now = time.perf_counter(), datetime.utcnow()
+        reclaimed = {
+            table_name: self._reap(delete_batch, now)
+            for table_name, delete_batch in REAPED_TABLES.items()
+        }
+        self.metrics.record_run(reclaimed, time.perf_counter() - started)
+        return reclaimed
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                self.metrics.record_failure()
+                print(f"Reaper run failed: {e}")
+
+
+@lru_cache
+def get_reaper() -> ExpiredRowReaper:
+    return ExpiredRowReaper(
+        interval=settings.REAPER_INTERVAL_SECONDS,
+        batch_size=settings.REAPER_BATCH_SIZE,
+        batch_pause=settings.REAPER_BATCH_PAUSE_SECONDS,
+    )
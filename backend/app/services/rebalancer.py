@@ -0,0 +1,141 @@
+"""
+Background rebalancing of the task ranks of a Kanban column.
+
+Fractional ranks grow when tasks are repeatedly dropped between the same two
+neighbours. A move producing a rank longer than `TASK_RANK_MAX_LENGTH` flags
+its column, and the rebalancer later rewrites the ranks of the flagged columns
+to short, evenly spread ones, in one transaction per column.
+"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Set, Tuple
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+from app.core.ranking import spread_ranks
+from app.crud.task import lock_board, read_column_for_update, update_ranks
+from app.db.session import get_engine
+from app.models.task import TaskStatus
+
+Column = Tuple[UUID, TaskStatus]
+
+
+class RankRebalancer:
+    """
+    Rebalances the flagged columns every `interval` seconds from a background thread.
+
+    Args:
+        interval (float): Seconds between two runs; 0 disables the rebalancer.
+        max_length (int): The rank length past which a column gets rebalanced.
+    """
+
+    def __init__(self, interval: float, max_length: int):
+        self.interval = interval
+        self.max_length = max_length
+        self.columns = 0
+        self.rewritten = 0
+        self.failures = 0
+        self.run_duration = Histogram()
+        self._pending: Set[Column] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self, team_id: UUID, status: TaskStatus, rank: str) -> None:
+        """
+        Flags the column for rebalancing if the rank given to one of its tasks
+        grew too long.
+        """
+        if len(rank) > self.max_length:
+            with self._lock:
+                self._pending.add((team_id, status))
+
+    def rebalance(self, team_id: UUID, status: TaskStatus) -> int:
+        """
+        Rewrites the ranks of a column, returning the number of tasks changed.
+        """
+        with Session(get_engine()) as session:
+            # The board lock comes first, as for every other writer of the
+            # board, so a concurrent move cannot deadlock with the rebalance
+            lock_board(session, team_id)
+            tasks = read_column_for_update(session, team_id, status)
+            ranks = [
+                {"id": task.id, "rank": rank}
+                for task, rank in zip(tasks, spread_ranks(len(tasks)))
+                if task.rank != rank
+            ]
+            if ranks:
+                update_ranks(session, team_id, ranks)
+        return len(ranks)
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Rebalances every flagged column once.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, set()
+
+        started, rewritten = time.perf_counter(), 0
+        failed: Set[Column] = set()
+        error: Exception | None = None
+        for team_id, status in pending:
+            try:
+                rewritten += self.rebalance(team_id, status)
+            except Exception as e:
+                failed.add((team_id, status))
+                error = e
+
+        with self._lock:
+            # Failed columns are retried on the next run
+            self._pending |= failed
+            self.columns += len(pending) - len(failed)
+            self.rewritten += rewritten
+        self.run_duration.observe(time.perf_counter() - started)
+        if error is not None:
+            raise error
+        return {"columns": len(pending), "rewritten": rewritten}
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="rank-rebalancer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                with self._lock:
+                    self.failures += 1
+                print(f"Rank rebalancing failed: {e}")
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "columns": self.columns,
+                "rewritten": self.rewritten,
+                "failures": self.failures,
+                "run_duration": self.run_duration.snapshot(),
+            }
+
+
+@lru_cache
+def get_rank_rebalancer() -> RankRebalancer:
+    return RankRebalancer(
+        interval=settings.TASK_REBALANCE_INTERVAL_SECONDS,
+        max_length=settings.TASK_RANK_MAX_LENGTH,
+    )
@@ -0,0 +1,135 @@
+"""
+Revocation of refresh tokens.
+
+Revoked `jti`s are stored in the indexed `revoked_tokens` table and mirrored
+into an in-memory Bloom filter. A token absent from the filter is known not to
+be revoked, so the common case needs no round trip; only filter hits are
+confirmed against the table.
+
+Revocations made by other processes reach the filter through a background
+sync every `REVOCATION_SYNC_SECONDS`.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.crud import auth as auth_crud
+from app.crud.aio import auth as aio_auth_crud
+from app.db.session import get_engine
+
+
+class RevocationStore:
+    """
+    Answers whether a refresh token was revoked.
+
+    Args:
+        capacity (int): The number of live revocations the filter is sized for;
+            past it, the filter is rebuilt from the table with twice the room.
+        error_rate (float): The false positive rate of the filter at capacity.
+        sync_interval (float): Seconds between two syncs with the table.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_interval: float,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.filter = BloomFilter(capacity, error_rate)
+        self.lookups = 0
+        self.confirmations = 0
+        self._synced_at: datetime | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def load(self) -> None:
+        """
+        (Re)builds the filter from every live revocation in the table.
+        """
+        synced_at = datetime.utcnow()
+        with Session(get_engine()) as session:
+            jtis = auth_crud.read_revoked_jtis(session)
+
+        capacity = max(self.capacity, len(jtis) * 2)
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self.filter, self._synced_at = bloom, synced_at
+
+    def sync(self) -> None:
+        """
+        Adds the revocations recorded since the previous sync to the filter.
+        """
+        if self._synced_at is None or self.filter.is_saturated:
+            return self.load()
+
+        synced_at = datetime.utcnow()
+        # Overlap the previous window to tolerate clock skew between processes
+        since = self._synced_at - timedelta(seconds=self.sync_interval)
+        with Session(get_engine()) as session:
+            for jti in auth_crud.read_revoked_jtis(session, since=since):
+                self.filter.add(jti)
+        self._synced_at = synced_at
+
+    def start(self) -> None:
+        self.load()
+        if self.sync_interval <= 0 or self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="revocation-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.sync_interval):
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"Revocation sync failed: {e}")
+
+    async def is_revoked(self, session: AsyncSession, jti: str) -> bool:
+        self.lookups += 1
+        if not self.filter.might_contain(jti):
+            return False
+        self.confirmations += 1
+        return await aio_auth_crud.is_token_revoked(session, jti)
+
+    async def revoke(self, session: AsyncSession, jti: str, exp: int) -> bool:
+        """
+        Revokes the token, returning False when it had already been revoked.
+        """
+        expires_at = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None)
+        self.filter.add(jti)
+        return await aio_auth_crud.revoke_token(session, jti, expires_at)
+
+    def snapshot(self):
+        return {
+            "lookups": self.lookups,
+            "confirmations": self.confirmations,
+            "filter_items": self.filter.count,
+            "filter_capacity": self.filter.capacity,
+            "filter_bits": self.filter.size,
+        }
+
+
+@lru_cache
+def get_revocation_store() -> RevocationStore:
+    return RevocationStore(
+        capacity=settings.REVOCATION_BLOOM_CAPACITY,
+        error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+        sync_interval=settings.REVOCATION_SYNC_SECONDS,
+    )
@@ -0,0 +1,229 @@
+"""
+The tasks of a team's Kanban board.
+
+Tasks are ordered within their column by fractional ranks (see
+`app.core.ranking`): placing a task computes a rank between its new neighbours
+from at most two indexed lookups, and only the task's own row is written.
+"""
+
+from typing import Dict, List
+from uuid import UUID
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.core.exceptions import JSONException
+from app.core.ranking import rank_between
+from app.crud.aio import task as aio_task_crud
+from app.crud.aio import team_member as aio_team_member_crud
+from app.crud.task import (
+    create_task,
+    delete_task,
+    lock_board,
+    read_next_rank,
+    read_previous_rank,
+    read_task,
+    read_task_rank,
+    select_tasks_by_team,
+    update_task,
+)
+from app.crud.team_member import has_team_access
+from app.models.task import Task, TaskStatus
+from app.schemas.task import (
+    BoardColumn,
+    BoardResponse,
+    BoardTaskResponse,
+    TaskAssignee,
+    TaskChangeResponse,
+    TaskChangesResponse,
+    TaskCreateRequest,
+    TaskMoveRequest,
+    TaskPosition,
+    TaskUpdateRequest,
+)
+from app.services.rebalancer import get_rank_rebalancer
+
+
+def ensure_team_access(session: Session, team_id: UUID, user_id: UUID) -> None:
+    if not has_team_access(session=session, team_id=team_id, user_id=user_id):
+        raise JSONException(status_code=404, message="Team not found")
+
+
+async def ensure_team_access_async(session: AsyncSession, team_id: UUID, user_id: UUID) -> None:
+    if not await aio_team_member_crud.has_team_access(
+        session=session, team_id=team_id, user_id=user_id
+    ):
+        raise JSONException(status_code=404, message="Team not found")
+
+
+def _ensure_assignable(session: Session, team_id: UUID, assignee_id: UUID | None) -> None:
+    if assignee_id and not has_team_access(session=session, team_id=team_id, user_id=assignee_id):
+        raise JSONException(status_code=400, message="The assignee is not a member of this team")
+
+
+def _rank_for(
+    session: Session, team_id: UUID, status: TaskStatus, position: TaskPosition
+) -> str:
+    """
+    Computes the rank placing a task at `position` in the column, with the
+    board locked (see `lock_board`).
+    """
+    if position.after_id:
+        lower = read_task_rank(session, team_id, status, position.after_id)
+        if lower is None:
+            raise JSONException(status_code=400, message="The task to place after is not in this column")
+        # Skipping ranks equal to `lower` keeps the order valid when two
+        # concurrent moves produced the same rank
+        upper = read_next_rank(session, team_id, status, lower)
+    elif position.before_id:
+        upper = read_task_rank(session, team_id, status, position.before_id)
+        if upper is None:
+            raise JSONException(status_code=400, message="The task to place before is not in this column")
+        lower = read_previous_rank(session, team_id, status, upper)
+    else:
+        lower, upper = read_previous_rank(session, team_id, status), None
+
+    rank = rank_between(lower, upper)
+    get_rank_rebalancer().check(team_id, status, rank)
+    return rank
+
+
+def add_task(session: Session, team_id: UUID, user_id: UUID, payload: TaskCreateRequest) -> Task:
+    ensure_team_access(session=session, team_id=team_id, user_id=user_id)
+    _ensure_assignable(session=session, team_id=team_id, assignee_id=payload.assignee_id)
+    lock_board(session=session, team_id=team_id)
+    task = Task(
+        team_id=team_id,
+        title=payload.title,
+        description=payload.description,
+        status=payload.status,
+        rank=_rank_for(session, team_id, payload.status, payload),
+        assignee_id=payload.assignee_id,
+        created_by=user_id,
+    )
+    return create_task(session=session, task=task)
+
+
+def get_task(session: Session, team_id: UUID, task_id: UUID) -> Task:
+    task = read_task(session=session, team_id=team_id, task_id=task_id)
+    if not task:
+        raise JSONException(status_code=404, message="Task not found")
+    return task
+
+
+def get_tasks_query(
+    team_id: UUID, status: TaskStatus | None = None, assignee_id: UUID | None = None
+) -> SelectOfScalar[Task]:
+    return select_tasks_by_team(team_id=team_id, status=status, assignee_id=assignee_id)
+
+
+async def get_board_version(session: AsyncSession, team_id: UUID, user_id: UUID) -> int:
+    version = await aio_task_crud.read_board_version(
+        session=session, team_id=team_id, user_id=user_id
+    )
+    if version is None:
+        raise JSONException(status_code=404, message="Team not found")
+    return version
+
+
+def board_etag(team_id: UUID, version: int) -> str:
+    return f'"{team_id.hex}.{version}"'
+
+
+def _board_task(task: Task, fullname: str | None, username: str | None) -> BoardTaskResponse:
+    item = BoardTaskResponse.model_validate(task)
+    if task.assignee_id:
+        item.assignee = TaskAssignee(id=task.assignee_id, fullname=fullname, username=username)
+    return item
+
+
+async def get_board(session: AsyncSession, team_id: UUID, version: int) -> BoardResponse:
+    """
+    Builds the whole board of a team from a single query.
+
+    The version is read before the tasks, so a write landing in between makes
+    the snapshot newer than its version, never older: the next conditional
+    request then misses and fetches the board again.
+    """
+    columns: Dict[TaskStatus, List[BoardTaskResponse]] = {status: [] for status in TaskStatus}
+    for task, fullname, username in await aio_task_crud.read_board(session=session, team_id=team_id):
+        columns[task.status].append(_board_task(task, fullname, username))
+
+    return BoardResponse(
+        team_id=team_id,
+        version=version,
+        columns=[BoardColumn(status=status, tasks=tasks) for status, tasks in columns.items()],
+    )
+
+
+async def get_board_changes(
+    session: AsyncSession, team_id: UUID, user_id: UUID, since: int
+) -> TaskChangesResponse:
+    """
+    Returns the tasks of the board changed after version `since`, compacted to
+    their current state, so a client at that version catches up in proportion
+    to what changed rather than to the size of the board.
+
+    As with the board, the tasks may be newer than the version returned; a
+    client resyncing from it then just receives them again.
+    """
+    version = await get_board_version(session=session, team_id=team_id, user_id=user_id)
+    if since > version:
+        raise JSONException(status_code=400, message="The board has no such version")
+    if since == version:
+        return TaskChangesResponse(team_id=team_id, since=since, version=version, changes=[])
+
+    # Versions are pruned oldest first and whole, so the log covers every
+    # version from its oldest one on
+    oldest = await aio_task_crud.read_oldest_change(session=session, team_id=team_id)
+    if oldest is None or since < oldest - 1:
+        raise JSONException(
+            status_code=410, message="The changes since this version are no longer available"
+        )
+
+    changes = [
+        TaskChangeResponse(
+            task_id=task_id,
+            deleted=task is None,
+            task=_board_task(task, fullname, username) if task is not None else None,
+        )
+        for task_id, task, fullname, username in await aio_task_crud.read_changed_tasks(
+            session=session, team_id=team_id, since=since
+        )
+    ]
+    return TaskChangesResponse(team_id=team_id, since=since, version=version, changes=changes)
+
+
+def edit_task(
+    session: Session, team_id: UUID, task_id: UUID, user_id: UUID, payload: TaskUpdateRequest
+) -> Task:
+    ensure_team_access(session=session, team_id=team_id, user_id=user_id)
+    # The counters are adjusted from the status and assignee read here
+    lock_board(session=session, team_id=team_id)
+    task = get_task(session=session, team_id=team_id, task_id=task_id)
+    values: Dict[str, object] = payload.model_dump(exclude_unset=True)
+    if "title" in values and not values["title"]:
+        raise JSONException(status_code=400, message="The title of a task cannot be empty")
+    if "assignee_id" in values:
+        _ensure_assignable(session=session, team_id=team_id, assignee_id=payload.assignee_id)
+    return update_task(session=session, task=task, values=values)
+
+
+def move_task(
+    session: Session, team_id: UUID, task_id: UUID, user_id: UUID, payload: TaskMoveRequest
+) -> Task:
+    ensure_team_access(session=session, team_id=team_id, user_id=user_id)
+    if task_id in (payload.after_id, payload.before_id):
+        raise JSONException(status_code=400, message="A task cannot be placed next to itself")
+    lock_board(session=session, team_id=team_id)
+    task = get_task(session=session, team_id=team_id, task_id=task_id)
+    rank = _rank_for(session, team_id, payload.status, payload)
+    return update_task(session=session, task=task, values={"status": payload.status, "rank": rank})
+
+
+def remove_task(session: Session, team_id: UUID, task_id: UUID, user_id: UUID) -> None:
+    ensure_team_access(session=session, team_id=team_id, user_id=user_id)
+    lock_board(session=session, team_id=team_id)
+    task = get_task(session=session, team_id=team_id, task_id=task_id)
+    delete_task(session=session, task=task)
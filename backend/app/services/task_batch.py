@@ -0,0 +1,258 @@
+"""
+Batches of task operations applied to one board in a single transaction.
+
+The operations are first played in request order against an in-memory copy of
+the state they touch: the referenced tasks and the ranks of the columns tasks
+are placed in, each loaded with one query. An operation that cannot be applied
+is skipped with a reason, like an invitation that cannot be sent, and the
+following ones see the board without it. The resulting changes are then
+written with one statement per kind of change (see `apply_task_changes`).
+
+The board is locked (see `lock_board`) before that state is loaded, so a
+concurrent write cannot change it between the read and the write of a batch.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Set
+from uuid import UUID, uuid4
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.exceptions import JSONException
+from app.core.ranking import rank_between
+from app.crud.task import (
+    apply_task_changes,
+    lock_board,
+    read_column_ranks,
+    read_tasks_by_ids,
+    select_board_version,
+)
+from app.crud.task_counter import CounterKey, counter_deltas
+from app.crud.team_member import read_team_user_ids
+from app.models.task import TaskStatus
+from app.schemas.task import (
+    TaskBatchAssign,
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchMove,
+    TaskBatchOperation,
+    TaskBatchResponse,
+    TaskBatchResult,
+    TaskPosition,
+    TaskResponse,
+)
+from app.services.rebalancer import get_rank_rebalancer
+
+
+class _Board:
+    """
+    The state of a board as the operations of a batch are played against it.
+    """
+
+    def __init__(
+        self,
+        team_id: UUID,
+        user_id: UUID,
+        tasks: Dict[UUID, Dict[str, Any]],
+        columns: Dict[TaskStatus, List[str]],
+        assignable: Set[UUID],
+    ):
+        self.team_id = team_id
+        self.user_id = user_id
+        self.tasks = tasks
+        self.columns = columns
+        self.assignable = assignable
+        self.created: Set[UUID] = set()
+        self.changed: Set[UUID] = set()
+        self.deleted: Set[UUID] = set()
+        self.original: Dict[UUID, CounterKey] = {
+            task_id: (task["status"], task["assignee_id"]) for task_id, task in tasks.items()
+        }
+
+    def _task(self, task_id: UUID) -> Dict[str, Any]:
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise JSONException("Task not found")
+        return task
+
+    def _ensure_assignable(self, assignee_id: UUID | None) -> None:
+        if assignee_id and assignee_id not in self.assignable:
+            raise JSONException("The assignee is not a member of this team")
+
+    def _rank_for(self, status: TaskStatus, position: TaskPosition) -> str:
+        ranks = self.columns[status]
+        if position.after_id:
+            after = self.tasks.get(position.after_id)
+            if after is None or after["status"] != status:
+                raise JSONException("The task to place after is not in this column")
+            lower = after["rank"]
+            index = bisect_right(ranks, lower)
+            upper = ranks[index] if index < len(ranks) else None
+        elif position.before_id:
+            before = self.tasks.get(position.before_id)
+            if before is None or before["status"] != status:
+                raise JSONException("The task to place before is not in this column")
+            upper = before["rank"]
+            index = bisect_left(ranks, upper)
+            lower = ranks[index - 1] if index else None
+        else:
+            lower, upper = (ranks[-1] if ranks else None), None
+        return rank_between(lower, upper)
+
+    def _place(self, task: Dict[str, Any], status: TaskStatus, rank: str) -> None:
+        if task["status"] in self.columns and task.get("rank"):
+            ranks = self.columns[task["status"]]
+            del ranks[bisect_left(ranks, task["rank"])]
+        task["status"], task["rank"] = status, rank
+        insort(self.columns[status], rank)
+        get_rank_rebalancer().check(self.team_id, status, rank)
+
+    def create(self, operation: TaskBatchCreate) -> Dict[str, Any]:
+        self._ensure_assignable(operation.assignee_id)
+        rank = self._rank_for(operation.status, operation)
+        now = datetime.utcnow()
+        task = {
+            "id": uuid4(),
+            "team_id": self.team_id,
+            "title": operation.title,
+            "description": operation.description,
+            "status": operation.status,
+            "rank": None,
+            "assignee_id": operation.assignee_id,
+            "created_by": self.user_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._place(task, operation.status, rank)
+        self.tasks[task["id"]] = task
+        self.created.add(task["id"])
+        return task
+
+    def move(self, operation: TaskBatchMove) -> Dict[str, Any]:
+        task = self._task(operation.task_id)
+        if operation.task_id in (operation.after_id, operation.before_id):
+            raise JSONException("A task cannot be placed next to itself")
+        self._place(task, operation.status, self._rank_for(operation.status, operation))
+        return self._touch(task)
+
+    def assign(self, operation: TaskBatchAssign) -> Dict[str, Any]:
+        task = self._task(operation.task_id)
+        self._ensure_assignable(operation.assignee_id)
+        task["assignee_id"] = operation.assignee_id
+        return self._touch(task)
+
+    def delete(self, operation: TaskBatchDelete) -> None:
+        task = self.tasks.pop(self._task(operation.task_id)["id"])
+        if task["status"] in self.columns:
+            ranks = self.columns[task["status"]]
+            del ranks[bisect_left(ranks, task["rank"])]
+        if task["id"] in self.created:
+            self.created.discard(task["id"])
+        else:
+            self.deleted.add(task["id"])
+
+    def _touch(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        task["updated_at"] = datetime.utcnow()
+        if task["id"] not in self.created:
+            self.changed.add(task["id"])
+        return task
+
+    def write(self, session: Session) -> int:
+        """
+        Writes the changes of the batch, returning the new version of the board.
+        """
+        created = [self.tasks[task_id] for task_id in self.created]
+        updated = [
+            {
+                "id": task_id,
+                "status": self.tasks[task_id]["status"],
+                "rank": self.tasks[task_id]["rank"],
+                "assignee_id": self.tasks[task_id]["assignee_id"],
+                "updated_at": self.tasks[task_id]["updated_at"],
+            }
+            for task_id in self.changed - self.deleted
+        ]
+        deltas = counter_deltas(
+            removed=[self.original[task_id] for task_id in self.changed | self.deleted],
+            added=[
+                (self.tasks[task_id]["status"], self.tasks[task_id]["assignee_id"])
+                for task_id in (self.changed - self.deleted) | self.created
+            ],
+        )
+        return apply_task_changes(
+            session=session,
+            team_id=self.team_id,
+            created=created,
+            updated=updated,
+            deleted=list(self.deleted),
+            deltas=deltas,
+        )
+
+
+def _load_board(
+    session: Session, team_id: UUID, user_id: UUID, operations: Sequence[TaskBatchOperation]
+) -> _Board:
+    task_ids: Set[UUID] = set()
+    assignee_ids: Set[UUID] = set()
+    statuses: Set[TaskStatus] = set()
+    for operation in operations:
+        if not isinstance(operation, TaskBatchCreate):
+            task_ids.add(operation.task_id)
+        if isinstance(operation, (TaskBatchCreate, TaskBatchMove)):
+            task_ids.update(filter(None, (operation.after_id, operation.before_id)))
+            statuses.add(operation.status)
+        if isinstance(operation, (TaskBatchCreate, TaskBatchAssign)) and operation.assignee_id:
+            assignee_ids.add(operation.assignee_id)
+
+    tasks = {
+        task.id: task.model_dump()
+        for task in (read_tasks_by_ids(session, team_id, task_ids) if task_ids else [])
+    }
+    # Only the columns tasks are placed in need their ranks: removing a task
+    # from any other column cannot change where the next ones go
+    columns: Dict[TaskStatus, List[str]] = {status: [] for status in statuses}
+    if statuses:
+        for status, rank in read_column_ranks(session, team_id, statuses):
+            columns[status].append(rank)
+    assignable = read_team_user_ids(session, team_id, assignee_ids) if assignee_ids else set()
+    return _Board(team_id, user_id, tasks, columns, assignable)
+
+
+def apply_task_batch(
+    session: Session, team_id: UUID, user_id: UUID, operations: Sequence[TaskBatchOperation]
+) -> TaskBatchResponse:
+    if len(operations) > settings.TASK_BATCH_MAX_OPERATIONS:
+        raise JSONException(
+            status_code=400,
+            message=f"A batch holds at most {settings.TASK_BATCH_MAX_OPERATIONS} operations",
+        )
+    if session.exec(select_board_version(team_id=team_id, user_id=user_id)).first() is None:
+        raise JSONException(status_code=404, message="Team not found")
+
+    version = lock_board(session=session, team_id=team_id)
+    board = _load_board(session, team_id, user_id, operations)
+    results: List[TaskBatchResult] = []
+    for index, operation in enumerate(operations):
+        result = TaskBatchResult(index=index, op=operation.op, success=True)
+        try:
+            if isinstance(operation, TaskBatchCreate):
+                task = board.create(operation)
+            elif isinstance(operation, TaskBatchMove):
+                task = board.move(operation)
+            elif isinstance(operation, TaskBatchAssign):
+                task = board.assign(operation)
+            else:
+                board.delete(operation)
+                task = None
+            result.task_id = task["id"] if task else operation.task_id
+            result.task = TaskResponse.model_validate(task) if task else None
+        except JSONException as e:
+            result.success, result.reason = False, str(e.message)
+            result.task_id = getattr(operation, "task_id", None)
+        results.append(result)
+
+    if board.created or board.changed or board.deleted:
+        version = board.write(session)
+    return TaskBatchResponse(version=version, results=results)
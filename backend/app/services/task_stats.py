@@ -0,0 +1,103 @@
+"""
+The task statistics of the boards, read from the counters maintained by the
+task writes (see `app.crud.task_counter`) rather than by grouping the tasks.
+
+The counters can be checked against the tasks, and repaired, with:
+    python -m app.services.task_stats [--team-id TEAM_ID] [--repair]
+"""
+
+import argparse
+from typing import Dict, List
+from uuid import UUID
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.aio.task_counter import read_counters
+from app.crud.task_counter import read_actual_counts, read_stored_counts, replace_counters
+from app.db.session import get_engine
+from app.models.task import UNASSIGNED
+from app.schemas.task import AssigneeTaskCounts, TaskAssignee, TaskCounts, TaskStatsResponse
+from app.services.task import ensure_team_access_async
+
+
+async def get_task_stats(session: AsyncSession, team_id: UUID, user_id: UUID) -> TaskStatsResponse:
+    await ensure_team_access_async(session=session, team_id=team_id, user_id=user_id)
+
+    tasks, unassigned = TaskCounts(), TaskCounts()
+    assignees: Dict[UUID, AssigneeTaskCounts] = {}
+    for status, assignee_id, count, fullname, username in await read_counters(
+        session=session, team_id=team_id
+    ):
+        tasks.add(status, count)
+        # Deleting a user unassigns their tasks (ON DELETE SET NULL) without
+        # going through the counters, which keep the id until repaired
+        if assignee_id == UNASSIGNED or username is None:
+            unassigned.add(status, count)
+            continue
+        if assignee_id not in assignees:
+            assignees[assignee_id] = AssigneeTaskCounts(
+                assignee=TaskAssignee(id=assignee_id, fullname=fullname, username=username)
+            )
+        assignees[assignee_id].add(status, count)
+
+    return TaskStatsResponse(
+        team_id=team_id,
+        tasks=tasks,
+        unassigned=unassigned,
+        assignees=sorted(assignees.values(), key=lambda item: item.total, reverse=True),
+    )
+
+
+def check_task_counters(
+    session: Session, team_id: UUID | None = None, repair: bool = False
+) -> List[Dict[str, object]]:
+    """
+    Compares the counters with the tasks, of one board or of all of them,
+    returning the counters that are off. With `repair`, the counters of the
+    boards concerned are recomputed.
+    """
+    stored = read_stored_counts(session, team_id)
+    actual = read_actual_counts(session, team_id)
+    mismatches: List[Dict[str, object]] = []
+    for key in sorted(stored.keys() | actual.keys(), key=str):
+        if stored.get(key, 0) == actual.get(key, 0):
+            continue
+        team, status, assignee = key
+        mismatches.append(
+            {
+                "team_id": team,
+                "status": status,
+                "assignee_id": None if assignee == UNASSIGNED else assignee,
+                "stored": stored.get(key, 0),
+                "actual": actual.get(key, 0),
+            }
+        )
+
+    if repair:
+        for team in {mismatch["team_id"] for mismatch in mismatches}:
+            replace_counters(session, team)  # type: ignore[arg-type]
+    return mismatches
+
+
+def main(args: argparse.Namespace) -> None:
+    with Session(get_engine()) as session:
+        mismatches = check_task_counters(session, team_id=args.team_id, repair=args.repair)
+    for mismatch in mismatches:
+        print(
+            f"team {mismatch['team_id']}  {mismatch['status']:<12} "
+            f"assignee {mismatch['assignee_id'] or '-'}: "
+            f"stored {mismatch['stored']}, actual {mismatch['actual']}"
+        )
+    teams = len({mismatch["team_id"] for mismatch in mismatches})
+    action = "repaired" if args.repair else "found"
+    print(f"{len(mismatches)} wrong counters {action} on {teams} boards")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--team-id", type=UUID, default=None)
+    parser.add_argument("--repair", action="store_true")
+    main(parser.parse_args())
@@ -1,17 +1,20 @@
 import random
 import string
-from typing import Sequence
 from uuid import UUID
 
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
 from app.core.exceptions import JSONException
+from app.crud.aio import team as aio_team_crud
 from app.crud.team import (
     create_team,
     delete_team,
-    read_joined_teams,
     read_team_by_id,
     read_teams_by_owner,
+    select_joined_teams,
+    select_teams_by_owner,
 )
 from app.models.team import Team
 from app.schemas.team import TeamCreateRequest
@@ -44,12 +47,19 @@ def get_team(session: Session, team_id: UUID) -> Team:
     return team
 
 
-def get_teams(
-    session: Session, owner_id: UUID, team_type: str, search: str | None = None
-) -> Sequence[Team]:
+async def get_team_async(session: AsyncSession, team_id: UUID) -> Team:
+    team = await aio_team_crud.read_team_by_id(session=session, team_id=team_id)
+    if not team:
+        raise JSONException(status_code=404, message="Team not found")
+    return team
+
+
+def get_teams_query(
+    owner_id: UUID, team_type: str, search: str | None = None
+) -> SelectOfScalar[Team]:
     if team_type == "created":
-        return read_teams_by_owner(session=session, owner_id=owner_id, search=search)
-    return read_joined_teams(session=session, user_id=owner_id, search=search)
+        return select_teams_by_owner(owner_id=owner_id, search=search)
+    return select_joined_teams(user_id=owner_id, search=search)
 
 
 def drop_team(session: Session, team_id: UUID, owner_id: UUID) -> None:
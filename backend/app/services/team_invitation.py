@@ -1,35 +1,57 @@
+import csv
+import io
+import json
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 from uuid import UUID
 
 from fastapi import BackgroundTasks
+from pydantic import ValidationError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
-from app.core.email import render_template, send_email
+from app.core.email import PartialTemplate, send_email
 from app.core.config import settings
 from app.core.exceptions import JSONException
-from app.crud.auth import get_user_by_id
+from app.crud.aio import team as aio_team_crud
+from app.services.identity import load_user
 from app.crud.team import read_team_by_id
 from app.crud.team_invitation import (
-    create_invitation,
+    create_invitations,
     drop_invitation,
     mark_invitation_as_accepted,
     read_invitation_by_id,
     read_invitation_by_token,
-    read_invitations_by_team_id,
-    is_member_invited,
+    read_invited_emails,
+    select_invitations_by_team_id,
 )
-from app.crud.team_member import create_member, read_member_by_email
-from app.models.team import Team, TeamMateRole
+from app.crud.team_member import create_member, read_member_emails
+from app.db.session import get_engine
+from app.models.team import Invitation, Team, TeamMateRole
 from app.schemas.team_invitation import InvitationData
 
+# Upper bound of rows accepted in one CSV upload
+MAX_BULK_INVITATIONS = 10_000
 
-def get_invitations(session: Session, team_id: UUID, search: str, role: TeamMateRole):
+# Rows validated, inserted and committed together while streaming a CSV upload
+BULK_INVITATION_CHUNK_SIZE = 500
+
+
+def get_invitations_query(
+    session: Session, team_id: UUID, search: str, role: TeamMateRole
+) -> SelectOfScalar[Invitation]:
     _get_team(session=session, team_id=team_id)
-    invitations = read_invitations_by_team_id(
-        session=session, team_id=team_id, search=search, role=role
-    )
-    return invitations
+    return select_invitations_by_team_id(team_id=team_id, search=search, role=role)
+
+
+async def get_invitations_query_async(
+    session: AsyncSession, team_id: UUID, search: str, role: TeamMateRole
+) -> SelectOfScalar[Invitation]:
+    if not await aio_team_crud.read_team_by_id(session=session, team_id=team_id):
+        raise JSONException(status_code=404, message="Team not found")
+    return select_invitations_by_team_id(team_id=team_id, search=search, role=role)
 
 
 def get_available_filters():
@@ -58,34 +80,79 @@ def _get_invitation(session: Session, invitation_token: str):
     return invitation
 
 
-def is_existing_member(session: Session, team_id: UUID, email: str):
-    return (
-        read_member_by_email(session=session, team_id=team_id, member_email=email)
-        is not None
+def process_invitations(
+    session: Session,
+    team: Team,
+    invited_by: UUID,
+    invitations: Sequence[InvitationData],
+) -> List[Tuple[InvitationData, bool, str, Any]]:
+    """
+    Validates and creates a batch of invitations set-wise: existing members and
+    pending invitations are resolved in two queries for the whole batch, and
+    every new invitation is inserted with one multi-row insert and one commit.
+
+    Returns:
+        A `(invitation, success, reason, instance)` tuple per requested invitation,
+        in request order.
+    """
+    emails = {invitation.email for invitation in invitations}
+    member_emails = read_member_emails(session=session, team_id=team.id, emails=emails)
+    invited_emails = read_invited_emails(session=session, team_id=team.id, emails=emails)
+
+    results: List[Tuple[InvitationData, bool, str, Any]] = []
+    to_create: List[InvitationData] = []
+
+    for invitation in invitations:
+        if invitation.role == TeamMateRole.OWNER:
+            reason = "Owner is created with the team and cannot be invited"
+        elif invitation.email in member_emails:
+            reason = "Member already exists"
+        elif invitation.email in invited_emails:
+            reason = "Member already invited"
+        else:
+            reason = ""
+            invited_emails.add(invitation.email)
+            to_create.append(invitation)
+
+        results.append((invitation, not reason, reason, None))
+
+    created = iter(
+        create_invitations(
+            session=session,
+            team_id=team.id,
+            invited_by=invited_by,
+            invitations_data=to_create,
+        )
     )
+    return [
+        (invitation, success, reason, next(created) if success else None)
+        for invitation, success, reason, _ in results
+    ]
 
 
-def is_already_invited(session: Session, team_id: UUID, email: str):
-    return is_member_invited(session=session, team_id=team_id, member_email=email)
-
-
-def process_invitation(
-    session: Session, team_id: UUID, invited_by: UUID, invitation: InvitationData
-) -> Tuple[bool, str, Any]:
-    email = invitation.email
-    role = invitation.role
-
-    if role == TeamMateRole.OWNER:
-        return False, "Owner is created with the team and cannot be invited", None
+def _invitation_template(team: Team) -> PartialTemplate:
+    # The team is shared by the whole batch, only the role and link vary
+    return PartialTemplate(
+        "invite.html", ["role", "invite_link"], team_name=team.name
+    )
 
-    if is_existing_member(session, team_id, email):
-        return False, "Member already exists", None
 
-    if is_already_invited(session, team_id, email):
-        return False, "Member already invited", None
+def _queue_invitation_email(
+    background_tasks: BackgroundTasks,
+    template: PartialTemplate,
+    invitation: Invitation,
+) -> None:
+    html_body = template.render(
+        role=invitation.role.value,
+        invite_link=f"{settings.FRONTEND_DOMAIN}accept-invite?token={invitation.token}",
+    )
 
-    invitation_instance = create_invitation(session, team_id, invited_by, invitation)
-    return True, "", invitation_instance
+    background_tasks.add_task(
+        send_email,
+        subject="[TeamTact] You've been invited to join a team!",
+        to_email=invitation.email,
+        html_body=html_body,
+    )
 
 
 def handle_invitations(
@@ -99,29 +166,15 @@ def handle_invitations(
     sent_invitations: List[str] = []
     unsent_invitations: List[Dict[str, str]] = []
 
-    for invitation in request_data:
-        success, reason, instance = process_invitation(
-            session, team_id, invited_by, invitation
-        )
+    results = process_invitations(
+        session=session, team=team, invited_by=invited_by, invitations=request_data
+    )
+    template = _invitation_template(team)
 
+    for invitation, success, reason, instance in results:
         if success:
             sent_invitations.append(invitation.email)
-
-            # Prepare email context
-            context = {
-                "team_name": team.name,
-                "role": invitation.role,
-                "invite_link": f"{settings.FRONTEND_DOMAIN}accept-invite?token={instance.token}",
-            }
-
-            html_body = render_template("invite.html", **context)
-
-            background_tasks.add_task(
-                send_email,
-                subject="[TeamTact] You've been invited to join a team!",
-                to_email=invitation.email,
-                html_body=html_body,
-            )
+            _queue_invitation_email(background_tasks, template, instance)
         else:
             unsent_invitations.append({"email": invitation.email, "reason": reason})
 
@@ -131,10 +184,94 @@ def handle_invitations(
     }
 
 
+def _parse_invitation_rows(
+    csv_data: bytes,
+) -> List[Tuple[int, str, InvitationData | None, str]]:
+    try:
+        reader = csv.DictReader(io.StringIO(csv_data.decode("utf-8-sig")))
+        rows = list(islice(reader, MAX_BULK_INVITATIONS + 1))
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise JSONException(message="The uploaded file is not a valid CSV") from exc
+
+    if not reader.fieldnames or "email" not in reader.fieldnames:
+        raise JSONException(message="The CSV file must have an 'email' column")
+
+    if len(rows) > MAX_BULK_INVITATIONS:
+        raise JSONException(
+            message=f"A CSV upload is limited to {MAX_BULK_INVITATIONS} rows"
+        )
+
+    parsed: List[Tuple[int, str, InvitationData | None, str]] = []
+    for row_number, row in enumerate(rows, start=1):
+        email = (row.get("email") or "").strip()
+        try:
+            invitation = InvitationData(
+                email=email,
+                role=(row.get("role") or TeamMateRole.VIEWER.value).strip().upper(),
+            )
+            parsed.append((row_number, email, invitation, ""))
+        except ValidationError as exc:
+            parsed.append((row_number, email, None, exc.errors()[0]["msg"]))
+    return parsed
+
+
+def stream_csv_invitations(
+    session: Session,
+    team_id: UUID,
+    invited_by: UUID,
+    csv_data: bytes,
+    background_tasks: BackgroundTasks,
+) -> Iterator[str]:
+    """
+    Processes a CSV upload (`email` and optional `role` columns) in chunks of
+    `BULK_INVITATION_CHUNK_SIZE` rows, yielding one NDJSON line per row as soon
+    as its chunk is committed.
+    """
+    # Everything that can reject the whole upload is checked before streaming
+    team = _get_team(session=session, team_id=team_id)
+    rows = iter(_parse_invitation_rows(csv_data))
+    template = _invitation_template(team)
+
+    def _line(row_number: int, email: str, status: str, reason: str = "") -> str:
+        return json.dumps(
+            {"row": row_number, "email": email, "status": status, "reason": reason}
+        ) + "\n"
+
+    def _generate() -> Iterator[str]:
+        # The request's session is closed before the body is streamed, so the
+        # chunks are written with a session of their own
+        with Session(get_engine()) as stream_session:
+            stream_team = _get_team(session=stream_session, team_id=team_id)
+            while chunk := list(islice(rows, BULK_INVITATION_CHUNK_SIZE)):
+                valid = [(number, data) for number, _, data, _ in chunk if data]
+                results = iter(
+                    process_invitations(
+                        session=stream_session,
+                        team=stream_team,
+                        invited_by=invited_by,
+                        invitations=[data for _, data in valid],
+                    )
+                )
+
+                for row_number, email, data, error in chunk:
+                    if not data:
+                        yield _line(row_number, email, "invalid", error)
+                        continue
+
+                    invitation, success, reason, instance = next(results)
+                    if success:
+                        _queue_invitation_email(background_tasks, template, instance)
+                        yield _line(row_number, invitation.email, "sent")
+                    else:
+                        yield _line(row_number, invitation.email, "skipped", reason)
+
+    return _generate()
+
+
 def handle_accept_invitation(session: Session, user_id: UUID, invitation_token: str):
     invitation = _get_invitation(session=session, invitation_token=invitation_token)
 
-    user = get_user_by_id(session=session, user_id=user_id)
+    user = load_user(session=session, user_id=user_id)
 
     if not invitation.email == user.email:
         raise JSONException(message={
@@ -148,7 +285,7 @@ def handle_accept_invitation(session: Session, user_id: UUID, invitation_token:
             "description": "The invitation has already been accepted by you"
         })
     
-    elif invitation.expiration_date >= datetime.utcnow():
+    elif invitation.expiration_date < datetime.utcnow():
         raise JSONException(message={
             "title": "Invitation Expired",
             "description": "The invitation has been expired"
@@ -0,0 +1,80 @@
+"""
+Microbenchmark of the email rendering path: the cached partial templates and
+composed messages against rendering each template and building a
+`MIMEMultipart` per recipient.
+
+Usage (from the backend directory, with the usual settings in the environment):
+    python -m benchmarks.email_rendering --recipients 5000
+"""
+
+import argparse
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.core import email as email_module
+from app.core.config import settings
+from app.services.auth import send_reset_password_email, send_verification_email
+from app.services.team_invitation import _invitation_template
+
+
+class NullWorker:
+    """
+    Stands in for the delivery worker, so only rendering and composing is timed.
+    """
+
+    def submit(self, to_email: str, message: str) -> None:
+        pass
+
+
+def naive_send(template_name: str, subject: str, to_email: str, **context) -> str:
+    html_body = email_module.get_template_env().get_template(template_name).render(**context)
+    message = MIMEMultipart("alternative")
+    message["From"] = settings.SMTP_USER
+    message["To"] = to_email
+    message["Subject"] = subject
+    message.attach(MIMEText(html_body, "html"))
+    return message.as_string()
+
+
+def bench(label: str, call, recipients: int) -> None:
+    started = time.perf_counter()
+    for index in range(recipients):
+        call(f"user{index}@bench.local", uuid4().hex)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed / recipients * 1e6:>8.1f} us/message")
+
+
+def main(args: argparse.Namespace) -> None:
+    email_module.get_mail_worker = NullWorker  # type: ignore[assignment]
+    email_module.load_templates()
+    team = SimpleNamespace(name="Bench Team")
+    invite = _invitation_template(team)  # type: ignore[arg-type]
+
+    def cached_invite(to_email: str, token: str) -> None:
+        html_body = invite.render(
+            role="VIEWER", invite_link=f"{settings.FRONTEND_DOMAIN}accept-invite?token={token}"
+        )
+        email_module.send_email("[TeamTact] Invite", to_email, html_body)
+
+    bench("verification (naive)", lambda to, code: naive_send(
+        "verify_email.html", "[TeamTact] Verify", to, verify_link=code
+    ), args.recipients)
+    bench("verification (cached)", send_verification_email, args.recipients)
+    bench("reset password (naive)", lambda to, code: naive_send(
+        "password_reset.html", "[TeamTact] Reset", to, reset_link=code
+    ), args.recipients)
+    bench("reset password (cached)", send_reset_password_email, args.recipients)
+    bench("invite (naive)", lambda to, token: naive_send(
+        "invite.html", "[TeamTact] Invite", to,
+        team_name=team.name, role="VIEWER", invite_link=token,
+    ), args.recipients)
+    bench("invite (cached)", cached_invite, args.recipients)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recipients", type=int, default=5000)
+    main(parser.parse_args())
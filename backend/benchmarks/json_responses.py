@@ -0,0 +1,90 @@
+"""
+Microbenchmark of rendering a page of invitations: validating and dumping each
+row into a dict re-encoded by the stdlib `json`, against validating the page
+with a cached `TypeAdapter` and serializing it to bytes in one pass.
+
+Usage (from the backend directory):
+    python -m benchmarks.json_responses --page-size 100 --iterations 2000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+
+from app.core.helpers import PaginatedResponse
+from app.core.responses import APIResponse, validate_items
+from app.models.team import Invitation, TeamMateRole
+from app.models.user import User
+from app.schemas.team_invitation import InvitationResponse
+
+
+def build_rows(count: int) -> list[Invitation]:
+    invitor = User(
+        id=uuid4(),
+        fullname="Bench Owner",
+        email="owner@example.com",
+        username="bench-owner",
+        hashed_password="x",
+    )
+    invited_at = datetime.utcnow()
+    return [
+        Invitation(
+            id=uuid4(),
+            email=f"user{index}@example.com",
+            role=TeamMateRole.VIEWER,
+            team_id=uuid4(),
+            invited_by=invitor.id,
+            invitor=invitor,
+            invited_at=invited_at - timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def envelope(data) -> dict:
+    return {"success": True, "message": "Invitations fetched successfully", "data": data}
+
+
+def dumped_page(rows: list[Invitation]) -> bytes:
+    items = [InvitationResponse.model_validate(row) for row in rows]
+    page = PaginatedResponse(
+        total_rows=len(rows), current_page=1, total_pages=1, page_size=len(rows), items=items
+    ).model_dump(mode="json")
+    return JSONResponse(content=envelope({"pagination": page})).body
+
+
+def single_pass_page(rows: list[Invitation]) -> bytes:
+    page = PaginatedResponse(
+        total_rows=len(rows),
+        current_page=1,
+        total_pages=1,
+        page_size=len(rows),
+        items=validate_items(InvitationResponse, rows),
+    )
+    return APIResponse(content=envelope({"pagination": page})).body
+
+
+def bench(label: str, call, rows: list[Invitation], iterations: int) -> None:
+    call(rows)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call(rows)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<20} {elapsed / iterations * 1e6:>9.1f} us/page")
+
+
+def main(args: argparse.Namespace) -> None:
+    rows = build_rows(args.page_size)
+    assert len(dumped_page(rows)) == len(single_pass_page(rows))
+    bench("model_dump + json", dumped_page, rows, args.iterations)
+    bench("single pass", single_pass_page, rows, args.iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    main(parser.parse_args())
@@ -0,0 +1,381 @@
+"""
+Load test of the API: seeds synthetic users, teams, members and invitations,
+drives each scenario with concurrent clients and reports its latency
+percentiles and throughput, compared against a stored baseline.
+
+The app is served in-process through httpx's ASGI transport, or by a running
+server with --base-url (which must use the same DATABASE_URL, for the seeded
+rows). Emails are discarded and the auth rate limits are off in-process.
+
+Usage (from the backend directory, with the usual settings in the environment
+and the development requirements installed: pip install -r requirements-dev.txt):
+    DATABASE_URL=sqlite:///load.db python -m benchmarks.load
+    DATABASE_URL=postgresql://localhost/teamtact_load python -m benchmarks.load --users 2000
+    DATABASE_URL=sqlite:///load.db python -m benchmarks.load --update-baseline
+
+Exits with status 1 when a scenario failed requests or regressed past
+--tolerance against the baseline recorded with the same parameters.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+import httpx
+from sqlalchemy.engine import make_url
+from sqlmodel import Session, SQLModel
+
+from app.core import email as email_module
+from app.core.config import settings
+from app.core.security import hash_password
+from app.core.token import generate_access_token
+from app.db.base import SQLModelMeta  # noqa: F401  (registers every model)
+from app.db.session import get_engine
+from app.models.team import Invitation, Team, TeamMate, TeamMateRole
+from app.models.user import User
+
+BASELINES = Path(__file__).parent / "baselines"
+PASSWORD = "load-test-password"
+API = "/api/v1"
+
+
+class NullWorker:
+    """
+    Stands in for the delivery worker, so no email leaves the benchmark.
+    """
+
+    def submit(self, to_email: str, message: str) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+@dataclass
+class Fixture:
+    """
+    The seeded rows the scenarios draw from.
+
+    Attributes:
+        users (list): `(id, email)` of every seeded user.
+        teams (list): `(id, owner id)` of every seeded team.
+        invitations (list): `(token, invitee id)` of the pending invitations.
+        tokens (dict): An access token per user id.
+    """
+
+    users: List[tuple] = field(default_factory=list)
+    teams: List[tuple] = field(default_factory=list)
+    invitations: List[tuple] = field(default_factory=list)
+    tokens: Dict[UUID, str] = field(default_factory=dict)
+
+    def cookie(self, user_id: UUID) -> Dict[str, str]:
+        return {"Cookie": f"access_token={self.tokens[user_id]}"}
+
+
+def seed(args: argparse.Namespace) -> Fixture:
+    needed = 1 + args.members + args.invitations
+    if args.users < needed:
+        sys.exit(f"--users must be at least {needed} to fill the members and invitations")
+
+    SQLModel.metadata.create_all(get_engine())
+    rng = random.Random(args.seed)
+    run = uuid4().hex[:8]
+    hashed_password = hash_password(PASSWORD)
+    fixture = Fixture()
+
+    with Session(get_engine()) as session:
+        users = [
+            User(
+                fullname=f"Load User {index}",
+                email=f"load-{run}-{index}@example.com",
+                username=f"load-{run}-{index}",
+                hashed_password=hashed_password,
+                email_verified=True,
+            )
+            for index in range(args.users)
+        ]
+        session.add_all(users)
+        session.flush()
+
+        for owner in users[: args.owners]:
+            for _ in range(args.teams):
+                others = rng.sample([user for user in users if user is not owner], needed - 1)
+                members, invitees = others[: args.members], others[args.members :]
+                team = Team(
+                    name=f"load-{uuid4().hex[:12]}",
+                    code=uuid4().hex[:6].upper(),
+                    owner_id=owner.id,
+                    members_count=len(members),
+                )
+                session.add(team)
+                session.flush()
+                session.add_all(
+                    TeamMate(team_id=team.id, user_id=member.id, role=TeamMateRole.VIEWER)
+                    for member in members
+                )
+                invitations = [
+                    Invitation(
+                        team_id=team.id,
+                        email=invitee.email,
+                        role=TeamMateRole.VIEWER,
+                        invited_by=owner.id,
+                    )
+                    for invitee in invitees
+                ]
+                session.add_all(invitations)
+                fixture.teams.append((team.id, owner.id))
+                fixture.invitations.extend(
+                    (invitation.token, invitee.id)
+                    for invitation, invitee in zip(invitations, invitees)
+                )
+        session.commit()
+
+        fixture.users = [(user.id, user.email) for user in users]
+    fixture.tokens = {user_id: generate_access_token(user_id) for user_id, _ in fixture.users}
+    rng.shuffle(fixture.invitations)
+    return fixture
+
+
+@dataclass
+class Scenario:
+    """
+    One kind of request driven by the clients.
+
+    Attributes:
+        name (str): The name the results are reported under.
+        call (Callable): Sends the `index`-th request of the scenario.
+        expected (int): The status code of a successful request.
+        limit (Callable | None): The number of requests the fixture allows,
+            for scenarios consuming seeded rows.
+    """
+
+    name: str
+    call: Callable[[httpx.AsyncClient, Fixture, int], Awaitable[httpx.Response]]
+    expected: int = 200
+    limit: Optional[Callable[[Fixture], int]] = None
+
+
+async def signup(client: httpx.AsyncClient, fixture: Fixture, index: int) -> httpx.Response:
+    name = uuid4().hex
+    return await client.post(f"{API}/auth/signup", json={
+        "fullname": "Load User", "email": f"{name}@example.com",
+        "username": name, "password": PASSWORD,
+    })
+
+
+async def login(client: httpx.AsyncClient, fixture: Fixture, index: int) -> httpx.Response:
+    _, user_email = fixture.users[index % len(fixture.users)]
+    return await client.post(f"{API}/auth/login", json={"email": user_email, "password": PASSWORD})
+
+
+async def list_teams(client: httpx.AsyncClient, fixture: Fixture, index: int) -> httpx.Response:
+    _, owner_id = fixture.teams[index % len(fixture.teams)]
+    return await client.get(
+        f"{API}/teams/", params={"team_type": "created"}, headers=fixture.cookie(owner_id)
+    )
+
+
+async def list_members(client: httpx.AsyncClient, fixture: Fixture, index: int) -> httpx.Response:
+    team_id, owner_id = fixture.teams[index % len(fixture.teams)]
+    return await client.get(
+        f"{API}/team-members/{team_id}/members", headers=fixture.cookie(owner_id)
+    )
+
+
+async def list_invitations(client: httpx.AsyncClient, fixture: Fixture, index: int) -> httpx.Response:
+    team_id, owner_id = fixture.teams[index % len(fixture.teams)]
+    return await client.get(f"{API}/team-invitations/{team_id}", headers=fixture.cookie(owner_id))
+
+
+async def accept_invite(client: httpx.AsyncClient, fixture: Fixture, index: int) -> httpx.Response:
+    invitation_token, invitee_id = fixture.invitations[index]
+    return await client.post(
+        f"{API}/team-invitations/accept/{invitation_token}", headers=fixture.cookie(invitee_id)
+    )
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("signup", signup, expected=201),
+        Scenario("login", login),
+        Scenario("list_teams", list_teams),
+        Scenario("list_members", list_members),
+        Scenario("list_invitations", list_invitations),
+        Scenario("accept_invite", accept_invite, limit=lambda fixture: len(fixture.invitations)),
+    )
+}
+
+
+def percentile(samples: List[float], p: int) -> float:
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100)[p - 1]
+
+
+async def drive(
+    client: httpx.AsyncClient, scenario: Scenario, fixture: Fixture, args: argparse.Namespace
+) -> Dict[str, float]:
+    requests = args.requests
+    if scenario.limit is not None:
+        requests = min(requests, scenario.limit(fixture))
+    indexes = iter(range(requests))
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for index in indexes:
+            started = time.perf_counter()
+            response = await scenario.call(client, fixture, index)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != scenario.expected:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+async def run(args: argparse.Namespace, fixture: Fixture) -> Dict[str, Dict[str, float]]:
+    results = {}
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+            for name in args.scenarios:
+                results[name] = await drive(client, SCENARIOS[name], fixture, args)
+        return results
+
+    from main import create_app
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://load", timeout=60) as client:
+            for name in args.scenarios:
+                results[name] = await drive(client, SCENARIOS[name], fixture, args)
+    return results
+
+
+def parameters(args: argparse.Namespace) -> Dict[str, object]:
+    return {
+        "dialect": make_url(settings.DATABASE_URL).get_backend_name(),
+        "users": args.users,
+        "owners": args.owners,
+        "teams": args.teams,
+        "members": args.members,
+        "invitations": args.invitations,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+    }
+
+
+def report(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'scenario':<18} {'requests':>8} {'errors':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'req/s':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<18} {result['requests']:>8} {result['errors']:>6} "
+            f"{result['p50'] * 1000:>7.1f}ms {result['p95'] * 1000:>7.1f}ms "
+            f"{result['p99'] * 1000:>7.1f}ms {result['throughput']:>9.1f}"
+        )
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    found = []
+    for name, result in results.items():
+        if result["errors"]:
+            found.append(f"{name}: {result['errors']} failed requests")
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in ("p50", "p95"):
+            if result[metric] > previous[metric] * (1 + tolerance):
+                found.append(
+                    f"{name}: {metric} {result[metric] * 1000:.1f}ms "
+                    f"(baseline {previous[metric] * 1000:.1f}ms)"
+                )
+        if result["throughput"] < previous["throughput"] * (1 - tolerance):
+            found.append(
+                f"{name}: {result['throughput']:.1f} req/s "
+                f"(baseline {previous['throughput']:.1f} req/s)"
+            )
+    return found
+
+
+def main(args: argparse.Namespace) -> int:
+    if not args.base_url:
+        # Every client hits the same few auth endpoints, which the rate limits would throttle
+        settings.RATE_LIMIT_ENABLED = False
+        email_module.get_mail_worker = lru_cache(NullWorker)  # type: ignore[assignment]
+
+    started = time.perf_counter()
+    fixture = seed(args)
+    print(
+        f"Seeded {len(fixture.users)} users, {len(fixture.teams)} teams and "
+        f"{len(fixture.invitations)} invitations in {time.perf_counter() - started:.1f}s"
+    )
+
+    results = asyncio.run(run(args, fixture))
+    report(results)
+
+    params = parameters(args)
+    baseline_path = Path(args.baseline or BASELINES / f"load-{params['dialect']}.json")
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(
+            json.dumps({"parameters": params, "scenarios": results}, indent=2) + "\n"
+        )
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    baseline = {}
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; record one with --update-baseline")
+    else:
+        stored = json.loads(baseline_path.read_text())
+        if stored["parameters"] != params:
+            print(f"{baseline_path} was recorded with other parameters: {stored['parameters']}")
+            return 1
+        baseline = stored["scenarios"]
+
+    found = regressions(results, baseline, args.tolerance)
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--owners", type=int, default=20, help="users owning teams")
+    parser.add_argument("--teams", type=int, default=5, help="teams per owner")
+    parser.add_argument("--members", type=int, default=10, help="members per team")
+    parser.add_argument("--invitations", type=int, default=10, help="pending invitations per team")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-url", help="drive a running server instead of the in-process app")
+    parser.add_argument("--baseline", help="defaults to benchmarks/baselines/load-<dialect>.json")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,110 @@
+"""
+Latency percentiles of `login_user` and `signup_user` with bcrypt running on
+the threadpool (PASSWORD_HASHER_WORKERS=0) against the dedicated process pool,
+while a stream of cheap requests measures how much the other endpoints suffer.
+
+Usage (from the backend directory, with the usual settings in the environment):
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.password_hashing --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import uuid4
+
+import httpx
+from sqlmodel import Session, SQLModel
+
+from app.core.config import settings
+from app.core.security import hash_password, shutdown_password_hasher
+from app.db.base import SQLModelMeta  # noqa: F401  (registers every model)
+from app.db.session import get_async_engine, get_engine
+from app.models.user import User
+from main import app
+
+
+def seed_user(password: str) -> str:
+    SQLModel.metadata.create_all(get_engine())
+    email = f"{uuid4().hex}@bench.local"
+    with Session(get_engine()) as session:
+        session.add(
+            User(
+                fullname="Bench User",
+                email=email,
+                username=uuid4().hex,
+                hashed_password=hash_password(password),
+                email_verified=True,
+            )
+        )
+        session.commit()
+    return email
+
+
+def percentiles(samples: list[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100)
+    return " ".join(
+        f"p{p}={cuts[p - 1] * 1000:.1f}ms" for p in (50, 95, 99)
+    )
+
+
+async def timed(client: httpx.AsyncClient, samples: list[float], method: str, url: str, **kwargs):
+    started = time.perf_counter()
+    await client.request(method, url, **kwargs)
+    samples.append(time.perf_counter() - started)
+
+
+async def run(label: str, email: str, password: str, args: argparse.Namespace) -> None:
+    logins: list[float] = []
+    signups: list[float] = []
+    others: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def auth_client():
+            for _ in range(args.requests):
+                await timed(client, logins, "POST", "/api/v1/auth/login",
+                            json={"email": email, "password": password})
+                name = uuid4().hex
+                await timed(client, signups, "POST", "/api/v1/auth/signup", json={
+                    "fullname": "Bench", "email": f"{name}@bench.local",
+                    "username": name, "password": password,
+                })
+
+        async def other_client():
+            for _ in range(args.requests * 2):
+                await timed(client, others, "GET", "/")
+
+        await asyncio.gather(
+            *(auth_client() for _ in range(args.concurrency)),
+            *(other_client() for _ in range(args.concurrency)),
+        )
+
+    print(f"[{label}]")
+    print(f"  login_user   {percentiles(logins)}")
+    print(f"  signup_user  {percentiles(signups)}")
+    print(f"  GET /        {percentiles(others)}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    password = "benchmark-password"
+    email = seed_user(password)
+    # Every login targets the same account, which the auth rate limits would throttle
+    settings.RATE_LIMIT_ENABLED = False
+
+    workers = settings.PASSWORD_HASHER_WORKERS
+    settings.PASSWORD_HASHER_WORKERS = 0
+    await run("threadpool", email, password, args)
+
+    settings.PASSWORD_HASHER_WORKERS = workers or 2
+    await run("process pool", email, password, args)
+
+    shutdown_password_hasher()
+    await get_async_engine().dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
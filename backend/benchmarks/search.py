@@ -0,0 +1,71 @@
+"""
+Measures the latency of the team name search as the teams table grows, to
+check that the indexed search stays sub-linear in the table size.
+
+Usage (from the backend directory, with the usual settings in the environment):
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.search --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import string
+import time
+from uuid import uuid4
+
+from sqlmodel import Session, SQLModel
+
+from app.db.base import SQLModelMeta  # noqa: F401  (registers models and search DDL)
+from app.db.session import get_engine
+from app.models.team import Team
+from app.models.user import User
+from app.services.team import get_teams_query
+
+
+def random_name(length: int = 12) -> str:
+    return "".join(random.choices(string.ascii_lowercase, k=length))
+
+
+def grow(session: Session, owner: User, count: int, batch_size: int = 10000) -> None:
+    for start in range(0, count, batch_size):
+        session.add_all(
+            Team(name=random_name(), code=uuid4().hex[:6], owner_id=owner.id)
+            for _ in range(min(batch_size, count - start))
+        )
+        session.commit()
+
+
+def time_search(session: Session, owner: User, terms: list[str]) -> float:
+    started = time.perf_counter()
+    for term in terms:
+        query = get_teams_query(owner_id=owner.id, team_type="created", search=term)
+        session.exec(query.limit(10)).all()
+    return (time.perf_counter() - started) / len(terms)
+
+
+def main(args: argparse.Namespace) -> None:
+    SQLModel.metadata.create_all(get_engine())
+    terms = [random_name(4) for _ in range(args.queries)]
+
+    with Session(get_engine()) as session:
+        owner = User(
+            fullname="Bench Owner",
+            email=f"{uuid4().hex}@bench.local",
+            username=uuid4().hex,
+            hashed_password="x",
+        )
+        session.add(owner)
+        session.commit()
+
+        rows = 0
+        for size in sorted(args.sizes):
+            grow(session, owner, size - rows)
+            rows = size
+            latency = time_search(session, owner, terms)
+            print(f"{size:>10} rows  {latency * 1000:>8.2f} ms/search")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    main(parser.parse_args())
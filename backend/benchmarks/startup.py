@@ -0,0 +1,67 @@
+"""
+Per-worker boot cost: each run starts a fresh interpreter, as a new worker
+process would, and times importing `main`, building the app with
+`create_app()`, running the lifespan startup and serving the first request.
+
+Usage (from the backend directory, with the usual settings in the environment):
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.startup --workers 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from sqlmodel import SQLModel
+
+from app.db.base import SQLModelMeta  # noqa: F401  (registers every model)
+from app.db.session import get_engine
+
+WORKER = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.create_app()
+created = time.perf_counter()
+
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    ready = time.perf_counter()
+    client.get("/")
+    served = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - started,
+    "create_app": created - imported,
+    "startup": ready - created,
+    "first_request": served - ready,
+}))
+"""
+
+
+def run_worker() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", WORKER], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args: argparse.Namespace) -> None:
+    # The lifespan reads the revocations table, make sure the schema exists
+    SQLModel.metadata.create_all(get_engine())
+
+    runs = [run_worker() for _ in range(args.workers)]
+    for phase in ("import", "create_app", "startup", "first_request"):
+        samples = [run[phase] * 1000 for run in runs]
+        print(
+            f"{phase:<14} median={statistics.median(samples):7.1f}ms "
+            f"min={min(samples):7.1f}ms max={max(samples):7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,156 @@
+"""
+Measures moving tasks around a large Kanban column: fractional ranks, which
+write only the moved task, against integer positions, which shift every task
+between the old and the new place. Also reports how long ranks grow when tasks
+keep being dropped into the same gap, and how long rebalancing the column takes.
+
+Usage (from the backend directory, with the usual settings in the environment):
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.task_moves --tasks 10000 --moves 500
+"""
+
+import argparse
+import random
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, Uuid, update
+from sqlmodel import Session, SQLModel, func, select
+
+from app.core.ranking import spread_ranks
+from app.db.base import SQLModelMeta  # noqa: F401  (registers the models)
+from app.crud.task import lock_board
+from app.db.session import get_engine
+from app.models.task import Task, TaskStatus
+from app.models.team import Team
+from app.models.user import User
+from app.schemas.task import TaskPosition
+from app.services.rebalancer import RankRebalancer
+from app.services.task import _rank_for
+
+# The ordering the ranks replace: a dense integer position per task
+positions = Table(
+    "bench_task_positions",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("position", Integer, nullable=False, index=True),
+    Column("title", String, nullable=False),
+)
+
+
+def seed(session: Session, count: int) -> tuple[UUID, list[UUID]]:
+    owner = User(
+        fullname="Bench Owner",
+        email=f"{uuid4().hex}@example.com",
+        username=uuid4().hex,
+        hashed_password="x",
+    )
+    team = Team(name=f"bench-{uuid4().hex[:8]}", code=uuid4().hex[:6], owner_id=owner.id)
+    session.add_all([owner, team])
+    session.commit()
+
+    tasks = [
+        Task(
+            team_id=team.id,
+            title=f"Task {index}",
+            status=TaskStatus.TODO,
+            rank=rank,
+            created_by=owner.id,
+        )
+        for index, rank in enumerate(spread_ranks(count))
+    ]
+    session.add_all(tasks)
+    session.commit()
+
+    session.execute(positions.delete())
+    session.execute(
+        positions.insert(),
+        [{"id": task.id, "position": index, "title": task.title} for index, task in enumerate(tasks)],
+    )
+    session.commit()
+    return team.id, [task.id for task in tasks]
+
+
+def fractional_move(session: Session, team_id: UUID, task_id: UUID, after_id: UUID) -> None:
+    lock_board(session, team_id)
+    rank = _rank_for(session, team_id, TaskStatus.TODO, TaskPosition(after_id=after_id))
+    session.execute(update(Task).where(Task.id == task_id).values(rank=rank))
+    session.commit()
+
+
+def renumbering_move(session: Session, old: int, new: int) -> None:
+    # Close the gap left by the task, then open one at its new place
+    session.execute(
+        update(positions).where(positions.c.position == old).values(position=-1)
+    )
+    session.execute(
+        update(positions)
+        .where(positions.c.position > old)
+        .values(position=positions.c.position - 1)
+    )
+    session.execute(
+        update(positions)
+        .where(positions.c.position >= new)
+        .values(position=positions.c.position + 1)
+    )
+    session.execute(
+        update(positions).where(positions.c.position == -1).values(position=new)
+    )
+    session.commit()
+
+
+def bench(label: str, moves: int, call) -> None:
+    started = time.perf_counter()
+    for _ in range(moves):
+        call()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed / moves * 1000:>9.3f} ms/move")
+
+
+def main(args: argparse.Namespace) -> None:
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    positions.create(engine, checkfirst=True)
+
+    with Session(engine) as session:
+        team_id, tasks = seed(session, args.tasks)
+        print(f"{args.tasks} tasks in one column")
+
+        bench(
+            "fractional ranks",
+            args.moves,
+            lambda: fractional_move(session, team_id, *random.sample(tasks, 2)),
+        )
+        bench(
+            "integer positions",
+            args.moves,
+            lambda: renumbering_move(
+                session, random.randrange(args.tasks), random.randrange(args.tasks)
+            ),
+        )
+
+        # Worst case for the rank length: always dropping right after the same task
+        anchor = tasks[0]
+        for task_id in tasks[1 : args.same_gap + 1]:
+            fractional_move(session, team_id, task_id, anchor)
+        longest = session.exec(
+            select(func.max(func.length(Task.rank))).where(Task.team_id == team_id)
+        ).one()
+        print(f"longest rank after {args.same_gap} drops into one gap: {longest}")
+
+    rebalancer = RankRebalancer(interval=0, max_length=0)
+    started = time.perf_counter()
+    rewritten = rebalancer.rebalance(team_id, TaskStatus.TODO)
+    print(
+        f"rebalancing the column:  {(time.perf_counter() - started) * 1000:>8.1f} ms"
+        f" ({rewritten} ranks rewritten)"
+    )
+
+    positions.drop(engine)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--moves", type=int, default=500)
+    parser.add_argument("--same-gap", type=int, default=200)
+    main(parser.parse_args())
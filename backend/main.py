@@ -1,35 +1,101 @@
 ﻿"""
-This is the main module that has the App instance and its configuration
+This is the main module that has the App factory and its configuration
+
+Serve it with `uvicorn main:create_app --factory` (or `uvicorn main:app`).
 """
 
-from typing import cast
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, cast
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.types import ExceptionHandler
 
+from app.api.rate_limits import get_auth_rate_limits
 from app.api.router import router as api_router
+from app.core.email import load_templates, stop_mail_worker
 from app.core.exceptions import JSONException, json_exception_handler
+from app.core.instrumentation import RequestMetricsMiddleware
+from app.core.ratelimit import RateLimitMiddleware
+from app.core.responses import APIResponse
+from app.core.security import shutdown_password_hasher
+from app.db.session import dispose_engines
+from app.services.reaper import get_reaper
+from app.services.rebalancer import get_rank_rebalancer
+from app.services.revocation import get_revocation_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Compile the email templates before serving any request
+    load_templates()
+
+    # Periodically delete expired tokens and invitations
+    get_reaper().start()
+
+    # Load the revoked refresh tokens and keep them in sync with the other processes
+    get_revocation_store().start()
 
-app = FastAPI(title="TeamTact API", version="1.0.0")
+    # Rewrite the task ranks of the Kanban columns whose ranks grew too long
+    get_rank_rebalancer().start()
 
-app.add_exception_handler(JSONException, cast(ExceptionHandler, json_exception_handler))
+    yield
 
-# CORS settings (adjust in production)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173"],  # Change to specific domain in prod
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    get_rank_rebalancer().stop()
+    get_revocation_store().stop()
+    get_reaper().stop()
 
-# Include versioned API routes
-app.include_router(api_router, prefix="/api/v1")
+    # Flush queued emails and close the pooled SMTP connections
+    stop_mail_worker()
 
+    # Stop the bcrypt worker processes
+    shutdown_password_hasher()
 
-@app.get("/")
-def root():
+    await dispose_engines()
+
+
+def create_app() -> FastAPI:
     """
-    Sample root API
+    Builds the application.
+
+    Settings, database engines and the template environment are only created
+    when first used, so building the app needs no configuration and no I/O.
     """
-    return {"message": "🚀 TeamTact Backend is Live!"}
+    app = FastAPI(
+        title="TeamTact API",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=APIResponse,
+    )
+
+    app.add_exception_handler(JSONException, cast(ExceptionHandler, json_exception_handler))
+
+    # Throttle the authentication endpoints before any bcrypt or SMTP work happens
+    # (added before CORS so that 429 responses still carry the CORS headers)
+    app.add_middleware(RateLimitMiddleware, get_rules=get_auth_rate_limits)
+
+    # CORS settings (adjust in production)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173"],  # Change to specific domain in prod
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Outermost, so the recorded latency covers every other middleware
+    app.add_middleware(RequestMetricsMiddleware)
+
+    # Include versioned API routes
+    app.include_router(api_router, prefix="/api/v1")
+
+    @app.get("/")
+    def root():
+        """
+        Sample root API
+        """
+        return {"message": "🚀 TeamTact Backend is Live!"}
+
+    return app
+
+
+app = create_app()
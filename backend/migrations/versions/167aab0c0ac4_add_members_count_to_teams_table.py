@@ -0,0 +1,33 @@
+"""add_members_count_to_teams_table
+
+Revision ID: 167aab0c0ac4
+Revises: 9514dd2bcfac
+Create Date: 2026-10-18 08:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '167aab0c0ac4'
+down_revision: Union[str, None] = '9514dd2bcfac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('teams', sa.Column('members_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill the counter from the existing memberships
+    op.execute(
+        "UPDATE teams SET members_count = "
+        "(SELECT COUNT(*) FROM team_mates WHERE team_mates.team_id = teams.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('teams', 'members_count')
@@ -0,0 +1,64 @@
+"""add_substring_search_indexes
+
+Revision ID: a451da54f1c0
+Revises: 167aab0c0ac4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.search import sqlite_search_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a451da54f1c0'
+down_revision: Union[str, None] = '167aab0c0ac4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ('ix_teams_name_trgm', 'teams', 'name'),
+    ('ix_invitations_email_trgm', 'invitations', 'email'),
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_users_fullname_trgm', 'users', 'fullname'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+    elif dialect == 'sqlite':
+        columns = [(table, column) for _, table, column in TRIGRAM_INDEXES]
+        for statement in sqlite_search_ddl(columns):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        for name, table, _ in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name=table)
+
+    elif dialect == 'sqlite':
+        for _, table, column in TRIGRAM_INDEXES:
+            fts = f'{table}_{column}_search'
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f'DROP TRIGGER IF EXISTS {fts}_{suffix}')
+            op.execute(f'DROP TABLE IF EXISTS {fts}')
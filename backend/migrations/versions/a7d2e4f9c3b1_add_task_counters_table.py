@@ -0,0 +1,42 @@
+"""add_task_counters_table
+
+Revision ID: a7d2e4f9c3b1
+Revises: f1c3a8e6b2d4
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2e4f9c3b1'
+down_revision: Union[str, None] = 'f1c3a8e6b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_counters',
+    sa.Column('team_id', sa.Uuid(), nullable=False),
+    sa.Column('status', postgresql.ENUM('TODO', 'IN_PROGRESS', 'UAT', 'DONE', name='taskstatus', create_type=False), nullable=False),
+    sa.Column('assignee_id', sa.Uuid(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('team_id', 'status', 'assignee_id')
+    )
+    # Backfill the counters from the existing tasks
+    op.execute(
+        "INSERT INTO task_counters (team_id, status, assignee_id, count) "
+        "SELECT team_id, status, COALESCE(assignee_id, '00000000-0000-0000-0000-000000000000'), COUNT(*) "
+        "FROM tasks GROUP BY team_id, status, COALESCE(assignee_id, '00000000-0000-0000-0000-000000000000')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('task_counters')
@@ -0,0 +1,40 @@
+"""add_task_changes_table
+
+Revision ID: b3e8f1a6d5c2
+Revises: a7d2e4f9c3b1
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8f1a6d5c2'
+down_revision: Union[str, None] = 'a7d2e4f9c3b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_changes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Uuid(), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Uuid(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_task_changes_changed_at'), 'task_changes', ['changed_at'], unique=False)
+    op.create_index('ix_task_changes_team_id_seq', 'task_changes', ['team_id', 'seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_changes_team_id_seq', table_name='task_changes')
+    op.drop_index(op.f('ix_task_changes_changed_at'), table_name='task_changes')
+    op.drop_table('task_changes')
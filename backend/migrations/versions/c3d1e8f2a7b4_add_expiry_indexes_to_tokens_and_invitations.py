@@ -0,0 +1,59 @@
+"""add_expiry_indexes_to_tokens_and_invitations
+
+Revision ID: c3d1e8f2a7b4
+Revises: a451da54f1c0
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d1e8f2a7b4'
+down_revision: Union[str, None] = 'a451da54f1c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Lifetime of the existing tokens, in minutes, per purpose
+TOKEN_LIFETIMES = {
+    'RESET_PASSWORD': settings.RESET_PASSWORD_TOKEN_EXPIRY_MINUTES,
+    'EMAIL_VERIFICATION': settings.EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS * 60,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    op.add_column('token', sa.Column('expires_at', sa.DateTime(), nullable=True))
+
+    # Backfill the expiry of the existing tokens from their creation time
+    for purpose, minutes in TOKEN_LIFETIMES.items():
+        if dialect == 'postgresql':
+            expires_at = f"created_at + interval '{minutes} minutes'"
+        else:
+            expires_at = f"datetime(created_at, '+{minutes} minutes')"
+        op.execute(
+            f"UPDATE token SET expires_at = {expires_at} WHERE purpose = '{purpose}'"
+        )
+
+    with op.batch_alter_table('token') as batch_op:
+        batch_op.alter_column('expires_at', existing_type=sa.DateTime(), nullable=False)
+
+    op.create_index(op.f('ix_token_expires_at'), 'token', ['expires_at'], unique=False)
+    op.create_index(
+        op.f('ix_invitations_expiration_date'), 'invitations', ['expiration_date'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_invitations_expiration_date'), table_name='invitations')
+    op.drop_index(op.f('ix_token_expires_at'), table_name='token')
+    with op.batch_alter_table('token') as batch_op:
+        batch_op.drop_column('expires_at')
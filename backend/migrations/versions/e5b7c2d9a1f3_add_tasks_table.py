@@ -0,0 +1,49 @@
+"""add_tasks_table
+
+Revision ID: e5b7c2d9a1f3
+Revises: d8a4f0b61c52
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7c2d9a1f3'
+down_revision: Union[str, None] = 'd8a4f0b61c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tasks',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('team_id', sa.Uuid(), nullable=False),
+    sa.Column('title', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('status', sa.Enum('TODO', 'IN_PROGRESS', 'UAT', 'DONE', name='taskstatus'), nullable=False),
+    sa.Column('rank', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('assignee_id', sa.Uuid(), nullable=True),
+    sa.Column('created_by', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['assignee_id'], ['users.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tasks_assignee_id'), 'tasks', ['assignee_id'], unique=False)
+    op.create_index('ix_tasks_team_id_status_rank', 'tasks', ['team_id', 'status', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_team_id_status_rank', table_name='tasks')
+    op.drop_index(op.f('ix_tasks_assignee_id'), table_name='tasks')
+    op.drop_table('tasks')
+    sa.Enum(name='taskstatus').drop(op.get_bind(), checkfirst=True)
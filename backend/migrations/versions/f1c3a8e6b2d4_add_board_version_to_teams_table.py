@@ -0,0 +1,28 @@
+"""add_board_version_to_teams_table
+
+Revision ID: f1c3a8e6b2d4
+Revises: e5b7c2d9a1f3
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c3a8e6b2d4'
+down_revision: Union[str, None] = 'e5b7c2d9a1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('teams', sa.Column('board_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('teams', 'board_version')
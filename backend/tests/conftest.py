@@ -0,0 +1,77 @@
+import os
+
+# The settings are validated on first use, so the required ones are given
+# placeholder values before anything reads them
+for name, value in {
+    "DATABASE_URL": "sqlite://",
+    "ACCESS_TOKEN_EXPIRATION_TIME": "30",
+    "REFRESH_TOKEN_EXPIRATION_TIME": "7",
+    "JWT_SECRET_KEY": "test-secret",
+    "JWT_REFRESH_SECRET_KEY": "test-refresh-secret",
+    "JWT_ALGORITHM": "HS256",
+    "SMTP_HOST": "localhost",
+    "SMTP_PORT": "25",
+    "SMTP_USER": "noreply@example.com",
+    "SMTP_PASS": "test",
+    "FRONTEND_DOMAIN": "http://localhost:5173/",
+    "RESET_PASSWORD_TOKEN_EXPIRY_MINUTES": "60",
+    "EMAIL_VERIFICATION_TOKEN_EXPIRY_HOURS": "24",
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+from app.db.base import SQLModelMeta  # noqa: E402,F401  (registers the models)
+from app.models.team import Team, TeamMate, TeamMateRole  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        yield session
+
+
+def _make_user(session: Session, name: str) -> User:
+    user = User(
+        fullname=name.title(),
+        email=f"{name}@example.com",
+        username=name,
+        hashed_password="x",
+    )
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def owner(session):
+    return _make_user(session, "owner")
+
+
+@pytest.fixture
+def team(session, owner):
+    team = Team(name="Board", code="board1", owner_id=owner.id)
+    session.add(team)
+    session.commit()
+    return team
+
+
+@pytest.fixture
+def member(session, team):
+    user = _make_user(session, "member")
+    session.add(TeamMate(team_id=team.id, user_id=user.id, role=TeamMateRole.VIEWER))
+    session.commit()
+    return user
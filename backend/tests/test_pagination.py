@@ -0,0 +1,114 @@
+"""
+Every page of a list, whichever way it is reached, runs the same fixed number
+of queries: the page itself, the batch load of its relationships and the COUNT.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.core.helpers import Paginator
+from app.models.team import Team, TeamMate, TeamMateRole
+from app.models.user import User
+from app.schemas.team import TeamResponse
+from app.schemas.team_member import TeamMateResponse
+from app.services.team import get_teams_query
+from app.services.team_member import get_team_members_query
+
+ROWS = 25
+PAGE_SIZE = 10
+
+
+def _user(index: int) -> User:
+    return User(
+        fullname=f"User {index}",
+        email=f"user{index}@example.com",
+        username=f"user{index}",
+        hashed_password="x",
+    )
+
+
+@pytest.fixture
+def board(session):
+    owner = _user(0)
+    started = datetime.utcnow()
+    teams = [
+        Team(
+            name=f"Team {index}",
+            code=uuid4().hex[:6],
+            owner_id=owner.id,
+            created_at=started + timedelta(seconds=index),
+        )
+        for index in range(ROWS)
+    ]
+    users = [_user(index) for index in range(1, ROWS + 1)]
+    members = [
+        TeamMate(
+            team_id=teams[0].id,
+            user_id=user.id,
+            role=TeamMateRole.VIEWER,
+            joined_at=started + timedelta(seconds=index),
+        )
+        for index, user in enumerate(users)
+    ]
+    session.add_all([owner, *teams, *users])
+    session.flush()
+    session.add_all(members)
+    session.commit()
+    return owner.id, teams[0].id
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _lists(owner_id, team_id):
+    return {
+        "teams": (
+            get_teams_query(owner_id=owner_id, team_type="created"),
+            (Team.created_at, Team.id),
+            TeamResponse,
+        ),
+        "members": (
+            get_team_members_query(team_id=team_id),
+            (TeamMate.joined_at, TeamMate.id),
+            TeamMateResponse,
+        ),
+    }
+
+
+@pytest.mark.parametrize("name, queries", [("teams", 2), ("members", 3)])
+def test_pages_run_a_fixed_number_of_queries(session, board, statements, name, queries):
+    query, order_by, schema = _lists(*board)[name]
+
+    def paginate(**kwargs):
+        # A fresh session each time, so no page is served from the identity map
+        session.expunge_all()
+        statements.clear()
+        page = Paginator(
+            session=session,
+            query=query,
+            order_by=order_by,
+            page_size=PAGE_SIZE,
+            schema=schema,
+            **kwargs,
+        ).paginate()
+        return page, len(statements)
+
+    first, first_count = paginate(page=1)
+    later, later_count = paginate(page=3)
+    cursored, cursor_count = paginate(cursor=first.next_cursor)
+
+    assert (len(first.items), len(later.items), len(cursored.items)) == (10, 5, 10)
+    assert cursored.items[0].id != first.items[-1].id
+    assert first_count == later_count == cursor_count == queries
@@ -0,0 +1,98 @@
+import random
+from bisect import bisect_left
+
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, select
+
+from app.core.ranking import DIGITS, FIRST_RANK, rank_between, spread_ranks, validate_rank
+
+
+def _insert(ranks, index):
+    lower = ranks[index - 1] if index else None
+    upper = ranks[index] if index < len(ranks) else None
+    rank = rank_between(lower, upper)
+    validate_rank(rank)
+    assert (lower is None or lower < rank) and (upper is None or rank < upper)
+    ranks.insert(index, rank)
+    return rank
+
+
+def test_the_first_rank_of_an_empty_list():
+    assert rank_between(None, None) == FIRST_RANK
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_inserts_keep_the_list_ordered(seed):
+    generator = random.Random(seed)
+    ranks = []
+    for _ in range(2000):
+        _insert(ranks, generator.randint(0, len(ranks)))
+    assert ranks == sorted(set(ranks))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_moves_keep_the_list_ordered(seed):
+    generator = random.Random(seed)
+    ranks = spread_ranks(50)
+    for _ in range(2000):
+        ranks.pop(generator.randrange(len(ranks)))
+        _insert(ranks, generator.randint(0, len(ranks)))
+    assert ranks == sorted(set(ranks))
+
+
+def test_adding_at_either_end_keeps_ranks_short():
+    ranks = [FIRST_RANK]
+    for _ in range(5000):
+        _insert(ranks, 0)
+        _insert(ranks, len(ranks))
+    assert max(len(rank) for rank in ranks) <= 4
+
+
+def test_inserting_into_one_gap_grows_ranks_slowly():
+    lower, upper = spread_ranks(2)
+    ranks = [lower, upper]
+    for _ in range(500):
+        _insert(ranks, 1)
+    # Each insert halves the gap, so a digit is added every log2(36) inserts
+    assert max(len(rank) for rank in ranks) <= 2 + 500 // 5
+    for _ in range(500):
+        _insert(ranks, bisect_left(ranks, upper))
+    assert ranks == sorted(set(ranks))
+
+
+def test_spread_ranks_are_short_and_increasing():
+    ranks = spread_ranks(10000)
+    assert ranks == sorted(set(ranks))
+    assert max(len(rank) for rank in ranks) <= 4
+    for rank in ranks[::997]:
+        validate_rank(rank)
+
+
+@pytest.mark.parametrize(
+    "lower, upper",
+    [
+        ("i1", "i1"),
+        ("i2", "i1"),
+        ("i1", "I2"),
+        ("i10", None),
+        ("", None),
+        (None, DIGITS[0] * (len(DIGITS) // 2 + 1)),
+    ],
+)
+def test_invalid_bounds_are_rejected(lower, upper):
+    with pytest.raises(ValueError):
+        rank_between(lower, upper)
+
+
+def test_the_database_orders_ranks_like_python(engine):
+    generator = random.Random(0)
+    ranks = []
+    for _ in range(500):
+        _insert(ranks, generator.randint(0, len(ranks)))
+
+    table = Table("ranks", MetaData(), Column("rank", String, primary_key=True))
+    table.create(engine)
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [{"rank": rank} for rank in generator.sample(ranks, len(ranks))])
+        ordered = conn.execute(select(table.c.rank).order_by(table.c.rank)).scalars().all()
+    assert ordered == ranks
@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from app.core import hashing, security
+from app.core.config import settings
+
+
+def test_async_hashing_without_a_pool_leaves_the_event_loop(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASHER_WORKERS", 0)
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    threads = []
+
+    def record(fn):
+        def wrapper(*args):
+            threads.append(threading.get_ident())
+            return fn(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(hashing, "hash_password", record(hashing.hash_password))
+    monkeypatch.setattr(
+        hashing, "verify_and_update_password", record(hashing.verify_and_update_password)
+    )
+
+    async def hash_and_verify():
+        hashed = await security.hash_password_async("password")
+        return await security.verify_and_update_password_async("password", hashed)
+
+    assert asyncio.run(hash_and_verify()) == (True, None)
+    assert len(threads) == 2 and threading.get_ident() not in threads
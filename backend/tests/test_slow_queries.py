@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db.slow_queries import SlowQueryLog
+
+
+def _log(engine, samples):
+    log = SlowQueryLog(threshold=0, samples=samples, max_fingerprints=10, analyze=False)
+    log.watch(engine)
+    with engine.connect() as conn:
+        for value in (1, 2, 3):
+            conn.execute(text("SELECT :value"), {"value": value})
+    return log.snapshot()["queries"]
+
+
+def test_slow_queries_keep_the_slowest_samples(engine):
+    (query,) = _log(engine, samples=2)
+    assert query["fingerprint"] == "SELECT ?"
+    assert query["count"] == 3
+    assert len(query["samples"]) == 2 and query["samples"][0]["plan"] is not None
+
+
+def test_slow_queries_without_samples_are_only_counted(engine):
+    (query,) = _log(engine, samples=0)
+    assert query["count"] == 3 and query["samples"] == []
+
+
+def test_failed_statements_leave_nothing_on_the_connection(engine):
+    log = SlowQueryLog(threshold=0, samples=1, max_fingerprints=10, analyze=False)
+    log.watch(engine)
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM no_such_table"))
+        conn.rollback()
+        conn.execute(text("SELECT 1"))
+        assert conn.info == {}
+    assert [query["count"] for query in log.snapshot()["queries"]] == [1]
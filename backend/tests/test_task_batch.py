@@ -0,0 +1,116 @@
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.exceptions import JSONException
+from app.crud.task import select_tasks_by_team
+from app.crud.task_counter import read_actual_counts, read_stored_counts
+from app.models.task import Task, TaskStatus
+from app.models.team import Team
+from app.schemas.task import (
+    TaskBatchAssign,
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchMove,
+    TaskCreateRequest,
+)
+from app.services.task import add_task
+from app.services.task_batch import apply_task_batch
+
+
+@pytest.fixture
+def tasks(session, team, owner):
+    return {
+        title: add_task(session, team.id, owner.id, TaskCreateRequest(title=title)).id
+        for title in "ABC"
+    }
+
+
+def _board(session, team_id):
+    session.expire_all()
+    return {
+        status: [task.title for task in session.exec(select_tasks_by_team(team_id, status=status))]
+        for status in TaskStatus
+    }
+
+
+def _version(session, team_id):
+    return session.exec(select(Team.board_version).where(Team.id == team_id)).one()
+
+
+def test_a_batch_is_played_in_order_and_written_at_once(session, team, owner, member, tasks):
+    version = _version(session, team.id)
+    response = apply_task_batch(
+        session,
+        team.id,
+        owner.id,
+        [
+            TaskBatchCreate(op="create", title="D", before_id=tasks["A"]),
+            TaskBatchMove(op="move", task_id=tasks["A"], status=TaskStatus.DONE),
+            TaskBatchAssign(op="assign", task_id=tasks["B"], assignee_id=member.id),
+            TaskBatchMove(op="move", task_id=tasks["C"], status=TaskStatus.TODO, before_id=tasks["B"]),
+            TaskBatchDelete(op="delete", task_id=tasks["B"]),
+        ],
+    )
+
+    assert [result.success for result in response.results] == [True] * 5
+    assert response.version == _version(session, team.id) == version + 1
+    assert _board(session, team.id) == {
+        TaskStatus.TODO: ["D", "C"],
+        TaskStatus.IN_PROGRESS: [],
+        TaskStatus.UAT: [],
+        TaskStatus.DONE: ["A"],
+    }
+    assert read_stored_counts(session, team.id) == read_actual_counts(session, team.id)
+
+
+def test_failed_operations_are_skipped(session, team, owner, tasks):
+    response = apply_task_batch(
+        session,
+        team.id,
+        owner.id,
+        [
+            TaskBatchDelete(op="delete", task_id=tasks["B"]),
+            TaskBatchMove(op="move", task_id=tasks["A"], status=TaskStatus.TODO, after_id=tasks["B"]),
+            TaskBatchAssign(op="assign", task_id=tasks["A"], assignee_id=uuid4()),
+            TaskBatchMove(op="move", task_id=tasks["A"], status=TaskStatus.TODO, after_id=tasks["A"]),
+            TaskBatchDelete(op="delete", task_id=tasks["B"]),
+            TaskBatchMove(op="move", task_id=tasks["A"], status=TaskStatus.TODO, after_id=tasks["C"]),
+        ],
+    )
+
+    assert [(result.success, result.reason) for result in response.results] == [
+        (True, ""),
+        (False, "The task to place after is not in this column"),
+        (False, "The assignee is not a member of this team"),
+        (False, "A task cannot be placed next to itself"),
+        (False, "Task not found"),
+        (True, ""),
+    ]
+    assert _board(session, team.id)[TaskStatus.TODO] == ["C", "A"]
+    assert session.exec(select(Task.assignee_id).where(Task.id == tasks["A"])).one() is None
+
+
+def test_a_batch_without_changes_keeps_the_version(session, team, owner, tasks):
+    version = _version(session, team.id)
+    response = apply_task_batch(
+        session, team.id, owner.id, [TaskBatchDelete(op="delete", task_id=uuid4())]
+    )
+    assert not response.results[0].success
+    assert response.version == _version(session, team.id) == version
+
+
+def test_batches_are_limited_in_size(session, team, owner, tasks, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_BATCH_MAX_OPERATIONS", 1)
+    operations = [TaskBatchDelete(op="delete", task_id=task_id) for task_id in tasks.values()]
+    with pytest.raises(JSONException) as error:
+        apply_task_batch(session, team.id, owner.id, operations)
+    assert error.value.status_code == 400
+
+
+def test_batches_need_access_to_the_team(session, team, tasks):
+    with pytest.raises(JSONException) as error:
+        apply_task_batch(session, team.id, uuid4(), [TaskBatchDelete(op="delete", task_id=tasks["A"])])
+    assert error.value.status_code == 404
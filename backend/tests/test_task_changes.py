@@ -0,0 +1,115 @@
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine, func, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import JSONException
+from app.crud.task import delete_expired_task_changes, select_oldest_change
+from app.models.task import TaskChange, TaskStatus
+from app.schemas.task import TaskCreateRequest, TaskMoveRequest
+from app.services.task import add_task, get_board_changes, move_task, remove_task
+
+
+@pytest.fixture
+def database(tmp_path):
+    return tmp_path / "board.db"
+
+
+@pytest.fixture
+def engine(database):
+    # A database file, which the async engine of the feed can open as well
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _log(session, team_id, sizes, changed_at):
+    # Newest version first, so that insertion order is not the version order
+    for seq, size in sorted(sizes.items(), reverse=True):
+        session.add_all(
+            TaskChange(team_id=team_id, seq=seq, task_id=uuid4(), changed_at=changed_at)
+            for _ in range(size)
+        )
+    session.commit()
+
+
+def test_expired_versions_are_pruned_oldest_first_and_whole(session, team):
+    now = datetime.utcnow()
+    expired = now - timedelta(days=settings.TASK_CHANGE_RETENTION_DAYS + 1)
+    _log(session, team.id, {1: 3, 2: 1, 3: 2, 4: 1}, expired)
+    _log(session, team.id, {5: 1}, now)
+
+    # The limit ends inside version 1, which is still deleted whole
+    assert delete_expired_task_changes(session, now, limit=2) == 3
+    assert session.exec(select_oldest_change(team.id)).one() == 2
+
+    assert delete_expired_task_changes(session, now, limit=2) == 3
+    assert delete_expired_task_changes(session, now, limit=2) == 1
+    assert session.exec(select_oldest_change(team.id)).one() == 5
+    assert session.exec(select(func.count()).select_from(TaskChange)).one() == 1
+
+
+def _changes(database, team_id, user_id, since):
+    async def read():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        try:
+            async with AsyncSession(engine) as async_session:
+                return await get_board_changes(async_session, team_id, user_id, since)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(read())
+
+
+def test_the_feed_returns_the_current_state_of_changed_tasks(database, session, team, owner):
+    kept = add_task(session, team.id, owner.id, TaskCreateRequest(title="Kept")).id
+    moved = add_task(session, team.id, owner.id, TaskCreateRequest(title="Moved")).id
+    dropped = add_task(session, team.id, owner.id, TaskCreateRequest(title="Dropped")).id
+    since = _changes(database, team.id, owner.id, 0).version
+
+    move_task(session, team.id, moved, owner.id, TaskMoveRequest(status=TaskStatus.DONE))
+    move_task(session, team.id, moved, owner.id, TaskMoveRequest(status=TaskStatus.UAT))
+    remove_task(session, team.id, dropped, owner.id)
+    added = add_task(session, team.id, owner.id, TaskCreateRequest(title="Added")).id
+
+    feed = _changes(database, team.id, owner.id, since)
+    assert feed.version == since + 4
+    changes = {change.task_id: change for change in feed.changes}
+    assert changes.keys() == {moved, dropped, added} and kept not in changes
+    assert changes[moved].task.status == TaskStatus.UAT and not changes[moved].deleted
+    assert changes[dropped].deleted and changes[dropped].task is None
+    assert changes[added].task.title == "Added"
+
+    assert _changes(database, team.id, owner.id, feed.version).changes == []
+    with pytest.raises(JSONException) as error:
+        _changes(database, team.id, owner.id, feed.version + 1)
+    assert error.value.status_code == 400
+
+
+def test_the_feed_is_gone_once_its_versions_are_pruned(database, session, team, owner):
+    task_id = add_task(session, team.id, owner.id, TaskCreateRequest(title="Task")).id
+    for status in (TaskStatus.IN_PROGRESS, TaskStatus.UAT, TaskStatus.DONE):
+        move_task(session, team.id, task_id, owner.id, TaskMoveRequest(status=status))
+
+    # Versions 1 and 2 expire
+    now = datetime.utcnow()
+    expired = now - timedelta(days=settings.TASK_CHANGE_RETENTION_DAYS + 1)
+    session.exec(
+        update(TaskChange)
+        .where(TaskChange.team_id == team.id, TaskChange.seq <= 2)
+        .values(changed_at=expired)
+    )
+    session.commit()
+    delete_expired_task_changes(session, now, limit=10)
+
+    assert [change.task_id for change in _changes(database, team.id, owner.id, 2).changes] == [task_id]
+    for since in (0, 1):
+        with pytest.raises(JSONException) as error:
+            _changes(database, team.id, owner.id, since)
+        assert error.value.status_code == 410
@@ -0,0 +1,115 @@
+"""
+The task counters stay equal to the counts of the tasks themselves through
+every kind of task write.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine, delete, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.task_counter import read_actual_counts, read_stored_counts
+from app.models.task import UNASSIGNED, Task, TaskStatus
+from app.models.team import TeamMate
+from app.models.user import User
+from app.schemas.task import (
+    TaskBatchAssign,
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchMove,
+    TaskCreateRequest,
+    TaskMoveRequest,
+    TaskUpdateRequest,
+)
+from app.services.task import add_task, edit_task, move_task, remove_task
+from app.services.task_batch import apply_task_batch
+from app.services.task_stats import get_task_stats
+
+
+@pytest.fixture
+def database(tmp_path):
+    return tmp_path / "board.db"
+
+
+@pytest.fixture
+def engine(database):
+    # A database file, which the async engine of the stats can open as well
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def assert_counters_match(session, team_id):
+    assert read_stored_counts(session, team_id) == read_actual_counts(session, team_id)
+
+
+def test_single_task_writes_keep_the_counters(session, team, owner, member):
+    team_id, user_id = team.id, owner.id
+    first = add_task(session, team_id, user_id, TaskCreateRequest(title="First")).id
+    second = add_task(
+        session, team_id, user_id, TaskCreateRequest(title="Second", assignee_id=member.id)
+    ).id
+    assert_counters_match(session, team_id)
+
+    move_task(session, team_id, first, user_id, TaskMoveRequest(status=TaskStatus.IN_PROGRESS))
+    assert_counters_match(session, team_id)
+
+    edit_task(session, team_id, first, user_id, TaskUpdateRequest(assignee_id=member.id))
+    edit_task(session, team_id, second, user_id, TaskUpdateRequest(assignee_id=None))
+    assert_counters_match(session, team_id)
+
+    move_task(
+        session, team_id, second, user_id, TaskMoveRequest(status=TaskStatus.IN_PROGRESS, before_id=first)
+    )
+    remove_task(session, team_id, first, user_id)
+    assert_counters_match(session, team_id)
+    assert read_stored_counts(session, team_id) == {
+        (team_id, TaskStatus.IN_PROGRESS, UNASSIGNED): 1
+    }
+
+
+def test_batches_keep_the_counters(session, team, owner, member):
+    team_id, user_id = team.id, owner.id
+    kept = add_task(session, team_id, user_id, TaskCreateRequest(title="Kept")).id
+    dropped = add_task(session, team_id, user_id, TaskCreateRequest(title="Dropped")).id
+
+    response = apply_task_batch(
+        session,
+        team_id,
+        user_id,
+        [
+            TaskBatchCreate(op="create", title="New", assignee_id=member.id),
+            TaskBatchMove(op="move", task_id=kept, status=TaskStatus.DONE),
+            TaskBatchAssign(op="assign", task_id=kept, assignee_id=member.id),
+            TaskBatchDelete(op="delete", task_id=dropped),
+        ],
+    )
+    assert all(result.success for result in response.results)
+    assert_counters_match(session, team_id)
+
+
+def test_stats_count_the_tasks_of_a_deleted_user_as_unassigned(
+    database, session, team, owner, member
+):
+    team_id, user_id, member_id = team.id, owner.id, member.id
+    add_task(session, team_id, user_id, TaskCreateRequest(title="Task", assignee_id=member_id))
+    # What ON DELETE SET NULL does on Postgres: the counters are not told
+    session.exec(update(Task).where(Task.assignee_id == member_id).values(assignee_id=None))
+    session.exec(delete(TeamMate).where(TeamMate.user_id == member_id))
+    session.exec(delete(User).where(User.id == member_id))
+    session.commit()
+
+    async def read_stats():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        try:
+            async with AsyncSession(engine) as async_session:
+                return await get_task_stats(async_session, team_id, user_id)
+        finally:
+            await engine.dispose()
+
+    stats = asyncio.run(read_stats())
+    assert stats.assignees == []
+    assert stats.unassigned.total == stats.tasks.total == 1
@@ -0,0 +1,53 @@
+"""
+Two writers of one board are serialized by the board lock, so the second one
+reads the state the first one left, on SQLite as well as on Postgres.
+"""
+
+import threading
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.crud.task import lock_board
+from app.crud.task_counter import read_actual_counts, read_stored_counts
+from app.models.task import UNASSIGNED, TaskStatus
+from app.schemas.task import TaskCreateRequest, TaskMoveRequest
+from app.services.task import add_task, move_task
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A database file, so that each session gets a connection of its own
+    engine = create_engine(f"sqlite:///{tmp_path / 'board.db'}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_a_locked_board_blocks_other_writers(engine, session, team, owner):
+    team_id, user_id = team.id, owner.id
+    task_id = add_task(session, team_id, user_id, TaskCreateRequest(title="Task")).id
+
+    errors = []
+
+    def move_to_uat():
+        with Session(engine) as other:
+            try:
+                move_task(other, team_id, task_id, user_id, TaskMoveRequest(status=TaskStatus.UAT))
+            except Exception as e:
+                errors.append(e)
+
+    lock_board(session, team_id)
+    writer = threading.Thread(target=move_to_uat)
+    writer.start()
+    writer.join(timeout=0.5)
+    assert writer.is_alive(), "the second writer did not wait for the board lock"
+
+    # Committing releases the lock: the second move then starts from DONE
+    move_task(session, team_id, task_id, user_id, TaskMoveRequest(status=TaskStatus.DONE))
+    writer.join(timeout=10)
+    assert not writer.is_alive() and not errors
+
+    expected = {(team_id, TaskStatus.UAT, UNASSIGNED): 1}
+    assert read_actual_counts(session, team_id) == expected
+    assert read_stored_counts(session, team_id) == expected
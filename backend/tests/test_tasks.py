@@ -0,0 +1,102 @@
+import pytest
+from sqlmodel import select
+
+from app.core.exceptions import JSONException
+from app.crud.task import select_tasks_by_team
+from app.crud.task_counter import read_actual_counts, read_stored_counts
+from app.models.task import Task, TaskStatus
+from app.models.team import Team
+from app.schemas.task import TaskCreateRequest, TaskMoveRequest
+from app.services import rebalancer as rebalancer_module
+from app.services import task as task_module
+from app.services.rebalancer import RankRebalancer
+from app.services.task import add_task, move_task
+
+
+def _column(session, team_id, status=TaskStatus.TODO):
+    session.expire_all()
+    return [task.title for task in session.exec(select_tasks_by_team(team_id, status=status))]
+
+
+@pytest.fixture
+def tasks(session, team, owner):
+    created = {
+        title: add_task(session, team.id, owner.id, TaskCreateRequest(title=title)).id
+        for title in "ABC"
+    }
+    assert _column(session, team.id) == ["A", "B", "C"]
+    return created
+
+
+def _move(session, team, owner, task_id, **position):
+    position.setdefault("status", TaskStatus.TODO)
+    return move_task(session, team.id, task_id, owner.id, TaskMoveRequest(**position))
+
+
+def test_new_tasks_are_placed_where_asked(session, team, owner, tasks):
+    add_task(session, team.id, owner.id, TaskCreateRequest(title="D", before_id=tasks["A"]))
+    add_task(session, team.id, owner.id, TaskCreateRequest(title="E", after_id=tasks["B"]))
+    assert _column(session, team.id) == ["D", "A", "B", "E", "C"]
+
+
+def test_moves_place_tasks_between_their_neighbours(session, team, owner, tasks):
+    _move(session, team, owner, tasks["C"], after_id=tasks["A"])
+    assert _column(session, team.id) == ["A", "C", "B"]
+
+    _move(session, team, owner, tasks["A"], before_id=tasks["B"])
+    assert _column(session, team.id) == ["C", "A", "B"]
+
+    _move(session, team, owner, tasks["C"])
+    assert _column(session, team.id) == ["A", "B", "C"]
+
+
+def test_moves_between_columns(session, team, owner, tasks):
+    _move(session, team, owner, tasks["B"], status=TaskStatus.DONE)
+    _move(session, team, owner, tasks["A"], status=TaskStatus.DONE, before_id=tasks["B"])
+    assert _column(session, team.id) == ["C"]
+    assert _column(session, team.id, TaskStatus.DONE) == ["A", "B"]
+    assert read_stored_counts(session, team.id) == read_actual_counts(session, team.id)
+
+
+@pytest.mark.parametrize(
+    "position, message",
+    [
+        ({"after_id": "C"}, "A task cannot be placed next to itself"),
+        ({"status": TaskStatus.DONE, "after_id": "A"}, "The task to place after is not in this column"),
+        ({"status": TaskStatus.DONE, "before_id": "A"}, "The task to place before is not in this column"),
+    ],
+)
+def test_invalid_moves_are_rejected(session, team, owner, tasks, position, message):
+    position = {
+        key: tasks[value] if key.endswith("_id") else value for key, value in position.items()
+    }
+    with pytest.raises(JSONException) as error:
+        _move(session, team, owner, tasks["C"], **position)
+    assert (error.value.status_code, error.value.message) == (400, message)
+    session.rollback()
+    assert _column(session, team.id) == ["A", "B", "C"]
+
+
+def test_the_rebalancer_shortens_the_ranks_of_flagged_columns(
+    engine, session, team, owner, tasks, monkeypatch
+):
+    rebalancer = RankRebalancer(interval=0, max_length=4)
+    monkeypatch.setattr(task_module, "get_rank_rebalancer", lambda: rebalancer)
+    monkeypatch.setattr(rebalancer_module, "get_engine", lambda: engine)
+
+    # Dropping tasks right after A keeps halving the same gap
+    for index in range(20):
+        task = add_task(
+            session, team.id, owner.id, TaskCreateRequest(title=f"D{index}", after_id=tasks["A"])
+        )
+    assert len(task.rank) > rebalancer.max_length
+    order = _column(session, team.id)
+    version = session.exec(select(Team.board_version).where(Team.id == team.id)).one()
+
+    # All but A, which keeps the first rank
+    assert rebalancer.run_once() == {"columns": 1, "rewritten": 22}
+    assert _column(session, team.id) == order
+    ranks = session.exec(select(Task.rank).where(Task.team_id == team.id)).all()
+    assert max(len(rank) for rank in ranks) <= rebalancer.max_length
+    assert session.exec(select(Team.board_version).where(Team.id == team.id)).one() == version + 1
+    assert rebalancer.run_once() == {"columns": 0, "rewritten": 0}